@@ -17,6 +17,9 @@ from controllers.news_controller import news_bp
 from controllers.shop_controller import shop_bp
 from controllers.admin_controller import admin_bp
 from controllers.language_controller import language_bp
+from services.translation_jobs import get_translation_job_runner
+from services.email_service import get_email_service
+from services.digest_scheduler import get_digest_scheduler
 
 def create_app(config_name='default'):
     app = Flask(__name__)
@@ -30,6 +33,19 @@ def create_app(config_name='default'):
     app.register_blueprint(shop_bp, url_prefix='/shop')
     app.register_blueprint(admin_bp, url_prefix='/admin')
     app.register_blueprint(language_bp, url_prefix='/lang')
+
+    #for resuming translation jobs left by a previous run
+    translation_jobs = get_translation_job_runner()
+    if translation_jobs.is_available():
+        translation_jobs.start()
+
+    #for resuming emails queued before a restart
+    email_service = get_email_service()
+    if email_service.is_enabled and email_service.outbox is not None:
+        email_service.outbox.start()
+
+    #for sending hourly/daily news digests
+    get_digest_scheduler().start()
     
     #for language detection
     @app.before_request
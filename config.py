@@ -7,6 +7,27 @@ Environment Variables:
 - SECRET_KEY: Flask secret key
 - ADMIN_USERNAME: Admin panel username
 - ADMIN_PASSWORD: Admin panel password
+- STORAGE_BACKEND: Repository storage, 'json' (default) or 'sqlite'
+- TRANSLATION_CACHE_MAX_ENTRIES: Cached machine translations kept (default 10000)
+- TRANSLATOR_BACKEND: 'google' (default, deep-translator) or 'fake' (offline)
+- FAKE_TRANSLATOR_LATENCY: Seconds the fake translator sleeps per call (default 0)
+- TRANSLATION_TIMEOUT: Seconds to wait for translations of one item (default 10)
+- TRANSLATION_JOB_RETENTION_DAYS: Days finished translation jobs are kept (default 7)
+- EMAIL_ASYNC: Queue emails and send them from background workers (default 1)
+- EMAIL_WORKERS: Email delivery worker threads (default 4)
+- EMAIL_MAX_ATTEMPTS: Delivery attempts per email (default 3)
+- EMAIL_RETRY_DELAY: Seconds before the first retry, doubled afterwards (default 2)
+- EMAIL_OUTBOX_RETENTION_DAYS: Days sent/failed emails are kept in the outbox (default 30)
+- NOTIFY_WORKERS: Threads notifying news subscribers, 0 notifies in the publishing request (default 4)
+- NOTIFY_QUEUE_SIZE: Pending notifications per thread before publishing blocks (default 1000)
+- NOTIFY_MAX_PENDING_EVENTS: Published events waiting for fan-out before publishing blocks (default 100)
+- DIGEST_CHECK_INTERVAL: Seconds between checks for due news digests (default 60)
+- DIGEST_DAILY_HOUR: Local hour when daily news digests are sent (default 9)
+- NOTIFICATION_HISTORY_SIZE: Notifications kept in memory per subscriber (default 20)
+- NOTIFICATION_SPILL_DIR: Directory for older notifications pushed out of memory, empty drops them (default empty)
+- SMTP_POOL_SIZE: Open SMTP sessions (default: EMAIL_WORKERS)
+- SMTP_MAX_MESSAGES_PER_CONNECTION: Messages sent per SMTP session (default 100)
+- SMTP_IDLE_TIMEOUT: Seconds an unused SMTP session is kept open (default 60)
 """
 import os
 
@@ -18,6 +39,43 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'change-this-in-production')
     DEBUG = False
     DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+    # Repository storage: 'json' (data/*.json) or 'sqlite' (data/sdu.sqlite3)
+    STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'json').lower()
+
+    # Translation memo cache (table in data/sdu.sqlite3), least recently used evicted
+    TRANSLATION_CACHE_MAX_ENTRIES = int(os.environ.get('TRANSLATION_CACHE_MAX_ENTRIES', 10000))
+
+    # Translator: 'google' (deep-translator) or 'fake' (offline, "[lang] text")
+    TRANSLATOR_BACKEND = os.environ.get('TRANSLATOR_BACKEND', 'google').lower()
+    FAKE_TRANSLATOR_LATENCY = float(os.environ.get('FAKE_TRANSLATOR_LATENCY', 0))
+    # Concurrent translation calls and time budget per news/product
+    TRANSLATION_WORKERS = int(os.environ.get('TRANSLATION_WORKERS', 8))
+    TRANSLATION_TIMEOUT = float(os.environ.get('TRANSLATION_TIMEOUT', 10))
+    # Done/failed translation jobs are purged after this, superseded ones right away
+    TRANSLATION_JOB_RETENTION_DAYS = float(os.environ.get('TRANSLATION_JOB_RETENTION_DAYS', 7))
+
+    # Email outbox: delivery workers and retries with exponential backoff
+    EMAIL_ASYNC = os.environ.get('EMAIL_ASYNC', '1').lower() not in ('0', 'false', 'no')
+    EMAIL_WORKERS = int(os.environ.get('EMAIL_WORKERS', 4))
+    EMAIL_MAX_ATTEMPTS = int(os.environ.get('EMAIL_MAX_ATTEMPTS', 3))
+    EMAIL_RETRY_DELAY = float(os.environ.get('EMAIL_RETRY_DELAY', 2))
+    # Queued emails live in data/sdu.sqlite3; idempotency keys are kept as long as the rows
+    EMAIL_OUTBOX_RETENTION_DAYS = float(os.environ.get('EMAIL_OUTBOX_RETENTION_DAYS', 30))
+    # News subscribers are notified in the background, in order per subscriber
+    NOTIFY_WORKERS = int(os.environ.get('NOTIFY_WORKERS', 4))
+    NOTIFY_QUEUE_SIZE = int(os.environ.get('NOTIFY_QUEUE_SIZE', 1000))
+    NOTIFY_MAX_PENDING_EVENTS = int(os.environ.get('NOTIFY_MAX_PENDING_EVENTS', 100))
+    # Hourly/daily news digests of subscribers who chose them
+    DIGEST_CHECK_INTERVAL = float(os.environ.get('DIGEST_CHECK_INTERVAL', 60))
+    DIGEST_DAILY_HOUR = int(os.environ.get('DIGEST_DAILY_HOUR', 9))
+    # Per-subscriber notification history (ring buffer, optional spill to disk)
+    NOTIFICATION_HISTORY_SIZE = int(os.environ.get('NOTIFICATION_HISTORY_SIZE', 20))
+    NOTIFICATION_SPILL_DIR = os.environ.get('NOTIFICATION_SPILL_DIR', '')
+    # Pooled SMTP sessions, reopened after max messages or when idle too long
+    SMTP_POOL_SIZE = int(os.environ.get('SMTP_POOL_SIZE', 0))
+    SMTP_MAX_MESSAGES_PER_CONNECTION = int(os.environ.get('SMTP_MAX_MESSAGES_PER_CONNECTION', 100))
+    SMTP_IDLE_TIMEOUT = float(os.environ.get('SMTP_IDLE_TIMEOUT', 60))
     
     # Admin Panel (set in environment variables for production)
     ADMIN_USERNAME = os.environ.get('ADMIN_USERNAME', 'admin')
@@ -10,6 +10,8 @@ from facade.sdu_facade import SDUFacade
 from services.teacher_service import TeacherService
 from services.news_service import NewsService
 from services.shop_service import ShopService
+from services.translation_jobs import get_translation_job_runner
+from services.digest_scheduler import FREQUENCIES
 from repository.subscriber_repository import SubscriberRepository
 
 admin_bp = Blueprint('admin', __name__)
@@ -193,7 +195,8 @@ def news():
     all_news = service._news_repo.get_all()
     # Sort by date - newest first
     all_news = sorted(all_news, key=lambda n: n.created_at, reverse=True)
-    return render_template('admin/news.html', news=all_news)
+    translation_jobs = get_translation_job_runner().get_status('news')
+    return render_template('admin/news.html', news=all_news, translation_jobs=translation_jobs)
 
 
 @admin_bp.route('/news/add', methods=['GET', 'POST'])
@@ -234,7 +237,8 @@ def add_news():
 def edit_news(news_id):
     """Editing news."""
     service = NewsService()
-    news_item = service.get_news_by_id(news_id)
+    # Read from the repository: opening the form is not a view
+    news_item = service._news_repo.get_by_id(news_id)
 
     if not news_item:
         flash('News not found', 'error')
@@ -288,6 +292,20 @@ def delete_news(news_id):
     return redirect(url_for('admin.news'))
 
 
+@admin_bp.route('/translations/retry/<job_id>', methods=['POST'])
+@login_required
+def retry_translation(job_id):
+    """Requeuing a failed translation job."""
+    job = get_translation_job_runner().retry(job_id)
+    if job:
+        flash('Translation queued', 'success')
+    else:
+        flash('Translation job not found', 'error')
+    if job and job.entity_type == 'product':
+        return redirect(url_for('admin.products'))
+    return redirect(url_for('admin.news'))
+
+
 @admin_bp.route('/orders')
 @login_required
 def orders():
@@ -322,7 +340,8 @@ def products():
     """Product Management."""
     service = ShopService()
     all_products = service._product_repo.get_all()
-    return render_template('admin/products.html', products=all_products)
+    translation_jobs = get_translation_job_runner().get_status('product')
+    return render_template('admin/products.html', products=all_products, translation_jobs=translation_jobs)
 
 
 @admin_bp.route('/products/add', methods=['GET', 'POST'])
@@ -452,6 +471,9 @@ def toggle_subscriber(subscriber_id):
         else:
             repo.activate(subscriber_id)
             flash('Subscriber activated', 'success')
+        # Update observer in NewsService
+        from facade.sdu_facade import SDUFacade
+        SDUFacade().update_subscriber_observer(subscriber_id)
     else:
         flash('Subscriber not found', 'error')
 
@@ -464,6 +486,9 @@ def delete_subscriber(subscriber_id):
     """Deleting a subscriber."""
     repo = SubscriberRepository()
     if repo.delete(subscriber_id):
+        # Remove observer in NewsService
+        from facade.sdu_facade import SDUFacade
+        SDUFacade().update_subscriber_observer(subscriber_id)
         flash('Subscriber deleted', 'success')
     else:
         flash('Error deleting subscriber', 'error')
@@ -486,6 +511,8 @@ def edit_subscriber(subscriber_id):
         subscriber.email = request.form.get('email', subscriber.email)
         subscriber.is_active = request.form.get('is_active') == 'yes'
         subscriber.language = request.form.get('language', subscriber.language or 'ru')
+        digest = request.form.get('digest', subscriber.digest)
+        subscriber.digest = digest if digest in FREQUENCIES else 'immediate'
 
         categories = request.form.getlist('categories')
         if categories:
@@ -3,6 +3,7 @@ News Controller
 """
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session
 from facade.sdu_facade import SDUFacade
+from services.digest_scheduler import FREQUENCIES
 from utils.data_i18n import get_translated_news, get_translated_news_list
 from utils.i18n import DEFAULT_LANGUAGE, get_translation
 
@@ -64,13 +65,17 @@ def subscribe():
     """Subscribe to news."""
     email = request.form.get('email')
     name = request.form.get('name', 'Subscriber')
+    digest = request.form.get('digest', 'immediate')
     lang = session.get('language', DEFAULT_LANGUAGE)
 
+    if digest not in FREQUENCIES:
+        digest = 'immediate'
+
     if not email:
         flash(get_translation('news.subscribe_email_required', lang), 'error')
         return redirect(url_for('news.list_news'))
 
-    if facade.subscribe_to_news(email, name, language=lang):
+    if facade.subscribe_to_news(email, name, language=lang, digest=digest):
         flash(get_translation('news.subscribe_success', lang), 'success')
     else:
         flash(get_translation('news.subscribe_email_exists', lang), 'info')
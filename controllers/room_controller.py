@@ -5,7 +5,7 @@ Adapted for working with real SDU data
 from flask import Blueprint, render_template, request, jsonify, session
 from facade.sdu_facade import SDUFacade
 from datetime import datetime
-from models.room import TIME_SLOTS
+from models.room import TIME_SLOTS, parse_time, format_time, find_slot, find_slot_starting_from
 from utils.i18n import get_days_of_week, DEFAULT_LANGUAGE, get_translation
 
 room_bp = Blueprint('rooms', __name__)
@@ -27,14 +27,14 @@ def list_rooms():
         if week_id == 7:  # Weekend - always rest
             week_id = 1
 
-    if not time:
-        current_time = now.strftime('%H:%M')
+    minutes = parse_time(time) if time else None
+    if minutes is not None:
+        # Normalize e.g. "8:30" to "08:30" so the selected option matches
+        time = format_time(minutes)
+    else:
         # Find nearest slot
-        time = TIME_SLOTS[0][0]
-        for start, end in TIME_SLOTS:
-            if current_time <= start:
-                time = start
-                break
+        slot = find_slot_starting_from(now.hour * 60 + now.minute)
+        time = TIME_SLOTS[slot][0] if slot is not None else TIME_SLOTS[0][0]
 
     free_cabinets = facade.get_free_cabinets(week_id, time, building)
     buildings = facade.get_buildings()
@@ -87,9 +87,10 @@ def cabinet_schedule(cabinet_id):
         schedule_grid[(start, end)] = {day: None for day in range(1, 7)}
 
     for lesson in schedule:
-        slot_key = (lesson.start_time, lesson.end_time)
-        if slot_key in schedule_grid:
-            schedule_grid[slot_key][lesson.week_id] = lesson
+        start = parse_time(lesson.start_time)
+        slot = find_slot(start) if start is not None else None
+        if slot is not None:
+            schedule_grid[TIME_SLOTS[slot]][lesson.week_id] = lesson
 
     lang = session.get('language', DEFAULT_LANGUAGE)
     days = get_days_of_week(lang)
@@ -118,6 +119,34 @@ def api_search_cabinets():
     } for c in cabinets[:20]])
 
 
+@room_bp.route('/api/free')
+def api_free_cabinets():
+    """API: cabinets free during a time range, with time until which they stay free."""
+    week_id = request.args.get('day', type=int)
+    start_time = request.args.get('from', '').strip()
+    end_time = request.args.get('to', '').strip()
+    building = request.args.get('building')
+
+    if not week_id or not start_time or not end_time:
+        return jsonify({'error': 'day, from and to are required'}), 400
+    if not 1 <= week_id <= 6:
+        return jsonify({'error': 'day must be 1-6 (Monday-Saturday)'}), 400
+    start_minutes, end_minutes = parse_time(start_time), parse_time(end_time)
+    if start_minutes is None or end_minutes is None:
+        return jsonify({'error': 'from and to must be in HH:MM format'}), 400
+    if start_minutes >= end_minutes:
+        return jsonify({'error': 'from must be earlier than to'}), 400
+
+    result = facade.get_free_cabinets_for_range(week_id, start_time, end_time, building)
+
+    return jsonify([{
+        'id': c.id,
+        'name': c.name,
+        'building': c.parent_building_en,
+        'free_until': free_until
+    } for c, free_until in result])
+
+
 @room_bp.route('/current')
 def current_free_rooms():
     """Rooms available now."""
@@ -177,6 +177,15 @@ class SDUFacade:
         """Finds available cabinets at specified time."""
         return self._cabinet_service.get_free_cabinets(week_id, time, building)
 
+    def get_free_cabinets_for_range(self, week_id: int, start_time: str, end_time: str,
+                                    building: str = None) -> List:
+        """Finds cabinets free during the whole time range (with free-until time)."""
+        return self._cabinet_service.get_free_cabinets_for_range(week_id, start_time, end_time, building)
+
+    def get_cabinet_free_until(self, cabinet_id: int, week_id: int, time: str) -> Optional[str]:
+        """Returns time until which cabinet is free."""
+        return self._cabinet_service.get_free_until(cabinet_id, week_id, time)
+
     def get_current_free_cabinets(self, building: str = None) -> List:
         """Finds cabinets available now."""
         return self._cabinet_service.get_current_free_cabinets(building)
@@ -237,9 +246,10 @@ class SDUFacade:
         """Creates news."""
         return self._news_service.create_news(title, content, category, author)
 
-    def subscribe_to_news(self, email: str, name: str, language: str = 'ru') -> bool:
+    def subscribe_to_news(self, email: str, name: str, language: str = 'ru',
+                          digest: str = 'immediate') -> bool:
         """Subscribes to news."""
-        return self._news_service.subscribe(email, name, language=language)
+        return self._news_service.subscribe(email, name, language=language, digest=digest)
 
     def unsubscribe_from_news(self, email: str) -> bool:
         """Unsubscribes from news."""
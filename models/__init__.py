@@ -9,6 +9,8 @@ from models.news import News
 from models.product import Product
 from models.order import Order
 from models.subscriber import Subscriber
+from models.translation_job import TranslationJob
+from models.email_message import EmailMessage
 
 __all__ = [
     'Teacher',
@@ -19,6 +21,8 @@ __all__ = [
     'News',
     'Product',
     'Order',
-    'Subscriber'
+    'Subscriber',
+    'TranslationJob',
+    'EmailMessage'
 ]
 
@@ -0,0 +1,77 @@
+"""
+Email Message Model
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass
+class EmailMessage:
+    """Outgoing email with its delivery status"""
+    id: str
+    to_email: str
+    subject: str
+    body: str
+    html: bool = False
+    kind: str = 'email'  # email (rendered), news_created, news_updated (rendered on delivery)
+    payload: dict = field(default_factory=dict)  # Data to render the message from
+    key: str = ''  # Idempotency key, a message is queued once per key
+    status: str = 'queued'  # queued, sending, sent, failed
+    attempts: int = 0
+    error: str = ''
+    available_at: float = 0.0  # Unix time when the message is due (retry backoff, lease)
+    created_at: str = ''
+    sent_at: str = ''
+
+    QUEUED = 'queued'
+    SENDING = 'sending'
+    SENT = 'sent'
+    FAILED = 'failed'
+
+    def __post_init__(self):
+        if not self.created_at:
+            self.created_at = datetime.now().isoformat()
+
+    @property
+    def is_finished(self) -> bool:
+        """Checks if delivery is over (sent or failed)"""
+        return self.status in (self.SENT, self.FAILED)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            'id': self.id,
+            'to_email': self.to_email,
+            'subject': self.subject,
+            'body': self.body,
+            'html': self.html,
+            'kind': self.kind,
+            'payload': self.payload,
+            'key': self.key,
+            'status': self.status,
+            'attempts': self.attempts,
+            'error': self.error,
+            'available_at': self.available_at,
+            'created_at': self.created_at,
+            'sent_at': self.sent_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'EmailMessage':
+        """Create from dictionary"""
+        return cls(
+            id=data.get('id', ''),
+            to_email=data.get('to_email', ''),
+            subject=data.get('subject', ''),
+            body=data.get('body', ''),
+            html=data.get('html', False),
+            kind=data.get('kind', 'email'),
+            payload=data.get('payload') or {},
+            key=data.get('key', ''),
+            status=data.get('status', 'queued'),
+            attempts=data.get('attempts', 0),
+            error=data.get('error', ''),
+            available_at=data.get('available_at', 0.0),
+            created_at=data.get('created_at', ''),
+            sent_at=data.get('sent_at', '')
+        )
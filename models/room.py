@@ -2,11 +2,14 @@
 Cabinet Model (Room)
 Adapted for working with real SDU data
 """
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from typing import Optional
 
+from models.teacher import Teacher
 
-@dataclass
+
+@dataclass(slots=True)
 class Cabinet:
     """SDU Cabinet Model"""
     id: int
@@ -31,9 +34,14 @@ class Cabinet:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CabinetLesson:
-    """Cabinet Lesson Model"""
+    """
+    Cabinet Lesson Model
+
+    Lessons loaded by the lesson store share Teacher and Cabinet objects
+    and interned strings.
+    """
     id: int
     code: str
     section: str
@@ -43,10 +51,18 @@ class CabinetLesson:
     start_time: str
     end_time: str
     week_id: int
-    teacher: Optional[dict] = None
-    cabinet: Optional[dict] = None
+    teacher: Optional[Teacher] = None
+    cabinet: Optional[Cabinet] = None
 
     def to_dict(self) -> dict:
+        teacher = None
+        if self.teacher:
+            teacher = {
+                'id': self.teacher.id,
+                'full_name_en': self.teacher.full_name_en,
+                'full_name_kz': self.teacher.full_name_kz,
+                'level': self.teacher.level
+            }
         return {
             'id': self.id,
             'code': self.code,
@@ -57,12 +73,14 @@ class CabinetLesson:
             'start_time': self.start_time,
             'end_time': self.end_time,
             'week_id': self.week_id,
-            'teacher': self.teacher,
-            'cabinet': self.cabinet
+            'teacher': teacher,
+            'cabinet': self.cabinet.to_dict() if self.cabinet else None
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> 'CabinetLesson':
+        teacher = data.get('teacher')
+        cabinet = data.get('cabinet')
         return cls(
             id=data.get('id', 0),
             code=data.get('code', ''),
@@ -73,8 +91,8 @@ class CabinetLesson:
             start_time=data.get('start_time', ''),
             end_time=data.get('end_time', ''),
             week_id=data.get('week_id', 0),
-            teacher=data.get('teacher'),
-            cabinet=data.get('cabinet')
+            teacher=Teacher.from_dict(teacher) if teacher else None,
+            cabinet=Cabinet.from_dict(cabinet) if cabinet else None
         )
 
 
@@ -87,6 +105,70 @@ TIME_SLOTS = [
     ("20:30", "21:20"), ("21:30", "22:20")
 ]
 
+
+
+def parse_time(value) -> Optional[int]:
+    """
+    Converts time string to minutes since midnight.
+
+    Accepts "HH:MM" and "H:MM" (e.g., "8:30"). Returns None for invalid values.
+    """
+    try:
+        hours, minutes = str(value).strip().split(':')[:2]
+        hours, minutes = int(hours), int(minutes)
+    except (ValueError, AttributeError):
+        return None
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        return None
+    return hours * 60 + minutes
+
+
+def format_time(minutes: int) -> str:
+    """Converts minutes since midnight to "HH:MM"."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+# Slot bounds in minutes, used for bisect lookups
+TIME_SLOT_MINUTES = [(parse_time(start), parse_time(end)) for start, end in TIME_SLOTS]
+_SLOT_STARTS = [start for start, end in TIME_SLOT_MINUTES]
+
+
+def find_slot(minutes: int) -> Optional[int]:
+    """Returns index of the slot containing the time or None (break / outside schedule)."""
+    slot = bisect_right(_SLOT_STARTS, minutes) - 1
+    if slot >= 0 and minutes < TIME_SLOT_MINUTES[slot][1]:
+        return slot
+    return None
+
+
+def find_next_slot(minutes: int) -> Optional[int]:
+    """Returns index of the slot containing the time or the next one, None after the last slot."""
+    slot = find_slot(minutes)
+    if slot is not None:
+        return slot
+    slot = bisect_right(_SLOT_STARTS, minutes)
+    return slot if slot < len(TIME_SLOTS) else None
+
+
+def find_slot_starting_from(minutes: int, strict: bool = False) -> Optional[int]:
+    """
+    Returns index of the first slot starting at or after the time, None if there is none.
+
+    With strict=True the slot must start strictly after the time.
+    """
+    slot = (bisect_right if strict else bisect_left)(_SLOT_STARTS, minutes)
+    return slot if slot < len(TIME_SLOTS) else None
+
+
+def slots_overlapping(start: int, end: int) -> range:
+    """Returns indexes of slots overlapping the range [start, end) in minutes."""
+    first = max(bisect_right(_SLOT_STARTS, start) - 1, 0)
+    if first < len(TIME_SLOTS) and TIME_SLOT_MINUTES[first][1] <= start:
+        first += 1
+    last = bisect_right(_SLOT_STARTS, end - 1)
+    return range(first, max(first, last))
+
+
 # Days of week
 DAYS_OF_WEEK = {
     1: 'Monday',
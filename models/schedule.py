@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Schedule:
     """Lesson Schedule Model"""
     id: str
@@ -91,3 +91,29 @@ class Schedule:
             cabinet_name=cabinet_name,
             cabinet_building=cabinet_building
         )
+
+    @classmethod
+    def from_lesson(cls, lesson) -> 'Schedule':
+        """
+        Create from a CabinetLesson record.
+
+        Strings are taken from the lesson and its shared Teacher/Cabinet
+        objects, nothing is copied.
+        """
+        teacher = lesson.teacher
+        cabinet = lesson.cabinet
+        return cls(
+            id=str(lesson.id),
+            code=lesson.code,
+            section=lesson.section,
+            type=lesson.type,
+            name_en=lesson.name_en,
+            name_kz=lesson.name_kz,
+            start_time=lesson.start_time,
+            end_time=lesson.end_time,
+            week_id=lesson.week_id,
+            teacher_id=teacher.id if teacher else None,
+            teacher_name=teacher.full_name_en if teacher else None,
+            cabinet_name=cabinet.name if cabinet else None,
+            cabinet_building=cabinet.parent_building_en if cabinet else None
+        )
@@ -15,6 +15,7 @@ class Subscriber:
     is_active: bool = True
     categories: list = None  # Subscription categories
     language: str = 'ru'  # Subscriber language (ru, en, kz)
+    digest: str = 'immediate'  # News emails: immediate, hourly or daily digest
 
     def __post_init__(self):
         if self.categories is None:
@@ -29,7 +30,8 @@ class Subscriber:
             'subscribed_at': self.subscribed_at,
             'is_active': self.is_active,
             'categories': self.categories,
-            'language': self.language
+            'language': self.language,
+            'digest': self.digest
         }
 
     @classmethod
@@ -42,6 +44,7 @@ class Subscriber:
             subscribed_at=data.get('subscribed_at', datetime.now().isoformat()),
             is_active=data.get('is_active', True),
             categories=data.get('categories', ['all']),
-            language=data.get('language', 'ru')
+            language=data.get('language', 'ru'),
+            digest=data.get('digest', 'immediate')
         )
 
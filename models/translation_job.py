@@ -0,0 +1,59 @@
+"""
+Translation Job Model
+"""
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class TranslationJob:
+    """Background translation of a news item or product"""
+    id: str
+    entity_type: str  # news, product
+    entity_id: str
+    status: str = 'pending'  # pending, running, done, failed
+    attempts: int = 0
+    notify: str = ''  # Publisher event after translation: '', 'publish', 'update'
+    error: str = ''
+    created_at: str = ''
+    updated_at: str = ''
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    def __post_init__(self):
+        if not self.created_at:
+            self.created_at = datetime.now().isoformat()
+        if not self.updated_at:
+            self.updated_at = self.created_at
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            'id': self.id,
+            'entity_type': self.entity_type,
+            'entity_id': self.entity_id,
+            'status': self.status,
+            'attempts': self.attempts,
+            'notify': self.notify,
+            'error': self.error,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TranslationJob':
+        """Create from dictionary"""
+        return cls(
+            id=data.get('id', ''),
+            entity_type=data.get('entity_type', ''),
+            entity_id=data.get('entity_id', ''),
+            status=data.get('status', 'pending'),
+            attempts=data.get('attempts', 0),
+            notify=data.get('notify', ''),
+            error=data.get('error', ''),
+            created_at=data.get('created_at', ''),
+            updated_at=data.get('updated_at', '')
+        )
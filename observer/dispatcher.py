@@ -0,0 +1,215 @@
+"""
+Concurrent Observer Dispatch
+
+ObserverDispatcher delivers events to observers on a pool of worker
+threads, so publishing news does not wait for every observer's update().
+
+Each subscriber is always served by the same worker (lane) and lanes are
+FIFO, so a subscriber receives events in the order they were published.
+Queues are bounded: when workers fall behind, submit() blocks
+(back-pressure) instead of buffering an unbounded number of events.
+"""
+import atexit
+import contextlib
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, List
+
+from observer.observer import Observer
+
+
+class DispatchReport:
+    """
+    Completion report of one notification fan-out.
+
+    Counts observers notified and failed; wait() blocks until every
+    observer has been processed.
+    """
+
+    # Error messages kept per report (failures beyond this are only counted)
+    MAX_ERRORS = 100
+
+    def __init__(self, event_type: str, total: int):
+        self.event_type = event_type
+        self.total = total
+        self.delivered = 0
+        self.failed = 0
+        self.errors: Dict[str, str] = {}
+        self.started_at = datetime.now().isoformat()
+        self.finished_at = ''
+        self._started = time.monotonic()
+        self._duration = 0.0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        if total == 0:
+            self._finish()
+
+    def record(self, subscriber_id: str, error: Exception = None) -> None:
+        """Registers result of one observer's update()."""
+        with self._lock:
+            if error is None:
+                self.delivered += 1
+            else:
+                self.failed += 1
+                if len(self.errors) < self.MAX_ERRORS:
+                    self.errors[subscriber_id] = str(error)
+            if self.delivered + self.failed == self.total:
+                self._finish()
+
+    def _finish(self) -> None:
+        self._duration = time.monotonic() - self._started
+        self.finished_at = datetime.now().isoformat()
+        self._done.set()
+
+    @property
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Waits until all observers are processed.
+
+        Returns:
+            True if done, False on timeout
+        """
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> dict:
+        """Converts report to dictionary."""
+        with self._lock:
+            return {
+                'event_type': self.event_type,
+                'total': self.total,
+                'delivered': self.delivered,
+                'failed': self.failed,
+                'pending': self.total - self.delivered - self.failed,
+                'errors': dict(self.errors),
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+                'duration': round(self._duration, 3) if self.is_done else None
+            }
+
+
+class ObserverDispatcher:
+    """Delivers events to observers on a bounded pool of worker threads."""
+
+    def __init__(self, workers: int = 4, queue_size: int = 1000, max_pending_events: int = 100,
+                 context: Callable[[], ContextManager] = None):
+        """
+        Args:
+            workers: Number of worker threads (lanes)
+            queue_size: Pending updates per worker before submitting blocks
+            max_pending_events: Events waiting to be fanned out before submit() blocks
+            context: Factory of a context manager wrapping each run of updates
+                     taken by a worker at once (e.g. batched outbox writes)
+        """
+        self._workers = workers
+        self._queue_size = queue_size
+        self._context = context or contextlib.nullcontext
+        self._events: "queue.Queue" = queue.Queue(max_pending_events)
+        self._lanes: List["queue.Queue"] = [queue.Queue(queue_size) for _ in range(workers)]
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._pending: List[DispatchReport] = []
+        atexit.register(self.drain)
+
+    def submit(self, event_type: str, data: Any, observers: List[Observer]) -> DispatchReport:
+        """
+        Schedules notification of observers.
+
+        Blocks while `max_pending_events` events are waiting to be fanned out.
+
+        Args:
+            event_type: Event type
+            data: Event data
+            observers: Observers to notify, in order
+
+        Returns:
+            Report completed when all observers are processed
+        """
+        report = DispatchReport(event_type, len(observers))
+        if not observers:
+            return report
+        self._ensure_started()
+        with self._lock:
+            self._pending = [r for r in self._pending if not r.is_done]
+            self._pending.append(report)
+        self._events.put((report, event_type, data, observers))
+        return report
+
+    def drain(self, timeout: float = 30.0) -> bool:
+        """
+        Waits until submitted events are delivered (called at shutdown).
+
+        Returns:
+            True if all events were delivered within timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            pending = list(self._pending)
+        for report in pending:
+            if not report.wait(max(0.0, deadline - time.monotonic())):
+                print(f"[Dispatcher] Shutdown with undelivered '{report.event_type}' notifications")
+                return False
+        return True
+
+    # ==========================================
+    # Workers
+    # ==========================================
+
+    def _ensure_started(self) -> None:
+        """Starts fan-out and lane threads on first use."""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            threads = [threading.Thread(target=self._fan_out, name='observer-dispatch', daemon=True)]
+            threads += [threading.Thread(target=self._run_lane, args=(lane,),
+                                         name=f'observer-lane-{i}', daemon=True)
+                        for i, lane in enumerate(self._lanes)]
+            for thread in threads:
+                thread.start()
+            self._threads = threads
+
+    def _fan_out(self) -> None:
+        """Splits events into per-observer updates, one lane per subscriber."""
+        while True:
+            report, event_type, data, observers = self._events.get()
+            for observer in observers:
+                lane = self._lanes[hash(observer.subscriber_id) % self._workers]
+                # Blocks while the lane is full (back-pressure)
+                lane.put((report, observer, event_type, data))
+
+    def _run_lane(self, lane: "queue.Queue") -> None:
+        while True:
+            item = lane.get()
+            results = []
+            try:
+                with self._context():
+                    # Take whatever is already queued in one run
+                    while item is not None:
+                        report, observer, event_type, data = item
+                        try:
+                            observer.update(event_type, data)
+                            results.append((report, observer.subscriber_id, None))
+                        except Exception as e:
+                            print(f"[Observer] Notification error {observer.subscriber_id}: {e}")
+                            results.append((report, observer.subscriber_id, e))
+                        item = None
+                        if len(results) < self._queue_size:
+                            try:
+                                item = lane.get_nowait()
+                            except queue.Empty:
+                                pass
+            except Exception as e:
+                print(f"[Dispatcher] Error completing notifications: {e}")
+                results = [(report, subscriber_id, error or e)
+                           for report, subscriber_id, error in results]
+                if item is not None:
+                    results.append((item[0], item[1].subscriber_id, e))
+
+            for report, subscriber_id, error in results:
+                report.record(subscriber_id, error)
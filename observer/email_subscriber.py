@@ -1,8 +1,9 @@
 """
 EmailSubscriber - concrete Observer for email notifications
 """
-from typing import Any
+from typing import Any, List
 from observer.observer import Observer
+from observer.notification_history import NotificationHistory
 
 
 class EmailSubscriber(Observer):
@@ -10,9 +11,11 @@ class EmailSubscriber(Observer):
     Email notification subscriber.
 
     Receives event notifications and sends email via EmailService.
+    Keeps the latest `history_size` notifications (bounded history).
     """
 
-    def __init__(self, subscriber_id: str, email: str, name: str, language: str = 'ru'):
+    def __init__(self, subscriber_id: str, email: str, name: str, language: str = 'ru',
+                 categories: List[str] = None, digest: str = 'immediate', history_size: int = None):
         """
         Initialize email subscriber.
 
@@ -21,12 +24,17 @@ class EmailSubscriber(Observer):
             email: Email address
             name: Subscriber name
             language: Subscriber language (ru, en, kz)
+            categories: News categories the subscriber receives (default: all)
+            digest: 'immediate' (email per news), 'hourly' or 'daily' digest
+            history_size: Notifications kept in memory (default: NOTIFICATION_HISTORY_SIZE)
         """
         self._subscriber_id = subscriber_id
         self._email = email
         self._name = name
         self._language = language
-        self._notifications = []  # Stores notification history
+        self._categories = list(categories or ['all'])
+        self._digest = digest or 'immediate'
+        self._notifications = NotificationHistory.for_subscriber(subscriber_id, history_size)
 
     @property
     def subscriber_id(self) -> str:
@@ -43,6 +51,16 @@ class EmailSubscriber(Observer):
         """Subscriber name."""
         return self._name
 
+    @property
+    def categories(self) -> List[str]:
+        """Subscribed news categories."""
+        return self._categories
+
+    @property
+    def digest(self) -> str:
+        """News email frequency (immediate, hourly, daily)."""
+        return self._digest
+
     def update(self, event_type: str, data: Any) -> None:
         """
         Handles event notification.
@@ -52,7 +70,7 @@ class EmailSubscriber(Observer):
             data: Event data
         """
         notification = self._create_notification(event_type, data)
-        self._notifications.append(notification)
+        self._notifications.add(notification)
         self._send_email(event_type, data)
 
     def _create_notification(self, event_type: str, data: Any) -> dict:
@@ -99,20 +117,40 @@ class EmailSubscriber(Observer):
         # Import here to avoid circular imports
         from services.email_service import get_email_service
 
+        if self._digest != 'immediate' and event_type in ('news_created', 'news_updated'):
+            from services.digest_scheduler import get_digest_scheduler
+            get_digest_scheduler().add(self._subscriber_id, data.id, self._digest)
+            return
+
         email_service = get_email_service()
 
         if event_type == 'news_created':
-            email_service.send_news_notification(self._email, self._name, data, language=self._language)
+            email_service.send_news_notification(self._email, self._name, data, language=self._language,
+                                                 subscriber_id=self._subscriber_id)
         elif event_type == 'news_updated':
-            email_service.send_news_update_notification(self._email, self._name, data, language=self._language)
+            email_service.send_news_update_notification(self._email, self._name, data, language=self._language,
+                                                        subscriber_id=self._subscriber_id)
         else:
             # For other events use general method
             notification = self._create_notification(event_type, data)
             email_service.send(self._email, notification['subject'], notification['body'])
 
     def get_notifications(self) -> list:
-        """Returns notification history."""
-        return self._notifications.copy()
+        """Returns notification history kept in memory, oldest first."""
+        return self._notifications.get_recent()[::-1]
+
+    def get_notifications_page(self, page: int = 1, per_page: int = 20) -> dict:
+        """
+        Returns one page of notification history, newest first.
+
+        Args:
+            page: Page number, starting from 1
+            per_page: Notifications per page
+
+        Returns:
+            {'items', 'page', 'per_page', 'total', 'has_next'}
+        """
+        return self._notifications.get_page(page, per_page)
 
     def clear_notifications(self) -> None:
         """Clears notification history."""
@@ -1,8 +1,11 @@
 """
 NewsPublisher - Concrete Subject for publishing news
 """
-from typing import Any
+from collections import deque
+from typing import Any, Dict, Iterable, List
+from config import Config
 from observer.subject import Subject
+from observer.dispatcher import DispatchReport, ObserverDispatcher
 from models.news import News
 
 
@@ -12,8 +15,19 @@ class NewsPublisher(Subject):
 
     Notifies subscribers about new news, updates and deletions.
     Implements Singleton pattern for global access.
+
+    Observers are indexed by their `categories` (observers without it
+    subscribe to 'all'), so news of a category is delivered only to its
+    subscribers without scanning the whole list.
+
+    With NOTIFY_WORKERS > 0, observers are notified by an ObserverDispatcher
+    in the background (per-subscriber order is kept); otherwise in the
+    publishing thread.
     """
 
+    # Completion reports kept for get_reports()
+    MAX_REPORTS = 20
+
     _instance = None
 
     # Event types
@@ -33,9 +47,69 @@ class NewsPublisher(Subject):
         if self._initialized:
             return
         super().__init__()
+        self._dispatcher = None
+        if Config.NOTIFY_WORKERS > 0:
+            self._dispatcher = ObserverDispatcher(
+                workers=Config.NOTIFY_WORKERS,
+                queue_size=Config.NOTIFY_QUEUE_SIZE,
+                max_pending_events=Config.NOTIFY_MAX_PENDING_EVENTS,
+                context=self._email_batch
+            )
+        self._reports = deque(maxlen=self.MAX_REPORTS)
+        # category (lower case) -> subscriber IDs (dict as an ordered set)
+        self._category_index: Dict[str, Dict[str, None]] = {}
+        self._subscriber_categories: Dict[str, tuple] = {}
         self._initialized = True
         print("[NewsPublisher] Initialized")
 
+    @staticmethod
+    def _email_batch():
+        """Emails queued by a fan-out are written to the outbox in batches."""
+        # Import here to avoid circular imports
+        from services.email_service import get_email_service
+        return get_email_service().batch()
+
+    def notify(self, event_type: str, data: Any) -> DispatchReport:
+        """
+        Notifies subscribers (in the background if the dispatcher is enabled).
+
+        Args:
+            event_type: Event type
+            data: Event data
+
+        Returns:
+            Report, completed when all subscribers are notified
+        """
+        observers = self._recipients(event_type, data)
+        if self._dispatcher is not None and observers:
+            print(f"[NewsPublisher] Dispatching '{event_type}' to {len(observers)} subscribers")
+            report = self._dispatcher.submit(event_type, data, observers)
+        else:
+            with self._email_batch():
+                report = super().notify(event_type, data)
+        self._reports.append(report)
+        return report
+
+    def _recipients(self, event_type: str, data: Any) -> List:
+        """
+        Returns observers subscribed to event and to the news category
+        (or to 'all'); events without a category go to every observer.
+        """
+        category = getattr(data, 'category', None)
+        if not category:
+            return self.get_observers(event_type)
+
+        registry = self._observers.get(event_type, {})
+        everything = self._category_index.get('all', {})
+        matching = self._category_index.get(category.lower(), {})
+        recipients = [registry[sid] for sid in everything if sid in registry]
+        recipients += [registry[sid] for sid in matching if sid in registry and sid not in everything]
+        return recipients
+
+    def get_reports(self) -> List[dict]:
+        """Returns completion reports of recent notifications, newest first."""
+        return [report.to_dict() for report in reversed(self._reports)]
+
     def publish_news(self, news: News) -> None:
         """
         Publishes new news and notifies subscribers.
@@ -67,6 +141,55 @@ class NewsPublisher(Subject):
         print(f"[NewsPublisher] Deleting news: {title}")
         self.notify(self.EVENT_NEWS_DELETED, {'id': news_id, 'title': title})
 
+    # ==========================================
+    # Category index
+    # ==========================================
+
+    def attach(self, event_type: str, observer) -> None:
+        """Subscribes observer to event type and indexes its categories."""
+        super().attach(event_type, observer)
+        self._index(observer)
+
+    def attach_many(self, event_type: str, observers: Iterable) -> int:
+        """Subscribes several observers to event type and indexes their categories."""
+        observers = list(observers)
+        count = super().attach_many(event_type, observers)
+        for observer in observers:
+            self._index(observer)
+        return count
+
+    def detach(self, event_type: str, observer) -> None:
+        """Unsubscribes observer from event type."""
+        super().detach(event_type, observer)
+        self._unindex(observer.subscriber_id)
+
+    def _index(self, observer) -> None:
+        """Adds observer to the category index (first registration wins, as in attach)."""
+        subscriber_id = observer.subscriber_id
+        if subscriber_id in self._subscriber_categories:
+            return
+        categories = tuple({c.lower() for c in (getattr(observer, 'categories', None) or ['all'])})
+        self._subscriber_categories[subscriber_id] = categories
+        for category in categories:
+            self._category_index.setdefault(category, {})[subscriber_id] = None
+
+    def _unindex(self, subscriber_id: str) -> None:
+        """Removes observer from the category index once it has no subscriptions left."""
+        if any(subscriber_id in observers for observers in self._observers.values()):
+            return
+        for category in self._subscriber_categories.pop(subscriber_id, ()):
+            subscribers = self._category_index.get(category)
+            if subscribers is not None:
+                subscribers.pop(subscriber_id, None)
+                if not subscribers:
+                    del self._category_index[category]
+
+    def get_category_audience(self, category: str) -> int:
+        """Returns number of observers receiving news of category."""
+        everything = self._category_index.get('all', {})
+        matching = self._category_index.get(category.lower(), {})
+        return len(everything) + sum(1 for sid in matching if sid not in everything)
+
     def subscribe_to_all(self, observer) -> None:
         """
         Subscribes observer to all events.
@@ -89,6 +212,17 @@ class NewsPublisher(Subject):
         self.detach(self.EVENT_NEWS_UPDATED, observer)
         self.detach(self.EVENT_NEWS_DELETED, observer)
 
+    def subscribe_many_to_all(self, observers: Iterable) -> None:
+        """
+        Subscribes several observers to all events (e.g. at startup).
+
+        Args:
+            observers: Observer objects
+        """
+        observers = list(observers)
+        for event_type in (self.EVENT_NEWS_CREATED, self.EVENT_NEWS_UPDATED, self.EVENT_NEWS_DELETED):
+            self.attach_many(event_type, observers)
+
     def remove_observer_by_id(self, subscriber_id: str) -> None:
         """
         Removes observer by subscriber_id from all events.
@@ -96,16 +230,8 @@ class NewsPublisher(Subject):
         Args:
             subscriber_id: Subscriber ID
         """
-        # Create temp observer for search and removal
-        from observer.email_subscriber import EmailSubscriber
-        temp_observer = EmailSubscriber(subscriber_id, '', '', 'ru')
-        
-        # Remove from all events
-        for event_type in [self.EVENT_NEWS_CREATED, self.EVENT_NEWS_UPDATED, self.EVENT_NEWS_DELETED]:
+        for event_type in (self.EVENT_NEWS_CREATED, self.EVENT_NEWS_UPDATED, self.EVENT_NEWS_DELETED):
             if event_type in self._observers:
-                self._observers[event_type] = [
-                    obs for obs in self._observers[event_type]
-                    if obs.subscriber_id != subscriber_id
-                ]
+                self._observers[event_type].pop(subscriber_id, None)
+        self._unindex(subscriber_id)
         print(f"[NewsPublisher] Observer {subscriber_id} removed")
-
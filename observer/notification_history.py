@@ -0,0 +1,247 @@
+"""
+Bounded Notification History
+
+Observers keep their latest notifications in a ring buffer, so history
+does not grow for the lifetime of the process. Optionally, entries pushed
+out of the buffer are appended to a JSON-lines log on disk and remain
+readable page by page.
+
+A spill log may be shared by several worker processes: IDs are reserved in
+blocks from a counter file next to it (<log>.seq) and the number of spilled
+entries is taken from the log itself.
+"""
+import json
+import os
+import re
+import threading
+from typing import Iterator, List, Optional
+
+from config import Config
+from repository.base_repository import atomic_write_json, file_lock
+
+
+class NotificationHistory:
+    """
+    Ring buffer of notifications (newest first) with optional spill log.
+
+    Each entry gets an increasing integer 'id' (unique across processes
+    sharing the spill log).
+    """
+
+    # IDs reserved from the counter file at once
+    ID_BLOCK = 1000
+
+    __slots__ = ('_entries', '_head', '_max_entries', '_spill_path', '_spilled', '_spill_size',
+                 '_spill_inode', '_next_id', '_id_limit', '_lock')
+
+    def __init__(self, max_entries: int = 20, spill_path: str = None):
+        """
+        Args:
+            max_entries: Notifications kept in memory
+            spill_path: JSON-lines file for notifications pushed out of memory
+                        (None: they are dropped)
+        """
+        # Grows up to max_entries, then the oldest slot (_head) is overwritten
+        self._entries: List[dict] = []
+        self._head = 0
+        self._max_entries = max(1, max_entries)
+        self._spill_path = spill_path
+        # Spilled entries counted up to _spill_size bytes of the log
+        self._spilled = 0
+        self._spill_size = 0
+        self._spill_inode = None
+        self._next_id = 1
+        # Without a spill log IDs are local, no block is reserved
+        self._id_limit = 0 if spill_path else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_subscriber(cls, subscriber_id: str, max_entries: int = None) -> 'NotificationHistory':
+        """
+        Creates history of a subscriber from configuration.
+
+        Args:
+            subscriber_id: Subscriber ID (names the spill log)
+            max_entries: Notifications kept in memory (default: NOTIFICATION_HISTORY_SIZE)
+        """
+        spill_path = None
+        if Config.NOTIFICATION_SPILL_DIR:
+            os.makedirs(Config.NOTIFICATION_SPILL_DIR, exist_ok=True)
+            filename = re.sub(r'[^\w.-]', '_', subscriber_id) + '.jsonl'
+            spill_path = os.path.join(Config.NOTIFICATION_SPILL_DIR, filename)
+        return cls(max_entries or Config.NOTIFICATION_HISTORY_SIZE, spill_path)
+
+    def add(self, notification: dict) -> Optional[dict]:
+        """
+        Adds notification, assigning its 'id'.
+
+        Returns:
+            Notification pushed out of memory (None while the buffer is not full)
+        """
+        with self._lock:
+            if self._id_limit is not None and self._next_id > self._id_limit:
+                self._reserve_ids()
+            notification['id'] = self._next_id
+            self._next_id += 1
+            evicted = None
+            if len(self._entries) < self._max_entries:
+                self._entries.append(notification)
+            else:
+                evicted = self._entries[self._head]
+                self._entries[self._head] = notification
+                self._head = (self._head + 1) % self._max_entries
+            if evicted is not None and self._spill_path:
+                self._spill(evicted)
+            return evicted
+
+    def get_recent(self, limit: int = None) -> List[dict]:
+        """Returns notifications kept in memory, newest first."""
+        with self._lock:
+            entries = self._newest_first()
+        return entries if limit is None else entries[:limit]
+
+    def get_page(self, page: int = 1, per_page: int = 20) -> dict:
+        """
+        Returns one page of history, newest first (memory, then spill log).
+
+        Args:
+            page: Page number, starting from 1
+            per_page: Notifications per page
+
+        Returns:
+            {'items', 'page', 'per_page', 'total', 'has_next'}
+        """
+        page = max(1, page)
+        start = (page - 1) * per_page
+        with self._lock:
+            entries = self._newest_first()
+            items = entries[start:start + per_page]
+            spilled = 0
+            if self._spill_path:
+                # Other processes append to the same log
+                with file_lock(self._spill_path + '.lock'):
+                    spilled = self._count_spilled()
+                    if len(items) < per_page and spilled:
+                        skip = max(0, start - len(entries))
+                        items += self._read_spilled(skip, per_page - len(items))
+
+        total = len(entries) + spilled
+        return {
+            'items': items,
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'has_next': start + per_page < total
+        }
+
+    def find(self, notification_id: int) -> Optional[dict]:
+        """Returns notification kept in memory by ID."""
+        with self._lock:
+            for entry in self._entries:
+                if entry['id'] == notification_id:
+                    return entry
+        return None
+
+    def clear(self) -> None:
+        """Clears notifications in memory and the spill log."""
+        with self._lock:
+            self._entries = []
+            self._head = 0
+            if self._spill_path:
+                with file_lock(self._spill_path + '.lock'):
+                    if os.path.exists(self._spill_path):
+                        os.remove(self._spill_path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.get_recent())
+
+    def _newest_first(self) -> List[dict]:
+        return (self._entries[self._head:] + self._entries[:self._head])[::-1]
+
+    # ==========================================
+    # Spill log
+    # ==========================================
+
+    def _spill(self, notification: dict) -> None:
+        line = json.dumps(notification, ensure_ascii=False, default=str) + '\n'
+        try:
+            with file_lock(self._spill_path + '.lock'):
+                with open(self._spill_path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+        except OSError as e:
+            print(f"[NotificationHistory] Spill error: {e}")
+
+    def _reserve_ids(self) -> None:
+        """Reserves the next block of IDs from the counter file shared by processes."""
+        seq_path = self._spill_path + '.seq'
+        try:
+            with file_lock(self._spill_path + '.lock'):
+                try:
+                    with open(seq_path, 'r', encoding='utf-8') as f:
+                        last = int(json.load(f))
+                except (FileNotFoundError, ValueError):
+                    # Log written before the counter existed: continue after its last ID
+                    newest = self._read_spilled(0, 1)
+                    last = newest[0].get('id', 0) if newest else 0
+                atomic_write_json(seq_path, last + self.ID_BLOCK)
+        except OSError as e:
+            print(f"[NotificationHistory] ID reservation error: {e}")
+            last = self._next_id - 1
+        self._next_id = last + 1
+        self._id_limit = last + self.ID_BLOCK
+
+    def _count_spilled(self) -> int:
+        """Returns number of entries in the spill log, counting only lines appended since the last call."""
+        try:
+            stat = os.stat(self._spill_path)
+        except FileNotFoundError:
+            self._spilled, self._spill_size, self._spill_inode = 0, 0, None
+            return 0
+        if stat.st_ino != self._spill_inode or stat.st_size < self._spill_size:
+            # New or cleared log
+            self._spilled, self._spill_size, self._spill_inode = 0, 0, stat.st_ino
+        if stat.st_size > self._spill_size:
+            with open(self._spill_path, 'rb') as f:
+                f.seek(self._spill_size)
+                appended = f.read(stat.st_size - self._spill_size)
+            self._spilled += appended.count(b'\n')
+            self._spill_size = stat.st_size
+        return self._spilled
+
+    def _read_spilled(self, skip: int, limit: int) -> List[dict]:
+        """Reads `limit` notifications from the end of the log, skipping the newest `skip`."""
+        items = []
+        try:
+            for line in self._reverse_lines():
+                if skip:
+                    skip -= 1
+                    continue
+                items.append(json.loads(line))
+                if len(items) == limit:
+                    break
+        except OSError as e:
+            print(f"[NotificationHistory] Spill read error: {e}")
+        return items
+
+    def _reverse_lines(self, block_size: int = 64 * 1024) -> Iterator[str]:
+        """Yields lines of the spill log from the last one, reading it in blocks."""
+        if not os.path.exists(self._spill_path):
+            return
+        with open(self._spill_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            rest = b''
+            while position > 0:
+                size = min(block_size, position)
+                position -= size
+                f.seek(position)
+                lines = (f.read(size) + rest).split(b'\n')
+                rest = lines.pop(0)
+                for line in reversed(lines):
+                    if line:
+                        yield line.decode('utf-8')
+            if rest:
+                yield rest.decode('utf-8')
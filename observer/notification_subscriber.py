@@ -4,6 +4,7 @@ NotificationSubscriber - Observer for internal notifications
 from typing import Any, List
 from datetime import datetime
 from observer.observer import Observer
+from observer.notification_history import NotificationHistory
 
 
 class NotificationSubscriber(Observer):
@@ -11,19 +12,22 @@ class NotificationSubscriber(Observer):
     Subscriber for internal notifications.
 
     Saves notifications to the system for display in UI.
+    Only the latest `history_size` notifications are kept in memory
+    (older ones go to the spill log if NOTIFICATION_SPILL_DIR is set).
     """
 
-    def __init__(self, subscriber_id: str, user_name: str):
+    def __init__(self, subscriber_id: str, user_name: str, history_size: int = None):
         """
         Subscriber initialization.
 
         Args:
             subscriber_id: Unique ID
             user_name: User name
+            history_size: Notifications kept in memory (default: NOTIFICATION_HISTORY_SIZE)
         """
         self._subscriber_id = subscriber_id
         self._user_name = user_name
-        self._notifications: List[dict] = []
+        self._notifications = NotificationHistory.for_subscriber(subscriber_id, history_size)
         self._unread_count = 0
 
     @property
@@ -38,7 +42,7 @@ class NotificationSubscriber(Observer):
 
     @property
     def unread_count(self) -> int:
-        """Number of unread notifications."""
+        """Number of unread notifications kept in memory."""
         return self._unread_count
 
     def update(self, event_type: str, data: Any) -> None:
@@ -50,7 +54,6 @@ class NotificationSubscriber(Observer):
             data: Event data
         """
         notification = {
-            'id': len(self._notifications) + 1,
             'event_type': event_type,
             'message': self._create_message(event_type, data),
             'timestamp': datetime.now().isoformat(),
@@ -58,8 +61,10 @@ class NotificationSubscriber(Observer):
             'data': self._serialize_data(data)
         }
 
-        self._notifications.insert(0, notification)  # Newest first
+        evicted = self._notifications.add(notification)  # Assigns 'id'
         self._unread_count += 1
+        if evicted is not None and not evicted['is_read']:
+            self._unread_count -= 1
 
         print(f"[Notification] For {self._user_name}: {notification['message']}")
 
@@ -84,16 +89,29 @@ class NotificationSubscriber(Observer):
             return {'value': str(data)}
 
     def get_notifications(self, limit: int = 50) -> List[dict]:
-        """Returns list of notifications."""
-        return self._notifications[:limit]
+        """Returns notifications kept in memory, newest first."""
+        return self._notifications.get_recent(limit)
+
+    def get_notifications_page(self, page: int = 1, per_page: int = 20) -> dict:
+        """
+        Returns one page of notification history, newest first.
+
+        Args:
+            page: Page number, starting from 1
+            per_page: Notifications per page
+
+        Returns:
+            {'items', 'page', 'per_page', 'total', 'has_next'}
+        """
+        return self._notifications.get_page(page, per_page)
 
     def mark_as_read(self, notification_id: int) -> bool:
         """Marks notification as read."""
-        for notif in self._notifications:
-            if notif['id'] == notification_id and not notif['is_read']:
-                notif['is_read'] = True
-                self._unread_count = max(0, self._unread_count - 1)
-                return True
+        notif = self._notifications.find(notification_id)
+        if notif is not None and not notif['is_read']:
+            notif['is_read'] = True
+            self._unread_count = max(0, self._unread_count - 1)
+            return True
         return False
 
     def mark_all_as_read(self) -> None:
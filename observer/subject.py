@@ -2,15 +2,18 @@
 Subject (Publisher) - base class for Observer Pattern
 """
 from abc import ABC
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional
 from observer.observer import Observer
+from observer.dispatcher import DispatchReport
 
 
 class Subject(ABC):
     """
     Abstract Subject (Publisher).
 
-    Stores list of observers and notifies them about events.
+    Stores observers per event type, keyed by subscriber_id (insertion
+    ordered, so attach/detach/lookup are O(1) and notification order is
+    the order of subscription), and notifies them about events.
 
     SOLID principles:
     - SRP: Subject manages subscriptions and notifications
@@ -18,8 +21,8 @@ class Subject(ABC):
     """
 
     def __init__(self):
-        """Initialize list of observers."""
-        self._observers: Dict[str, List[Observer]] = {}
+        """Initialize observer registry."""
+        self._observers: Dict[str, Dict[str, Observer]] = {}
 
     def attach(self, event_type: str, observer: Observer) -> None:
         """
@@ -29,17 +32,34 @@ class Subject(ABC):
             event_type: Event type to subscribe to
             observer: Observer object
         """
-        if event_type not in self._observers:
-            self._observers[event_type] = []
+        observers = self._observers.setdefault(event_type, {})
 
         # Check if already subscribed
-        for obs in self._observers[event_type]:
-            if obs.subscriber_id == observer.subscriber_id:
-                return
+        if observer.subscriber_id in observers:
+            return
 
-        self._observers[event_type].append(observer)
+        observers[observer.subscriber_id] = observer
         print(f"[Observer] {observer.subscriber_id} subscribed to '{event_type}'")
 
+    def attach_many(self, event_type: str, observers: Iterable[Observer]) -> int:
+        """
+        Subscribes several observers to event type (e.g. at startup).
+
+        Args:
+            event_type: Event type to subscribe to
+            observers: Observer objects
+
+        Returns:
+            Number of newly subscribed observers
+        """
+        registry = self._observers.setdefault(event_type, {})
+        count = len(registry)
+        for observer in observers:
+            registry.setdefault(observer.subscriber_id, observer)
+        count = len(registry) - count
+        print(f"[Observer] {count} observers subscribed to '{event_type}'")
+        return count
+
     def detach(self, event_type: str, observer: Observer) -> None:
         """
         Unsubscribes observer from event.
@@ -49,32 +69,53 @@ class Subject(ABC):
             observer: Observer object
         """
         if event_type in self._observers:
-            self._observers[event_type] = [
-                obs for obs in self._observers[event_type]
-                if obs.subscriber_id != observer.subscriber_id
-            ]
+            self._observers[event_type].pop(observer.subscriber_id, None)
             print(f"[Observer] {observer.subscriber_id} unsubscribed from '{event_type}'")
 
-    def notify(self, event_type: str, data: Any) -> None:
+    def notify(self, event_type: str, data: Any) -> DispatchReport:
         """
         Notifies all subscribers about event.
 
         Args:
             event_type: Event type
             data: Event data
+
+        Returns:
+            Report with numbers of notified and failed observers
         """
-        if event_type not in self._observers:
-            return
+        observers = self._recipients(event_type, data)
+        report = DispatchReport(event_type, len(observers))
+        if not observers:
+            return report
 
-        print(f"[Observer] Notification about event '{event_type}' for {len(self._observers[event_type])} subscribers")
+        print(f"[Observer] Notification about event '{event_type}' for {len(observers)} subscribers")
 
-        for observer in self._observers[event_type]:
+        for observer in observers:
             try:
                 observer.update(event_type, data)
+                report.record(observer.subscriber_id)
             except Exception as e:
                 print(f"[Observer] Notification error {observer.subscriber_id}: {e}")
+                report.record(observer.subscriber_id, e)
+        return report
+
+    def get_observers(self, event_type: str) -> List[Observer]:
+        """
+        Returns observers of event in subscription order.
+
+        A snapshot, so observers can (un)subscribe during notification.
+        """
+        return list(self._observers.get(event_type, {}).values())
+
+    def _recipients(self, event_type: str, data: Any) -> List[Observer]:
+        """Returns observers to notify about event (all subscribed by default)."""
+        return self.get_observers(event_type)
 
     def get_observers_count(self, event_type: str) -> int:
         """Returns number of subscribers to event."""
-        return len(self._observers.get(event_type, []))
+        return len(self._observers.get(event_type, {}))
+
+    def get_observer(self, event_type: str, subscriber_id: str) -> Optional[Observer]:
+        """Returns observer subscribed to event by subscriber_id."""
+        return self._observers.get(event_type, {}).get(subscriber_id)
 
@@ -0,0 +1,15 @@
+"""
+Storage Backend Selection
+
+Domain repositories inherit from StorageRepository, which is either the
+JSON BaseRepository or SqliteRepository depending on Config.STORAGE_BACKEND.
+Services and SDUFacade keep constructing the same repository classes.
+"""
+from config import Config
+from repository.base_repository import BaseRepository
+from repository.sqlite_repository import SqliteRepository
+
+if Config.STORAGE_BACKEND == 'sqlite':
+    StorageRepository = SqliteRepository
+else:
+    StorageRepository = BaseRepository
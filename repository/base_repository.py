@@ -6,12 +6,102 @@ from application business logic.
 """
 import json
 import os
+import tempfile
+import threading
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Optional, Any
+from contextlib import contextmanager
+from typing import TypeVar, Generic, List, Dict, Optional, Any, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: advisory locking is not available
+    fcntl = None
 
 T = TypeVar('T')
 
 
+def _copy_mode(file_path: str, tmp_path: str) -> None:
+    """Gives a temp file (mkstemp creates 0600) the mode of the file it replaces."""
+    try:
+        mode = os.stat(file_path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    os.chmod(tmp_path, mode)
+
+
+def atomic_write_json(file_path: str, data: Any, indent: Optional[int] = 2) -> None:
+    """
+    Writes JSON atomically: temp file in the same directory, then rename.
+
+    Readers always see either the old or the new complete file.
+
+    Args:
+        file_path: Target file
+        data: JSON-serializable data
+        indent: Indentation, None writes compact JSON without whitespace
+    """
+    directory = os.path.dirname(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            separators = (',', ':') if indent is None else None
+            json.dump(data, f, ensure_ascii=False, indent=indent, separators=separators)
+            f.flush()
+            os.fsync(f.fileno())
+        _copy_mode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def file_lock(lock_path: str):
+    """
+    Holds an exclusive advisory lock on lock_path (across processes and threads).
+
+    Each call opens its own descriptor, so blocks in different threads of
+    one process also exclude each other. Not re-entrant.
+    """
+    with open(lock_path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def read_journal(journal_path: str, offset: int = 0) -> Tuple[List[dict], int]:
+    """
+    Reads journal operations starting at byte offset.
+
+    Only complete lines are consumed, a line that is still being
+    appended is left for the next read.
+
+    Returns:
+        Tuple (operations, offset after the last consumed line)
+    """
+    try:
+        with open(journal_path, 'rb') as f:
+            f.seek(offset)
+            chunk = f.read()
+    except FileNotFoundError:
+        return [], 0
+
+    end = chunk.rfind(b'\n') + 1
+    operations = []
+    for line in chunk[:end].splitlines():
+        if line.strip():
+            try:
+                operations.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return operations, offset + end
+
+
 class BaseRepository(ABC, Generic[T]):
     """
     Abstract base repository.
@@ -24,6 +114,14 @@ class BaseRepository(ABC, Generic[T]):
     - DIP: Services depend on BaseRepository abstraction
     """
 
+    # Fields used by find_by filters (indexed by the SQLite backend)
+    _indexed_fields: Tuple[str, ...] = ()
+
+    # Journaled mode: mutations are appended as JSON lines to <name>.log and
+    # compacted into the JSON snapshot in background once the log is too big
+    _journaled: bool = False
+    _journal_max_bytes: int = 256 * 1024
+
     def __init__(self, data_file: str, data_dir: str = None):
         """
         Initialize repository.
@@ -37,24 +135,262 @@ class BaseRepository(ABC, Generic[T]):
 
         self._data_dir = data_dir
         self._file_path = os.path.join(data_dir, data_file)
+        self._journal_path = os.path.splitext(self._file_path)[0] + '.log'
+        self._compacting = False
+
+        # Parsed file contents, reused while the file signature is unchanged.
+        # (data, ID -> position index, signature) is replaced as one tuple, so
+        # readers in other threads never pair an index with a different list.
+        self._snapshot: Optional[Tuple[List[dict], Dict[str, int], Optional[tuple]]] = None
+        self._cache_hits = 0
+        self._cache_reloads = 0
+
+        # Cross-process lock (fcntl) + re-entrant lock for threads of this process
+        self._lock_path = self._file_path + '.lock'
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_file = None
 
         os.makedirs(data_dir, exist_ok=True)
 
         if not os.path.exists(self._file_path):
-            self._save_data([])
+            with self._locked():
+                if not os.path.exists(self._file_path):
+                    self._save_data([])
+
+    @contextmanager
+    def _locked(self):
+        """
+        Holds an exclusive advisory lock for a read-modify-write cycle.
+
+        Re-entrant within one repository instance, so repository methods
+        that call create/update inside a locked block do not deadlock.
+        """
+        with self._thread_lock:
+            if self._lock_depth == 0:
+                self._lock_file = open(self._lock_path, 'a')
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    if fcntl is not None:
+                        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    @staticmethod
+    def _stat_signature(path: str) -> Optional[Tuple[int, int, int]]:
+        """Returns (mtime_ns, size, inode) of a file or None if missing."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _file_signature(self) -> Optional[tuple]:
+        """
+        Returns signature of the stored data.
+
+        Snapshot signature, or (snapshot, journal) pair in journaled mode.
+        """
+        if not self._journaled:
+            return self._stat_signature(self._file_path)
+        return (self._stat_signature(self._file_path), self._stat_signature(self._journal_path))
+
+    @staticmethod
+    def _normalize_id(entity_id: Any) -> str:
+        """Normalizes ID for index lookups (teachers use int IDs, others str)."""
+        return '' if entity_id is None else str(entity_id)
+
+    def _set_cache(self, data: List[dict], signature: Optional[tuple]) -> Tuple[List[dict], Dict[str, int]]:
+        """
+        Stores parsed data with a rebuilt ID -> position index.
+
+        Returns:
+            Snapshot (data, index)
+        """
+        index = {}
+        for position, item in enumerate(data):
+            index.setdefault(self._normalize_id(item.get('id')), position)
+        self._snapshot = (data, index, signature)
+        return data, index
+
+    def _get_cached(self) -> Tuple[List[dict], Dict[str, int]]:
+        """
+        Returns the cached snapshot (data, index), reloading it if the file has changed.
+
+        The list and index belong to each other and are shared with the
+        cache: they must not be modified, and a position from the index
+        must only be used with the list of the same snapshot.
+        """
+        signature = self._file_signature()
+        snapshot = self._snapshot
+        if snapshot is not None and signature == snapshot[2]:
+            self._cache_hits += 1
+            return snapshot[0], snapshot[1]
+
+        if self._journaled:
+            return self._reload_journaled(signature)
 
-    def _load_data(self) -> List[dict]:
-        """Loads data from JSON file."""
         try:
             with open(self._file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                data = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            data = []
+
+        self._cache_reloads += 1
+        return self._set_cache(data, signature)
+
+    def _reload_journaled(self, signature: tuple) -> Tuple[List[dict], Dict[str, int]]:
+        """
+        Reloads data in journaled mode.
+
+        If only the journal has grown since the last read, just the new
+        tail is replayed. Otherwise the journal is read before the snapshot:
+        a compaction running in between then only causes already applied
+        operations to be replayed again, which is harmless.
+        """
+        snapshot_sig, journal_sig = signature
+        snapshot = self._snapshot
+        cached_snapshot_sig, cached_journal_sig = snapshot[2] if snapshot is not None else (None, None)
+
+        if (snapshot is not None and snapshot_sig == cached_snapshot_sig
+                and journal_sig is not None and cached_journal_sig is not None
+                and journal_sig[2] == cached_journal_sig[2]
+                and journal_sig[1] >= cached_journal_sig[1]):
+            # The cached signature holds the journal offset consumed by this snapshot
+            operations, offset = read_journal(self._journal_path, cached_journal_sig[1])
+            data = self._apply_journal(list(snapshot[0]), operations)
+        else:
+            operations, offset = read_journal(self._journal_path)
+            try:
+                with open(self._file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                data = []
+            data = self._apply_journal(data, operations)
+            self._cache_reloads += 1
+
+        if journal_sig is not None:
+            # Remember consumed size, a partially written line is re-read later
+            journal_sig = (journal_sig[0], offset, journal_sig[2])
+        return self._set_cache(data, (snapshot_sig, journal_sig))
+
+    def _apply_journal(self, data: List[dict], operations: List[dict]) -> List[dict]:
+        """Applies journal operations ('put' / 'delete') to records."""
+        if not operations:
+            return data
+
+        index = {}
+        for position, item in enumerate(data):
+            index.setdefault(self._normalize_id(item.get('id')), position)
+
+        for operation in operations:
+            if operation.get('op') == 'put':
+                record = operation.get('record', {})
+                key = self._normalize_id(record.get('id'))
+                position = index.get(key)
+                if position is None:
+                    index[key] = len(data)
+                    data.append(record)
+                else:
+                    data[position] = record
+            elif operation.get('op') == 'delete':
+                position = index.pop(self._normalize_id(operation.get('id')), None)
+                if position is not None:
+                    data[position] = None
+
+        return [item for item in data if item is not None]
+
+    def _find(self, entity_id: Any) -> Optional[dict]:
+        """Returns cached record by ID (shared with the cache, must not be modified)."""
+        data, index = self._get_cached()
+        position = index.get(self._normalize_id(entity_id))
+        return None if position is None else data[position]
+
+    def _load_data(self) -> List[dict]:
+        """
+        Loads data from JSON file.
+
+        The parsed list is cached and reused until the file signature
+        changes, so repeated reads do not parse the file again.
+        Returns a shallow copy, callers may append/remove items freely.
+        """
+        return list(self._get_cached()[0])
 
     def _save_data(self, data: List[dict]) -> None:
-        """Saves data to JSON file."""
-        with open(self._file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """
+        Saves data to JSON file atomically.
+
+        Callers that read before writing should hold self._locked().
+        """
+        atomic_write_json(self._file_path, data)
+        if self._journaled:
+            # Snapshot now contains everything, start an empty journal (new inode)
+            fd, tmp_path = tempfile.mkstemp(dir=self._data_dir, prefix='.' + os.path.basename(self._journal_path),
+                                            suffix='.tmp')
+            os.close(fd)
+            _copy_mode(self._journal_path, tmp_path)
+            os.replace(tmp_path, self._journal_path)
+        self._set_cache(list(data), self._file_signature())
+
+    def _commit(self, data: List[dict], operation: dict) -> None:
+        """
+        Persists a single mutation.
+
+        Appends the operation to the journal in journaled mode,
+        otherwise rewrites the whole file. Must be called under self._locked().
+        """
+        if not self._journaled:
+            self._save_data(data)
+            return
+
+        line = json.dumps(operation, ensure_ascii=False) + '\n'
+        with open(self._journal_path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+        snapshot_sig, journal_sig = self._file_signature()
+        self._set_cache(data, (snapshot_sig, journal_sig))
+
+        if journal_sig[1] > self._journal_max_bytes:
+            self._schedule_compaction()
+
+    def compact(self) -> None:
+        """Writes journal into the snapshot and truncates the journal."""
+        with self._locked():
+            self._save_data(self._load_data())
+
+    def _schedule_compaction(self) -> None:
+        """Starts compaction in a background thread (one at a time)."""
+        if self._compacting:
+            return
+        self._compacting = True
+        threading.Thread(target=self._compact_in_background, daemon=True).start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        finally:
+            self._compacting = False
+
+    def invalidate_cache(self) -> None:
+        """Drops cached data, next read will parse the file again."""
+        self._snapshot = None
+
+    def get_cache_stats(self) -> dict:
+        """
+        Returns cache counters.
+
+        Returns:
+            {'hits': n, 'reloads': m}
+        """
+        return {'hits': self._cache_hits, 'reloads': self._cache_reloads}
 
     @abstractmethod
     def _to_entity(self, data: dict) -> T:
@@ -73,49 +409,74 @@ class BaseRepository(ABC, Generic[T]):
 
     def get_by_id(self, entity_id: str) -> Optional[T]:
         """Returns record by ID."""
-        data = self._load_data()
-        for item in data:
-            if item.get('id') == entity_id:
-                return self._to_entity(item)
-        return None
+        item = self._find(entity_id)
+        return None if item is None else self._to_entity(item)
 
     def create(self, entity: T) -> T:
         """Creates new record."""
-        data = self._load_data()
-        entity_dict = self._to_dict(entity)
-        data.append(entity_dict)
-        self._save_data(data)
+        with self._locked():
+            data = self._load_data()
+            entity_dict = self._to_dict(entity)
+            data.append(entity_dict)
+            self._commit(data, {'op': 'put', 'record': entity_dict})
         return entity
 
     def update(self, entity: T) -> Optional[T]:
         """Updates existing record."""
-        data = self._load_data()
-        entity_dict = self._to_dict(entity)
-        entity_id = entity_dict.get('id')
+        with self._locked():
+            data, index = self._get_cached()
+            entity_dict = self._to_dict(entity)
+            position = index.get(self._normalize_id(entity_dict.get('id')))
+            if position is None:
+                return None
 
-        for i, item in enumerate(data):
-            if item.get('id') == entity_id:
-                data[i] = entity_dict
-                self._save_data(data)
-                return entity
-        return None
+            data = list(data)
+            data[position] = entity_dict
+            self._commit(data, {'op': 'put', 'record': entity_dict})
+        return entity
 
     def delete(self, entity_id: str) -> bool:
         """Deletes record by ID."""
-        data = self._load_data()
-        initial_length = len(data)
-        data = [item for item in data if item.get('id') != entity_id]
+        with self._locked():
+            data, index = self._get_cached()
+            position = index.get(self._normalize_id(entity_id))
+            if position is None:
+                return False
 
-        if len(data) < initial_length:
-            self._save_data(data)
-            return True
-        return False
+            data = list(data)
+            del data[position]
+            self._commit(data, {'op': 'delete', 'id': self._normalize_id(entity_id)})
+        return True
 
     def count(self) -> int:
         """Returns number of records."""
-        return len(self._load_data())
+        return len(self._get_cached()[0])
 
     def exists(self, entity_id: str) -> bool:
         """Checks if record exists."""
-        return self.get_by_id(entity_id) is not None
+        return self._find(entity_id) is not None
+
+    @staticmethod
+    def _matches(item: dict, criteria: dict) -> bool:
+        """Checks record fields against criteria (strings are case-insensitive)."""
+        for field, expected in criteria.items():
+            value = item.get(field)
+            if isinstance(expected, str) and isinstance(value, str):
+                if value.lower() != expected.lower():
+                    return False
+            elif value != expected:
+                return False
+        return True
+
+    def find_by(self, **criteria: Any) -> List[T]:
+        """
+        Returns records whose fields equal the given values.
+
+        Example:
+            repo.find_by(teacher_id='335', is_approved=True)
+        """
+        return [
+            self._to_entity(item) for item in self._get_cached()[0]
+            if self._matches(item, criteria)
+        ]
 
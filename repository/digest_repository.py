@@ -0,0 +1,128 @@
+"""
+News Digest Repository
+
+News waiting to be sent to digest subscribers, stored in a table of the
+shared SQLite database (data/sdu.sqlite3). One row per (subscriber, news),
+so a news updated several times within a window is sent once.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import List
+
+from repository.sqlite_repository import SQLITE_FILE
+
+TABLE = 'news_digest'
+
+
+class DigestRepository:
+    """Repository of pending digest items."""
+
+    def __init__(self, data_dir: str = None):
+        """
+        Initialize repository.
+
+        Args:
+            data_dir: Data directory (database file is created there)
+        """
+        if data_dir is None:
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+
+        os.makedirs(data_dir, exist_ok=True)
+        self._db_path = os.path.join(data_dir, SQLITE_FILE)
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {TABLE} ('
+            f'subscriber_id TEXT NOT NULL, '
+            f'news_id TEXT NOT NULL, '
+            f'frequency TEXT NOT NULL, '
+            f'added_at REAL NOT NULL, '
+            f'PRIMARY KEY (subscriber_id, news_id))'
+        )
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{TABLE}_due ON {TABLE} (frequency, added_at)')
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns connection of the current thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def add(self, subscriber_id: str, news_id: str, frequency: str) -> None:
+        """Adds news to subscriber's next digest (keeps the time it was first added)."""
+        self._connection().execute(
+            f'INSERT INTO {TABLE} (subscriber_id, news_id, frequency, added_at) VALUES (?, ?, ?, ?) '
+            f'ON CONFLICT (subscriber_id, news_id) DO UPDATE SET frequency = excluded.frequency',
+            (subscriber_id, news_id, frequency, time.time())
+        )
+
+    def set_frequency(self, subscriber_id: str, frequency: str) -> None:
+        """Moves pending items of subscriber to another digest frequency."""
+        self._connection().execute(
+            f'UPDATE {TABLE} SET frequency = ? WHERE subscriber_id = ?', (frequency, subscriber_id)
+        )
+
+    def remove_subscriber(self, subscriber_id: str) -> int:
+        """
+        Deletes pending items of subscriber.
+
+        Returns:
+            Number of deleted items
+        """
+        return self._connection().execute(
+            f'DELETE FROM {TABLE} WHERE subscriber_id = ?', (subscriber_id,)
+        ).rowcount
+
+    def get_due_subscribers(self, frequency: str, before: float, after_id: str = '',
+                            limit: int = 500) -> List[str]:
+        """
+        Returns subscribers with items added before `before`, one page at a time.
+
+        Args:
+            frequency: Digest frequency
+            before: Unix time, end of the digest window
+            after_id: Last subscriber ID of the previous page
+            limit: Page size
+
+        Returns:
+            Subscriber IDs in ascending order
+        """
+        rows = self._connection().execute(
+            f'SELECT DISTINCT subscriber_id FROM {TABLE} '
+            f'WHERE frequency = ? AND added_at < ? AND subscriber_id > ? '
+            f'ORDER BY subscriber_id LIMIT ?',
+            (frequency, before, after_id, limit)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_items(self, subscriber_id: str, before: float) -> List[str]:
+        """Returns IDs of news added to subscriber's digest before `before`, oldest first."""
+        rows = self._connection().execute(
+            f'SELECT news_id FROM {TABLE} WHERE subscriber_id = ? AND added_at < ? ORDER BY added_at',
+            (subscriber_id, before)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def remove_items(self, subscriber_ids: List[str], before: float) -> None:
+        """Deletes sent items of subscribers (added before `before`)."""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(
+                f'DELETE FROM {TABLE} WHERE subscriber_id = ? AND added_at < ?',
+                [(subscriber_id, before) for subscriber_id in subscriber_ids]
+            )
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def count(self) -> int:
+        """Returns number of pending items."""
+        return self._connection().execute(f'SELECT COUNT(*) FROM {TABLE}').fetchone()[0]
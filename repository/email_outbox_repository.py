@@ -0,0 +1,275 @@
+"""
+Email Outbox Repository
+
+Durable queue of outgoing emails, stored in a table of the shared SQLite
+database (data/sdu.sqlite3). Workers claim a few messages at a time, so
+tens of thousands of queued notifications are never loaded at once.
+
+Delivery is at-least-once: a claimed message is leased for `lease`
+seconds; if its worker dies before marking it sent, the message becomes
+claimable again when the lease expires (also by another process).
+A message with an idempotency key is queued at most once per key.
+Each row records its owner (the outbox that queued or last claimed it),
+so a process can wait for its own messages at shutdown.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+from models.email_message import EmailMessage
+from repository.sqlite_repository import SQLITE_FILE
+
+TABLE = 'email_outbox'
+
+
+class EmailOutboxRepository:
+    """Repository of queued, sent and failed emails."""
+
+    def __init__(self, data_dir: str = None):
+        """
+        Initialize repository.
+
+        Args:
+            data_dir: Data directory (database file is created there)
+        """
+        if data_dir is None:
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+
+        os.makedirs(data_dir, exist_ok=True)
+        self._db_path = os.path.join(data_dir, SQLITE_FILE)
+        self._local = threading.local()
+
+        conn = self._connection()
+        conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {TABLE} ('
+            f'pk INTEGER PRIMARY KEY AUTOINCREMENT, '
+            f'id TEXT NOT NULL UNIQUE, '
+            f'key TEXT UNIQUE, '
+            f'kind TEXT NOT NULL, '
+            f'to_email TEXT NOT NULL, '
+            f'subject TEXT NOT NULL, '
+            f'body TEXT NOT NULL, '
+            f'html INTEGER NOT NULL, '
+            f'payload TEXT NOT NULL, '
+            f'status TEXT NOT NULL, '
+            f'attempts INTEGER NOT NULL, '
+            f'error TEXT NOT NULL, '
+            f'available_at REAL NOT NULL, '
+            f'created_at TEXT NOT NULL, '
+            f'sent_at TEXT NOT NULL, '
+            f"owner TEXT NOT NULL DEFAULT '')"
+        )
+        columns = {row[1] for row in conn.execute(f'PRAGMA table_info({TABLE})')}
+        if 'owner' not in columns:
+            # Outbox created before owners were recorded
+            conn.execute(f"ALTER TABLE {TABLE} ADD COLUMN owner TEXT NOT NULL DEFAULT ''")
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{TABLE}_due ON {TABLE} (status, available_at)')
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns connection of the current thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Runs the block in a write transaction."""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    # ==========================================
+    # Row mapping
+    # ==========================================
+
+    _COLUMNS = ('id', 'key', 'kind', 'to_email', 'subject', 'body', 'html', 'payload',
+                'status', 'attempts', 'error', 'available_at', 'created_at', 'sent_at')
+
+    @staticmethod
+    def _row(message: EmailMessage) -> tuple:
+        return (message.id, message.key or None, message.kind, message.to_email,
+                message.subject, message.body, int(message.html),
+                json.dumps(message.payload, ensure_ascii=False), message.status,
+                message.attempts, message.error, message.available_at,
+                message.created_at, message.sent_at)
+
+    def _to_entity(self, row: tuple) -> EmailMessage:
+        data = dict(zip(self._COLUMNS, row))
+        data['key'] = data['key'] or ''
+        data['html'] = bool(data['html'])
+        data['payload'] = json.loads(data['payload'])
+        return EmailMessage.from_dict(data)
+
+    def _select(self, where: str, params: tuple = ()) -> List[EmailMessage]:
+        rows = self._connection().execute(
+            f'SELECT {", ".join(self._COLUMNS)} FROM {TABLE} {where}', params
+        ).fetchall()
+        return [self._to_entity(row) for row in rows]
+
+    # ==========================================
+    # Queue
+    # ==========================================
+
+    def add(self, message: EmailMessage, owner: str = '') -> bool:
+        """
+        Queues message.
+
+        Returns:
+            False if a message with the same idempotency key was already queued
+        """
+        return self.add_many([message], owner) == 1
+
+    def add_many(self, messages: Iterable[EmailMessage], owner: str = '') -> int:
+        """
+        Queues messages in one transaction, skipping already used idempotency keys.
+
+        Args:
+            messages: Messages to queue
+            owner: ID of the queueing outbox
+
+        Returns:
+            Number of queued messages
+        """
+        placeholders = ', '.join('?' * (len(self._COLUMNS) + 1))
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                f'INSERT OR IGNORE INTO {TABLE} ({", ".join(self._COLUMNS)}, owner) VALUES ({placeholders})',
+                (self._row(message) + (owner,) for message in messages)
+            )
+            return conn.total_changes - before
+
+    def claim(self, limit: int, lease: float, ignore_backoff: bool = False,
+              owner: str = '', own_only: bool = False) -> List[EmailMessage]:
+        """
+        Takes due messages for delivery.
+
+        Claimed messages are marked as sending and hidden from other workers
+        for `lease` seconds.
+
+        Args:
+            limit: Maximum number of messages
+            lease: Seconds before an unfinished message can be claimed again
+            ignore_backoff: Also take queued messages waiting for a retry
+            owner: ID of the claiming outbox
+            own_only: Take only messages queued or claimed by `owner` (at shutdown)
+
+        Returns:
+            Claimed messages, oldest first
+        """
+        now = time.time()
+        due = ("(status = 'queued' OR (status = 'sending' AND available_at <= :now))" if ignore_backoff
+               else "status IN ('queued', 'sending') AND available_at <= :now")
+        if own_only:
+            due += ' AND owner = :owner'
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f'SELECT {", ".join(self._COLUMNS)} FROM {TABLE} WHERE {due} ORDER BY pk LIMIT :limit',
+                {'now': now, 'limit': limit, 'owner': owner}
+            ).fetchall()
+            messages = [self._to_entity(row) for row in rows]
+            for message in messages:
+                message.status = EmailMessage.SENDING
+                message.attempts += 1
+                message.available_at = now + lease
+            conn.executemany(
+                f"UPDATE {TABLE} SET status = ?, attempts = ?, available_at = ?, owner = ? WHERE id = ?",
+                [(m.status, m.attempts, m.available_at, owner, m.id) for m in messages]
+            )
+        return messages
+
+    def mark_sent(self, messages: List[EmailMessage]) -> None:
+        """Marks messages as delivered (in one transaction)."""
+        with self._transaction() as conn:
+            conn.executemany(
+                f"UPDATE {TABLE} SET status = 'sent', error = '', sent_at = ? WHERE id = ?",
+                [(message.sent_at, message.id) for message in messages]
+            )
+        for message in messages:
+            message.status = EmailMessage.SENT
+            message.error = ''
+
+    def mark_failed(self, message: EmailMessage, error: str) -> None:
+        """Marks message as undeliverable."""
+        self._set(message, EmailMessage.FAILED, error)
+
+    def mark_retry(self, message: EmailMessage, error: str, delay: float) -> None:
+        """Returns message to the queue, due after `delay` seconds."""
+        message.available_at = time.time() + delay
+        self._set(message, EmailMessage.QUEUED, error)
+
+    def _set(self, message: EmailMessage, status: str, error: str = '') -> None:
+        message.status = status
+        message.error = error
+        self._connection().execute(
+            f'UPDATE {TABLE} SET status = ?, error = ?, available_at = ? WHERE id = ?',
+            (status, error, message.available_at, message.id)
+        )
+
+    # ==========================================
+    # Status
+    # ==========================================
+
+    def get_by_id(self, message_id: str) -> Optional[EmailMessage]:
+        """Returns message by ID."""
+        messages = self._select('WHERE id = ?', (message_id,))
+        return messages[0] if messages else None
+
+    def get_by_key(self, key: str) -> Optional[EmailMessage]:
+        """Returns message by idempotency key."""
+        messages = self._select('WHERE key = ?', (key,))
+        return messages[0] if messages else None
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Returns number of messages per status."""
+        rows = self._connection().execute(
+            f'SELECT status, COUNT(*) FROM {TABLE} GROUP BY status'
+        ).fetchall()
+        return dict(rows)
+
+    def count_pending(self, owner: str = None) -> int:
+        """
+        Returns number of queued and sending messages.
+
+        Args:
+            owner: Count only messages queued or last claimed by this outbox
+        """
+        if owner is None:
+            return self._connection().execute(
+                f"SELECT COUNT(*) FROM {TABLE} WHERE status IN ('queued', 'sending')"
+            ).fetchone()[0]
+        return self._connection().execute(
+            f"SELECT COUNT(*) FROM {TABLE} WHERE status IN ('queued', 'sending') AND owner = ?", (owner,)
+        ).fetchone()[0]
+
+    def next_due_at(self) -> Optional[float]:
+        """Returns time when the next message becomes due (None if nothing is pending)."""
+        return self._connection().execute(
+            f"SELECT MIN(available_at) FROM {TABLE} WHERE status IN ('queued', 'sending')"
+        ).fetchone()[0]
+
+    def purge(self, older_than: float) -> int:
+        """
+        Deletes sent and failed messages created more than `older_than` seconds ago.
+
+        Returns:
+            Number of deleted messages
+        """
+        cutoff = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(time.time() - older_than))
+        cursor = self._connection().execute(
+            f"DELETE FROM {TABLE} WHERE status IN ('sent', 'failed') AND created_at < ?", (cutoff,)
+        )
+        return cursor.rowcount
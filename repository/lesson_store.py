@@ -0,0 +1,240 @@
+"""
+Lesson Store
+
+Single in-memory table of all lessons, shared by ScheduleRepository
+(lessons grouped by teacher) and CabinetRepository (lessons grouped by cabinet).
+Every lesson is stored once as a slotted CabinetLesson record. Records
+reference shared Teacher and Cabinet objects, and repeated strings
+(course names, codes, times, lesson types) are interned.
+
+Compact file format (lessons.json):
+{
+    "columns": ["id", "code", ..., "week_id", "teacher_id", "cabinet_id"],
+    "teachers": { "teacher_id": {teacher}, ... },
+    "cabinets": { "cabinet_id": {cabinet}, ... },
+    "lessons": [ [row], [row], ... ],
+    "by_teacher": { "teacher_id": [row index, ...], ... },
+    "by_cabinet": { "cabinet_id": [row index, ...], ... }
+}
+
+If lessons.json is missing, the legacy pair schedules.json (by teacher) and
+cabinet_schedules.json (by cabinet) is loaded instead. Convert it with:
+
+    python -m repository.lesson_store [data_dir]
+"""
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+from models.room import Cabinet, CabinetLesson
+from models.teacher import Teacher
+from repository.base_repository import atomic_write_json
+
+LESSONS_FILE = 'lessons.json'
+LEGACY_TEACHER_FILE = 'schedules.json'
+LEGACY_CABINET_FILE = 'cabinet_schedules.json'
+
+LESSON_FIELDS = ['id', 'code', 'section', 'type', 'name_en', 'name_kz',
+                 'start_time', 'end_time', 'week_id']
+
+
+class LessonStore:
+    """Normalized lesson table with by-teacher and by-cabinet views."""
+
+    def __init__(self, data_dir: str = None):
+        if data_dir is None:
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+        self._data_dir = data_dir
+        self._lessons: List[CabinetLesson] = []
+        # Raw teacher/cabinet dicts as stored in the file (kept for write_compact)
+        self._teachers: Dict[str, dict] = {}
+        self._cabinets: Dict[str, dict] = {}
+        self.teachers: Dict[str, Teacher] = {}
+        self.cabinets: Dict[str, Cabinet] = {}
+        self.by_teacher: Dict[str, List[CabinetLesson]] = {}
+        self.by_cabinet: Dict[str, List[CabinetLesson]] = {}
+        self._load()
+
+    # ==========================================
+    # Loading
+    # ==========================================
+
+    def _load(self) -> None:
+        """Loads compact file (falling back to the legacy pair) and builds records."""
+        compact_path = os.path.join(self._data_dir, LESSONS_FILE)
+        if os.path.exists(compact_path):
+            lessons, by_teacher, by_cabinet = self._load_compact(compact_path)
+        else:
+            lessons, by_teacher, by_cabinet = self._load_legacy()
+
+        self.teachers = {key: self._to_teacher(data) for key, data in self._teachers.items()}
+        self.cabinets = {key: self._to_cabinet(data) for key, data in self._cabinets.items()}
+
+        records = {id(lesson): self._to_record(lesson) for lesson in lessons}
+        self._lessons = list(records.values())
+        self.by_teacher = {key: [records[id(lesson)] for lesson in items]
+                           for key, items in by_teacher.items()}
+        self.by_cabinet = {key: [records[id(lesson)] for lesson in items]
+                           for key, items in by_cabinet.items()}
+
+    # ==========================================
+    # Records
+    # ==========================================
+
+    @staticmethod
+    def _intern(value):
+        return sys.intern(value) if isinstance(value, str) else value
+
+    def _to_teacher(self, data: dict) -> Teacher:
+        teacher = Teacher.from_dict(data)
+        teacher.full_name_en = self._intern(teacher.full_name_en)
+        teacher.full_name_kz = self._intern(teacher.full_name_kz)
+        teacher.level = self._intern(teacher.level)
+        return teacher
+
+    def _to_cabinet(self, data: dict) -> Cabinet:
+        cabinet = Cabinet.from_dict(data)
+        cabinet.name = self._intern(cabinet.name)
+        cabinet.parent_building_en = self._intern(cabinet.parent_building_en)
+        return cabinet
+
+    def _to_record(self, lesson: dict) -> CabinetLesson:
+        """Converts lesson dict to record sharing Teacher/Cabinet objects."""
+        teacher = lesson.get('teacher')
+        cabinet = lesson.get('cabinet')
+        intern = self._intern
+        return CabinetLesson(
+            id=lesson.get('id', 0),
+            code=intern(lesson.get('code', '')),
+            section=intern(lesson.get('section', '')),
+            type=intern(lesson.get('type', '')),
+            name_en=intern(lesson.get('name_en', '')),
+            name_kz=intern(lesson.get('name_kz', '')),
+            start_time=intern(lesson.get('start_time', '')),
+            end_time=intern(lesson.get('end_time', '')),
+            week_id=lesson.get('week_id', 0),
+            teacher=self.teachers.get(str(teacher.get('id'))) if teacher else None,
+            cabinet=self.cabinets.get(str(cabinet.get('id'))) if cabinet else None
+        )
+
+    @staticmethod
+    def _read_json(path: str, default):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return default
+
+    def _load_compact(self, path: str) -> tuple:
+        """Loads lesson dicts and both views from compact file."""
+        data = self._read_json(path, {})
+        columns = data.get('columns', LESSON_FIELDS + ['teacher_id', 'cabinet_id'])
+        self._teachers = data.get('teachers', {})
+        self._cabinets = data.get('cabinets', {})
+
+        lessons = []
+        for row in data.get('lessons', []):
+            lesson = dict(zip(columns, row))
+            teacher_id = lesson.pop('teacher_id', None)
+            cabinet_id = lesson.pop('cabinet_id', None)
+            lesson['teacher'] = self._teachers.get(str(teacher_id)) if teacher_id is not None else None
+            lesson['cabinet'] = self._cabinets.get(str(cabinet_id)) if cabinet_id is not None else None
+            lessons.append(lesson)
+
+        by_teacher = {key: [lessons[i] for i in rows]
+                      for key, rows in data.get('by_teacher', {}).items()}
+        by_cabinet = {key: [lessons[i] for i in rows]
+                      for key, rows in data.get('by_cabinet', {}).items()}
+        return lessons, by_teacher, by_cabinet
+
+    def _load_legacy(self) -> tuple:
+        """Loads and merges schedules.json and cabinet_schedules.json."""
+        by_cabinet = self._read_json(os.path.join(self._data_dir, LEGACY_CABINET_FILE), {})
+        by_teacher = self._read_json(os.path.join(self._data_dir, LEGACY_TEACHER_FILE), {})
+
+        lessons_by_id: Dict[str, dict] = {}
+        by_cabinet = {key: [self._canonical(lesson, lessons_by_id) for lesson in lessons]
+                      for key, lessons in by_cabinet.items()}
+        by_teacher = {key: [self._canonical(lesson, lessons_by_id) for lesson in lessons]
+                      for key, lessons in by_teacher.items()}
+        return list(lessons_by_id.values()), by_teacher, by_cabinet
+
+    def _canonical(self, lesson: dict, lessons_by_id: Dict[str, dict]) -> dict:
+        """Returns the canonical copy of a lesson, collecting teacher and cabinet dicts."""
+        lesson_id = str(lesson.get('id'))
+        if lesson_id in lessons_by_id:
+            return lessons_by_id[lesson_id]
+
+        teacher = lesson.get('teacher')
+        if teacher:
+            lesson['teacher'] = self._teachers.setdefault(str(teacher.get('id')), teacher)
+        cabinet = lesson.get('cabinet')
+        if cabinet:
+            lesson['cabinet'] = self._cabinets.setdefault(str(cabinet.get('id')), cabinet)
+
+        lessons_by_id[lesson_id] = lesson
+        return lesson
+
+    # ==========================================
+    # Conversion
+    # ==========================================
+
+    def to_compact(self) -> dict:
+        """Returns lessons in compact file format."""
+        positions = {id(lesson): i for i, lesson in enumerate(self._lessons)}
+        rows = []
+        for lesson in self._lessons:
+            row = [getattr(lesson, field) for field in LESSON_FIELDS]
+            row.append(self._teachers[lesson.teacher.id]['id'] if lesson.teacher else None)
+            row.append(lesson.cabinet.id if lesson.cabinet else None)
+            rows.append(row)
+
+        return {
+            'columns': LESSON_FIELDS + ['teacher_id', 'cabinet_id'],
+            'teachers': self._teachers,
+            'cabinets': self._cabinets,
+            'lessons': rows,
+            'by_teacher': {key: [positions[id(lesson)] for lesson in lessons]
+                           for key, lessons in self.by_teacher.items()},
+            'by_cabinet': {key: [positions[id(lesson)] for lesson in lessons]
+                           for key, lessons in self.by_cabinet.items()},
+        }
+
+    def write_compact(self, path: str = None) -> str:
+        """
+        Writes lessons to compact file.
+
+        Args:
+            path: Output file (default: lessons.json in data directory)
+
+        Returns:
+            Path of the written file
+        """
+        path = path or os.path.join(self._data_dir, LESSONS_FILE)
+        atomic_write_json(path, self.to_compact(), indent=None)
+        return path
+
+    def count(self) -> int:
+        """Returns number of lessons."""
+        return len(self._lessons)
+
+
+_stores: Dict[str, LessonStore] = {}
+
+
+def get_lesson_store(data_dir: str = None) -> LessonStore:
+    """Returns shared lesson store for the data directory."""
+    if data_dir is None:
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+    key = os.path.abspath(data_dir)
+    if key not in _stores:
+        _stores[key] = LessonStore(data_dir)
+    return _stores[key]
+
+
+if __name__ == '__main__':
+    target_dir: Optional[str] = sys.argv[1] if len(sys.argv) > 1 else None
+    store = LessonStore(target_dir)
+    output = store.write_compact()
+    print(f"[LessonStore] Wrote {store.count()} lessons to {output}")
@@ -1,14 +1,17 @@
 """
 News Repository
 """
-from typing import List, Optional
-from repository.base_repository import BaseRepository
+from typing import List, Optional, Dict
+from repository.backend import StorageRepository
 from models.news import News
 
 
-class NewsRepository(BaseRepository[News]):
+class NewsRepository(StorageRepository[News]):
     """Repository for working with news."""
 
+    _indexed_fields = ('category',)
+    _journaled = True
+
     def __init__(self, data_dir: str = None):
         super().__init__('news.json', data_dir)
 
@@ -34,11 +37,7 @@ class NewsRepository(BaseRepository[News]):
 
     def find_by_category(self, category: str) -> List[News]:
         """Finds news by category."""
-        all_news = self.get_all()
-        result = [
-            n for n in all_news
-            if n.category.lower() == category.lower() and n.is_published
-        ]
+        result = self.find_by(category=category, is_published=True)
         return sorted(result, key=lambda n: n.created_at, reverse=True)
 
     def search(self, query: str) -> List[News]:
@@ -54,15 +53,39 @@ class NewsRepository(BaseRepository[News]):
 
     def increment_views(self, news_id: str) -> Optional[News]:
         """Increments view counter."""
-        news = self.get_by_id(news_id)
-        if news:
-            news.views_count += 1
-            return self.update(news)
-        return None
+        with self._locked():
+            news = self.get_by_id(news_id)
+            if news:
+                news.views_count += 1
+                return self.update(news)
+            return None
+
+    def add_views(self, deltas: Dict[str, int]) -> None:
+        """
+        Adds view counts in one locked read-modify-write cycle.
+
+        Args:
+            deltas: {news_id: views to add}
+        """
+        with self._locked():
+            for news_id, delta in deltas.items():
+                news = self.get_by_id(news_id)
+                if news:
+                    news.views_count += delta
+                    self.update(news)
 
-    def get_popular(self, limit: int = 5) -> List[News]:
-        """Returns popular news."""
+    def get_popular(self, limit: int = 5, pending_views: Dict[str, int] = None) -> List[News]:
+        """
+        Returns popular news.
+
+        Args:
+            limit: Number of news
+            pending_views: Views not yet stored {news_id: views}, added to counters
+        """
         published = self.get_published()
+        if pending_views:
+            for news in published:
+                news.views_count += pending_views.get(news.id, 0)
         return sorted(published, key=lambda n: n.views_count, reverse=True)[:limit]
 
     def get_categories(self) -> List[str]:
@@ -73,17 +96,56 @@ class NewsRepository(BaseRepository[News]):
 
     def publish(self, news_id: str) -> Optional[News]:
         """Publishes news."""
-        news = self.get_by_id(news_id)
-        if news:
-            news.is_published = True
+        with self._locked():
+            news = self.get_by_id(news_id)
+            if news:
+                news.is_published = True
+                return self.update(news)
+            return None
+
+    def update_fields(self, news_id: str, data: dict) -> Optional[News]:
+        """
+        Changes given fields in one locked read-modify-write cycle, so
+        concurrently stored fields (e.g. flushed views) are not overwritten.
+
+        Args:
+            news_id: News ID
+            data: {field: new value}, unknown fields are ignored
+        """
+        with self._locked():
+            news = self.get_by_id(news_id)
+            if not news:
+                return None
+            for key, value in data.items():
+                if hasattr(news, key):
+                    setattr(news, key, value)
+            return self.update(news)
+
+    def set_translations(self, news_id: str, translations: dict, source: dict) -> Optional[News]:
+        """
+        Stores translations if the translated fields are unchanged.
+
+        Args:
+            news_id: News ID
+            translations: {lang: {title, content, category, author}}
+            source: Field values the translations were made from
+
+        Returns:
+            Updated news, or None if news is gone or was edited meanwhile
+        """
+        with self._locked():
+            news = self.get_by_id(news_id)
+            if not news or any(getattr(news, key) != value for key, value in source.items()):
+                return None
+            news.translations = translations
             return self.update(news)
-        return None
 
     def unpublish(self, news_id: str) -> Optional[News]:
         """Unpublishes news."""
-        news = self.get_by_id(news_id)
-        if news:
-            news.is_published = False
-            return self.update(news)
-        return None
+        with self._locked():
+            news = self.get_by_id(news_id)
+            if news:
+                news.is_published = False
+                return self.update(news)
+            return None
 
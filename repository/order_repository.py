@@ -2,13 +2,16 @@
 Order Repository
 """
 from typing import List, Optional
-from repository.base_repository import BaseRepository
+from repository.backend import StorageRepository
 from models.order import Order
 
 
-class OrderRepository(BaseRepository[Order]):
+class OrderRepository(StorageRepository[Order]):
     """Repository for working with orders."""
 
+    _indexed_fields = ('status', 'customer_email')
+    _journaled = True
+
     def __init__(self, data_dir: str = None):
         super().__init__('orders.json', data_dir)
 
@@ -20,13 +23,11 @@ class OrderRepository(BaseRepository[Order]):
 
     def find_by_email(self, email: str) -> List[Order]:
         """Finds orders by customer email."""
-        all_orders = self.get_all()
-        return [o for o in all_orders if o.customer_email.lower() == email.lower()]
+        return self.find_by(customer_email=email)
 
     def find_by_status(self, status: str) -> List[Order]:
         """Finds orders by status."""
-        all_orders = self.get_all()
-        filtered = [o for o in all_orders if o.status.lower() == status.lower()]
+        filtered = self.find_by(status=status)
         return sorted(filtered, key=lambda o: o.created_at, reverse=True)
 
     def get_pending(self) -> List[Order]:
@@ -39,11 +40,12 @@ class OrderRepository(BaseRepository[Order]):
 
     def update_status(self, order_id: str, status: str) -> Optional[Order]:
         """Updates order status."""
-        order = self.get_by_id(order_id)
-        if order:
-            order.status = status
-            return self.update(order)
-        return None
+        with self._locked():
+            order = self.get_by_id(order_id)
+            if order:
+                order.status = status
+                return self.update(order)
+            return None
 
     def confirm(self, order_id: str) -> Optional[Order]:
         """Confirms order."""
@@ -2,13 +2,15 @@
 Product Repository
 """
 from typing import List, Optional
-from repository.base_repository import BaseRepository
+from repository.backend import StorageRepository
 from models.product import Product
 
 
-class ProductRepository(BaseRepository[Product]):
+class ProductRepository(StorageRepository[Product]):
     """Repository for working with products."""
 
+    _indexed_fields = ('category',)
+
     def __init__(self, data_dir: str = None):
         super().__init__('products.json', data_dir)
 
@@ -25,11 +27,7 @@ class ProductRepository(BaseRepository[Product]):
 
     def find_by_category(self, category: str) -> List[Product]:
         """Finds products by category."""
-        all_products = self.get_all()
-        return [
-            p for p in all_products
-            if p.category.lower() == category.lower() and p.is_available
-        ]
+        return self.find_by(category=category, is_available=True)
 
     def search(self, query: str) -> List[Product]:
         """Searches products by name or description."""
@@ -51,22 +49,43 @@ class ProductRepository(BaseRepository[Product]):
 
     def decrease_stock(self, product_id: str, quantity: int = 1) -> Optional[Product]:
         """Decreases product stock."""
-        product = self.get_by_id(product_id)
-        if product and product.stock >= quantity:
-            product.stock -= quantity
-            if product.stock == 0:
-                product.is_available = False
-            return self.update(product)
-        return None
+        with self._locked():
+            product = self.get_by_id(product_id)
+            if product and product.stock >= quantity:
+                product.stock -= quantity
+                if product.stock == 0:
+                    product.is_available = False
+                return self.update(product)
+            return None
 
     def increase_stock(self, product_id: str, quantity: int) -> Optional[Product]:
         """Increases product stock."""
-        product = self.get_by_id(product_id)
-        if product:
-            product.stock += quantity
-            product.is_available = True
+        with self._locked():
+            product = self.get_by_id(product_id)
+            if product:
+                product.stock += quantity
+                product.is_available = True
+                return self.update(product)
+            return None
+
+    def set_translations(self, product_id: str, translations: dict, source: dict) -> Optional[Product]:
+        """
+        Stores translations if the translated fields are unchanged.
+
+        Args:
+            product_id: Product ID
+            translations: {lang: {name, description, category}}
+            source: Field values the translations were made from
+
+        Returns:
+            Updated product, or None if product is gone or was edited meanwhile
+        """
+        with self._locked():
+            product = self.get_by_id(product_id)
+            if not product or any(getattr(product, key) != value for key, value in source.items()):
+                return None
+            product.translations = translations
             return self.update(product)
-        return None
 
     def get_categories(self) -> List[str]:
         """Returns list of product categories."""
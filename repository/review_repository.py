@@ -2,13 +2,16 @@
 Review Repository
 """
 from typing import List, Optional
-from repository.base_repository import BaseRepository
+from repository.backend import StorageRepository
 from models.review import Review
 
 
-class ReviewRepository(BaseRepository[Review]):
+class ReviewRepository(StorageRepository[Review]):
     """Repository for working with reviews."""
 
+    _indexed_fields = ('teacher_id', 'is_approved')
+    _journaled = True
+
     def __init__(self, data_dir: str = None):
         super().__init__('reviews.json', data_dir)
 
@@ -20,29 +23,28 @@ class ReviewRepository(BaseRepository[Review]):
 
     def find_by_teacher(self, teacher_id: str, approved_only: bool = True) -> List[Review]:
         """Finds reviews for a teacher."""
-        all_reviews = self.get_all()
-        reviews = [r for r in all_reviews if r.teacher_id == teacher_id]
         if approved_only:
-            reviews = [r for r in reviews if r.is_approved]
+            reviews = self.find_by(teacher_id=teacher_id, is_approved=True)
+        else:
+            reviews = self.find_by(teacher_id=teacher_id)
         return sorted(reviews, key=lambda r: r.created_at, reverse=True)
 
     def get_pending_reviews(self) -> List[Review]:
         """Returns unapproved reviews (for moderation)."""
-        all_reviews = self.get_all()
-        return [r for r in all_reviews if not r.is_approved]
+        return self.find_by(is_approved=False)
 
     def get_approved_reviews(self) -> List[Review]:
         """Returns all approved reviews."""
-        all_reviews = self.get_all()
-        return [r for r in all_reviews if r.is_approved]
+        return self.find_by(is_approved=True)
 
     def approve_review(self, review_id: str) -> Optional[Review]:
         """Approves review."""
-        review = self.get_by_id(review_id)
-        if review:
-            review.is_approved = True
-            return self.update(review)
-        return None
+        with self._locked():
+            review = self.get_by_id(review_id)
+            if review:
+                review.is_approved = True
+                return self.update(review)
+            return None
 
     def reject_review(self, review_id: str) -> bool:
         """Rejects (deletes) review."""
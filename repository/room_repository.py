@@ -4,20 +4,34 @@ Adapted for working with real SDU data
 """
 import json
 import os
-from typing import List, Optional, Dict
-from models.room import Cabinet, CabinetLesson
+from typing import List, Optional, Dict, Tuple
+from models.room import Cabinet, CabinetLesson, TIME_SLOTS, parse_time, find_slot, slots_overlapping
+from repository.lesson_store import get_lesson_store
 
 
 class CabinetRepository:
-    """Repository for working with SDU rooms."""
+    """
+    Repository for working with SDU rooms.
+
+    Room occupancy is precomputed once as bitsets: for every (week_id, slot)
+    one int whose bit N is set when the cabinet at position N is busy.
+    Positions follow (building, name) order, so decoding a mask yields
+    cabinets already sorted.
+    """
 
     def __init__(self, data_dir: str = None):
         self._data_dir = data_dir or os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
         self._cabinets_file = os.path.join(self._data_dir, 'cabinets.json')
-        self._schedules_file = os.path.join(self._data_dir, 'cabinet_schedules.json')
         self._cabinets_cache = None
         self._schedules_cache = None
 
+        # Occupancy bitsets, built on first use
+        self._occupancy: Optional[Dict[Tuple[int, int], int]] = None
+        self._positions: Dict[str, int] = {}
+        self._cabinets_by_position: List[Optional[Cabinet]] = []
+        self._all_cabinets_mask = 0
+        self._building_masks: Dict[str, int] = {}
+
     def _load_cabinets(self) -> List[dict]:
         """Loads rooms from JSON."""
         if self._cabinets_cache is not None:
@@ -30,17 +44,11 @@ class CabinetRepository:
         except (FileNotFoundError, json.JSONDecodeError):
             return []
 
-    def _load_schedules(self) -> Dict[str, List[dict]]:
-        """Loads room schedules from JSON."""
-        if self._schedules_cache is not None:
-            return self._schedules_cache
-
-        try:
-            with open(self._schedules_file, 'r', encoding='utf-8') as f:
-                self._schedules_cache = json.load(f)
-                return self._schedules_cache
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+    def _load_schedules(self) -> Dict[str, List[CabinetLesson]]:
+        """Returns room schedules (by-cabinet view of the shared lesson store)."""
+        if self._schedules_cache is None:
+            self._schedules_cache = get_lesson_store(self._data_dir).by_cabinet
+        return self._schedules_cache
 
     def get_all(self) -> List[Cabinet]:
         """Returns all rooms."""
@@ -75,10 +83,161 @@ class CabinetRepository:
         return sorted(list(buildings))
 
     def get_cabinet_schedule(self, cabinet_id: int) -> List[CabinetLesson]:
-        """Returns room schedule."""
+        """Returns room schedule (shared lesson records, treat as read-only)."""
         schedules = self._load_schedules()
-        lessons_data = schedules.get(str(cabinet_id), [])
-        return [CabinetLesson.from_dict(item) for item in lessons_data]
+        return list(schedules.get(str(cabinet_id), []))
+
+    def _build_occupancy(self) -> None:
+        """Builds occupancy bitsets from cabinets and schedules (once)."""
+        if self._occupancy is not None:
+            return
+
+        cabinets = sorted((Cabinet.from_dict(item) for item in self._load_cabinets()),
+                          key=lambda c: (c.parent_building_en, c.name))
+        schedules = self._load_schedules()
+
+        positions = {}
+        cabinets_by_position = []
+        for cabinet in cabinets:
+            positions.setdefault(str(cabinet.id), len(cabinets_by_position))
+            cabinets_by_position.append(cabinet)
+        all_mask = (1 << len(cabinets_by_position)) - 1
+
+        # Rooms that have lessons but are missing in cabinets.json
+        for cabinet_id in schedules:
+            if cabinet_id not in positions:
+                positions[cabinet_id] = len(cabinets_by_position)
+                cabinets_by_position.append(None)
+
+        occupancy = {}
+        for cabinet_id, lessons in schedules.items():
+            bit = 1 << positions[cabinet_id]
+            for lesson in lessons:
+                start = parse_time(lesson.start_time)
+                end = parse_time(lesson.end_time)
+                if start is None or end is None:
+                    continue
+                for slot in slots_overlapping(start, end):
+                    key = (lesson.week_id, slot)
+                    occupancy[key] = occupancy.get(key, 0) | bit
+
+        self._positions = positions
+        self._cabinets_by_position = cabinets_by_position
+        self._all_cabinets_mask = all_mask
+        self._occupancy = occupancy
+
+    def _decode_mask(self, mask: int) -> List[Cabinet]:
+        """Returns cabinets whose bits are set in mask (in position order)."""
+        result = []
+        while mask:
+            low_bit = mask & -mask
+            cabinet = self._cabinets_by_position[low_bit.bit_length() - 1]
+            if cabinet is not None:
+                result.append(cabinet)
+            mask ^= low_bit
+        return result
+
+    def get_occupied_mask(self, week_id: int, time: str) -> int:
+        """
+        Returns bitset of rooms occupied at the specified time.
+
+        Args:
+            week_id: Day of week (1-6)
+            time: Time within a slot (format HH:MM or H:MM)
+        """
+        self._build_occupancy()
+        minutes = parse_time(time)
+        slot = find_slot(minutes) if minutes is not None else None
+        if slot is None:
+            return 0
+        return self._occupancy.get((week_id, slot), 0)
+
+    def get_cabinets_mask(self, building: str = None) -> int:
+        """Returns bitset of known rooms, optionally filtered by building."""
+        self._build_occupancy()
+        if not building:
+            return self._all_cabinets_mask
+
+        key = building.lower()
+        if key not in self._building_masks:
+            mask = 0
+            for position, cabinet in enumerate(self._cabinets_by_position):
+                if cabinet is not None and key in cabinet.parent_building_en.lower():
+                    mask |= 1 << position
+            self._building_masks[key] = mask
+        return self._building_masks[key]
+
+    def get_free_cabinets(self, week_id: int, time: str, building: str = None) -> List[Cabinet]:
+        """
+        Returns rooms free at the specified slot, sorted by building and name.
+
+        Args:
+            week_id: Day of week (1-6)
+            time: Time within a slot (format HH:MM or H:MM)
+            building: Building filter (optional)
+        """
+        free_mask = self.get_cabinets_mask(building) & ~self.get_occupied_mask(week_id, time)
+        return self._decode_mask(free_mask)
+
+    def get_free_cabinets_in_slots(self, week_id: int, slots: List[int], building: str = None,
+                                   next_slot: int = None) -> List[Tuple[Cabinet, Optional[int]]]:
+        """
+        Returns rooms free during all given slots and when each gets busy.
+
+        Args:
+            week_id: Day of week (1-6)
+            slots: Slot indexes in TIME_SLOTS (ascending); empty if the range
+                   falls into a break or outside the schedule (all rooms are free)
+            building: Building filter (optional)
+            next_slot: First slot after the range when `slots` is empty
+                       (None: no slots follow)
+
+        Returns:
+            List of (cabinet, index of next occupied slot after the range or None)
+        """
+        self._build_occupancy()
+
+        free_mask = self.get_cabinets_mask(building)
+        for slot in slots:
+            free_mask &= ~self._occupancy.get((week_id, slot), 0)
+
+        if slots:
+            next_slot = slots[-1] + 1
+        elif next_slot is None:
+            next_slot = len(TIME_SLOTS)
+
+        # Walk later slots once: cabinets becoming busy drop out of the running mask
+        next_busy: Dict[int, int] = {}
+        remaining = free_mask
+        for slot in range(next_slot, len(TIME_SLOTS)):
+            if not remaining:
+                break
+            busy = remaining & self._occupancy.get((week_id, slot), 0)
+            if busy:
+                for cabinet in self._decode_mask(busy):
+                    next_busy[cabinet.id] = slot
+                remaining &= ~busy
+
+        return [(cabinet, next_busy.get(cabinet.id)) for cabinet in self._decode_mask(free_mask)]
+
+    def get_next_occupied_slot(self, cabinet_id: int, week_id: int, from_slot: int) -> Optional[int]:
+        """Returns index of the first occupied slot >= from_slot or None."""
+        self._build_occupancy()
+        position = self._positions.get(str(cabinet_id))
+        if position is None:
+            return None
+        for slot in range(from_slot, len(TIME_SLOTS)):
+            if self._occupancy.get((week_id, slot), 0) >> position & 1:
+                return slot
+        return None
+
+    def is_occupied(self, cabinet_id: int, week_id: int, time: str) -> bool:
+        """Checks if room is occupied at the specified slot."""
+        self._build_occupancy()
+        position = self._positions.get(str(cabinet_id))
+        if position is None:
+            return False
+        return bool(self.get_occupied_mask(week_id, time) >> position & 1)
 
     def get_occupied_cabinets(self, week_id: int, time: str) -> set:
         """
@@ -91,16 +250,8 @@ class CabinetRepository:
         Returns:
             set: Set of occupied room IDs
         """
-        schedules = self._load_schedules()
-        occupied = set()
-
-        for cabinet_id, lessons in schedules.items():
-            for lesson in lessons:
-                if lesson.get('week_id') == week_id and lesson.get('start_time') == time:
-                    occupied.add(cabinet_id)
-                    break
-
-        return occupied
+        mask = self.get_occupied_mask(week_id, time)
+        return {cabinet_id for cabinet_id, position in self._positions.items() if mask >> position & 1}
 
     def search(self, query: str) -> List[Cabinet]:
         """Search rooms by name or building."""
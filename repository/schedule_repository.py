@@ -1,84 +1,126 @@
 """
 Schedule Repository
 
-Works with format: { "teacher_id": [ {lesson}, {lesson}, ... ], ... }
+Works with the by-teacher view of the shared lesson store:
+{ "teacher_id": [ lesson, lesson, ... ], ... }
 """
-import json
 import os
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from models.schedule import Schedule
+from models.room import parse_time, find_slot, slots_overlapping
+from repository.lesson_store import get_lesson_store
 
 
 class ScheduleRepository:
-    """Repository for working with schedules."""
+    """
+    Repository for working with schedules.
+
+    Hash indexes (by ID, room, day and day+slot) and the sorted room and
+    building lists are built once after loading, so queries cost time
+    proportional to their result. Lesson times are parsed to minutes since
+    midnight at the same point; time comparisons are done on integers.
+
+    Schedule records are created once from the shared lesson records and
+    returned by queries without copying, treat them as read-only.
+    """
 
     def __init__(self, data_dir: str = None):
         if data_dir is None:
             data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-        self._file_path = os.path.join(data_dir, 'schedules.json')
-        self._data: Dict[str, List[dict]] = {}
+        self._data_dir = data_dir
+        self._data: Dict[str, List[Schedule]] = {}
+        self._by_id: Dict[str, Schedule] = {}
+        self._by_room: Dict[str, List[Schedule]] = {}
+        self._by_day: Dict[int, List[Schedule]] = {}
+        self._by_day_slot: Dict[Tuple[int, int], List[Tuple[int, int, Schedule]]] = {}
+        self._timed_by_day: Dict[int, List[Tuple[int, int, Schedule]]] = {}
+        self._rooms: List[str] = []
+        self._buildings: List[str] = []
         self._load_data()
 
     def _load_data(self) -> None:
-        """Loads data from JSON file."""
-        try:
-            with open(self._file_path, 'r', encoding='utf-8') as f:
-                self._data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self._data = {}
+        """Loads lessons grouped by teacher from the lesson store."""
+        by_teacher = get_lesson_store(self._data_dir).by_teacher
+        self._data = {teacher_id: [Schedule.from_lesson(lesson) for lesson in lessons]
+                      for teacher_id, lessons in by_teacher.items()}
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Builds lookup indexes over all lessons."""
+        by_id, by_room, by_day, by_day_slot, timed_by_day = {}, {}, {}, {}, {}
+        rooms, buildings = set(), set()
+
+        for lessons in self._data.values():
+            for lesson in lessons:
+                by_id.setdefault(lesson.id, lesson)
+
+                week_id = lesson.week_id
+                by_day.setdefault(week_id, []).append(lesson)
+
+                start = parse_time(lesson.start_time)
+                end = parse_time(lesson.end_time)
+                if start is not None and end is not None:
+                    timed = (start, end, lesson)
+                    timed_by_day.setdefault(week_id, []).append(timed)
+                    for slot in slots_overlapping(start, end):
+                        by_day_slot.setdefault((week_id, slot), []).append(timed)
+
+                if lesson.cabinet_name is not None:
+                    name = lesson.cabinet_name
+                    by_room.setdefault(name.lower(), []).append(lesson)
+                    if name:
+                        rooms.add(name)
+                    if lesson.cabinet_building:
+                        buildings.add(lesson.cabinet_building)
+
+        self._by_id = by_id
+        self._by_room = by_room
+        self._by_day = by_day
+        self._by_day_slot = by_day_slot
+        self._timed_by_day = timed_by_day
+        self._rooms = sorted(rooms)
+        self._buildings = sorted(buildings)
 
     def get_all(self) -> List[Schedule]:
         """Returns all lessons."""
         result = []
-        for teacher_id, lessons in self._data.items():
-            for lesson_data in lessons:
-                result.append(Schedule.from_dict(lesson_data))
+        for lessons in self._data.values():
+            result.extend(lessons)
         return result
 
     def get_by_id(self, schedule_id: str) -> Optional[Schedule]:
         """Returns lesson by ID."""
-        for lessons in self._data.values():
-            for lesson_data in lessons:
-                if str(lesson_data.get('id')) == schedule_id:
-                    return Schedule.from_dict(lesson_data)
-        return None
+        return self._by_id.get(str(schedule_id))
 
     def find_by_teacher(self, teacher_id: str) -> List[Schedule]:
         """Finds teacher's schedule."""
-        lessons = self._data.get(str(teacher_id), [])
-        return [Schedule.from_dict(lesson) for lesson in lessons]
+        return list(self._data.get(str(teacher_id), []))
 
     def find_by_room(self, room: str) -> List[Schedule]:
         """Finds schedule for a room."""
-        result = []
-        room_lower = room.lower()
-        for lessons in self._data.values():
-            for lesson_data in lessons:
-                cabinet = lesson_data.get('cabinet', {})
-                if cabinet and cabinet.get('name', '').lower() == room_lower:
-                    result.append(Schedule.from_dict(lesson_data))
-        return result
+        return list(self._by_room.get(room.lower(), []))
 
     def find_by_day(self, week_id: int) -> List[Schedule]:
         """Finds schedule by day of week (1-6)."""
-        result = []
-        for lessons in self._data.values():
-            for lesson_data in lessons:
-                if lesson_data.get('week_id') == week_id:
-                    result.append(Schedule.from_dict(lesson_data))
-        return result
+        return list(self._by_day.get(week_id, []))
 
     def find_by_day_and_time(self, week_id: int, time: str) -> List[Schedule]:
         """Finds lessons by day and time."""
-        result = []
-        for lessons in self._data.values():
-            for lesson_data in lessons:
-                if lesson_data.get('week_id') == week_id:
-                    start = lesson_data.get('start_time', '')
-                    end = lesson_data.get('end_time', '')
-                    if start <= time < end:
-                        result.append(Schedule.from_dict(lesson_data))
-        return result
+        minutes = parse_time(time)
+        if minutes is None:
+            return []
+
+        slot = find_slot(minutes)
+        if slot is None:
+            # Time between slots, only lessons outside the slot grid can match
+            candidates = self._timed_by_day.get(week_id, [])
+        else:
+            candidates = self._by_day_slot.get((week_id, slot), [])
+
+        return [
+            lesson for start, end, lesson in candidates
+            if start <= minutes < end
+        ]
 
     def get_occupied_rooms(self, week_id: int, time: str) -> List[str]:
         """Returns occupied rooms at specified time."""
@@ -87,21 +129,9 @@ class ScheduleRepository:
 
     def get_all_rooms(self) -> List[str]:
         """Returns all unique rooms."""
-        rooms = set()
-        for lessons in self._data.values():
-            for lesson in lessons:
-                cabinet = lesson.get('cabinet', {})
-                if cabinet and cabinet.get('name'):
-                    rooms.add(cabinet.get('name'))
-        return sorted(list(rooms))
+        return list(self._rooms)
 
     def get_all_buildings(self) -> List[str]:
         """Returns all unique buildings."""
-        buildings = set()
-        for lessons in self._data.values():
-            for lesson in lessons:
-                cabinet = lesson.get('cabinet', {})
-                if cabinet and cabinet.get('parent_building_en'):
-                    buildings.add(cabinet.get('parent_building_en'))
-        return sorted(list(buildings))
+        return list(self._buildings)
 
@@ -0,0 +1,246 @@
+"""
+SQLite Repository
+
+Alternative storage for BaseRepository: each repository keeps its records
+in its own table of a shared SQLite database. A mutation touches one row
+instead of rewriting the whole JSON document.
+
+Table layout:
+    pk    - insertion order (get_all returns records in the same order as JSON)
+    id    - normalized record ID (unique)
+    data  - record as JSON (output of _to_dict)
+    <col> - copies of the fields listed in _indexed_fields, with an index
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import List, Optional, Any
+
+from repository.base_repository import BaseRepository, T, read_journal
+
+SQLITE_FILE = 'sdu.sqlite3'
+
+
+class SqliteRepository(BaseRepository[T]):
+    """
+    Repository stored in SQLite.
+
+    Implements the same interface as the JSON BaseRepository, so domain
+    repositories (and services using them) work with either backend.
+    """
+
+    def __init__(self, data_file: str, data_dir: str = None):
+        """
+        Initialize repository.
+
+        Args:
+            data_file: JSON file name (e.g., 'reviews.json'), used as table name
+                       and as the source for the one-shot import
+            data_dir: Data directory (database file is created there)
+        """
+        if data_dir is None:
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+
+        self._data_dir = data_dir
+        self._file_path = os.path.join(data_dir, data_file)
+        self._db_path = os.path.join(data_dir, SQLITE_FILE)
+        self._table = os.path.splitext(data_file)[0]
+
+        self._local = threading.local()
+
+        os.makedirs(data_dir, exist_ok=True)
+        self._create_schema()
+
+    # ==========================================
+    # Connection and schema
+    # ==========================================
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns connection of the current thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    def _create_schema(self) -> None:
+        """Creates table, indexes and imports JSON data on first run."""
+        columns = ''.join(f', "{field}" COLLATE NOCASE' for field in self._indexed_fields)
+        with self._locked() as conn:
+            conn.execute(
+                f'CREATE TABLE IF NOT EXISTS "{self._table}" ('
+                f'pk INTEGER PRIMARY KEY AUTOINCREMENT, '
+                f'id TEXT NOT NULL UNIQUE, '
+                f'data TEXT NOT NULL{columns})'
+            )
+            for field in self._indexed_fields:
+                conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS "idx_{self._table}_{field}" '
+                    f'ON "{self._table}" ("{field}")'
+                )
+            conn.execute('CREATE TABLE IF NOT EXISTS _imports (name TEXT PRIMARY KEY)')
+
+            imported = conn.execute('SELECT 1 FROM _imports WHERE name = ?', (self._table,)).fetchone()
+            if not imported:
+                self.import_json()
+                conn.execute('INSERT INTO _imports (name) VALUES (?)', (self._table,))
+
+    @contextmanager
+    def _locked(self):
+        """
+        Runs the block in a write transaction (BEGIN IMMEDIATE).
+
+        Re-entrant within one thread, nested blocks join the outer transaction.
+        """
+        conn = self._connection()
+        if self._local.depth == 0:
+            conn.execute('BEGIN IMMEDIATE')
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.execute('ROLLBACK')
+            raise
+        else:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.execute('COMMIT')
+
+    def import_json(self, json_path: str = None) -> int:
+        """
+        Imports records from JSON file into the table.
+
+        Called automatically once, when the table is opened the first time.
+
+        Args:
+            json_path: JSON file (default: data file of this repository)
+
+        Returns:
+            Number of imported records
+        """
+        json_path = json_path or self._file_path
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return 0
+
+        # Include mutations not yet compacted from a journaled JSON repository
+        operations, _ = read_journal(os.path.splitext(json_path)[0] + '.log')
+        data = self._apply_journal(data, operations)
+
+        with self._locked() as conn:
+            for item in data:
+                conn.execute(self._insert_sql(or_replace=True), self._row(item))
+        return len(data)
+
+    # ==========================================
+    # Row mapping
+    # ==========================================
+
+    def _row(self, item: dict) -> tuple:
+        """Converts record dictionary to row values."""
+        values = [self._normalize_id(item.get('id')), json.dumps(item, ensure_ascii=False)]
+        values.extend(item.get(field) for field in self._indexed_fields)
+        return tuple(values)
+
+    def _insert_sql(self, or_replace: bool = False) -> str:
+        columns = ['id', 'data'] + [f'"{field}"' for field in self._indexed_fields]
+        verb = 'INSERT OR REPLACE' if or_replace else 'INSERT'
+        return (f'{verb} INTO "{self._table}" ({", ".join(columns)}) '
+                f'VALUES ({", ".join("?" * len(columns))})')
+
+    def _select(self, where: str = '', params: tuple = ()) -> List[dict]:
+        rows = self._connection().execute(
+            f'SELECT data FROM "{self._table}" {where} ORDER BY pk', params
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    # ==========================================
+    # BaseRepository storage primitives
+    # ==========================================
+
+    def _load_data(self) -> List[dict]:
+        """Loads all records."""
+        return self._select()
+
+    def _save_data(self, data: List[dict]) -> None:
+        """Replaces all records of the table."""
+        with self._locked() as conn:
+            conn.execute(f'DELETE FROM "{self._table}"')
+            conn.executemany(self._insert_sql(), [self._row(item) for item in data])
+
+    def invalidate_cache(self) -> None:
+        """SQLite backend has no repository-level cache."""
+
+    def get_cache_stats(self) -> dict:
+        """SQLite backend has no repository-level cache."""
+        return {'hits': 0, 'reloads': 0}
+
+    # ==========================================
+    # CRUD
+    # ==========================================
+
+    def get_all(self) -> List[T]:
+        """Returns all records."""
+        return [self._to_entity(item) for item in self._select()]
+
+    def get_by_id(self, entity_id: str) -> Optional[T]:
+        """Returns record by ID."""
+        data = self._select('WHERE id = ?', (self._normalize_id(entity_id),))
+        return self._to_entity(data[0]) if data else None
+
+    def create(self, entity: T) -> T:
+        """Creates new record."""
+        with self._locked() as conn:
+            conn.execute(self._insert_sql(), self._row(self._to_dict(entity)))
+        return entity
+
+    def update(self, entity: T) -> Optional[T]:
+        """Updates existing record."""
+        row = self._row(self._to_dict(entity))
+        assignments = ', '.join(['data = ?'] + [f'"{field}" = ?' for field in self._indexed_fields])
+        with self._locked() as conn:
+            cursor = conn.execute(
+                f'UPDATE "{self._table}" SET {assignments} WHERE id = ?',
+                row[1:] + row[:1]
+            )
+        return entity if cursor.rowcount else None
+
+    def delete(self, entity_id: str) -> bool:
+        """Deletes record by ID."""
+        with self._locked() as conn:
+            cursor = conn.execute(f'DELETE FROM "{self._table}" WHERE id = ?',
+                                  (self._normalize_id(entity_id),))
+        return cursor.rowcount > 0
+
+    def count(self) -> int:
+        """Returns number of records."""
+        return self._connection().execute(f'SELECT COUNT(*) FROM "{self._table}"').fetchone()[0]
+
+    def exists(self, entity_id: str) -> bool:
+        """Checks if record exists."""
+        row = self._connection().execute(
+            f'SELECT 1 FROM "{self._table}" WHERE id = ?', (self._normalize_id(entity_id),)
+        ).fetchone()
+        return row is not None
+
+    def find_by(self, **criteria: Any) -> List[T]:
+        """
+        Returns records whose fields equal the given values.
+
+        Indexed fields are filtered in SQL, the rest in Python.
+        """
+        indexed = {k: v for k, v in criteria.items() if k in self._indexed_fields}
+        rest = {k: v for k, v in criteria.items() if k not in indexed}
+
+        where = ' AND '.join(f'"{field}" = ?' for field in indexed)
+        data = self._select(f'WHERE {where}' if where else '', tuple(indexed.values()))
+        return [self._to_entity(item) for item in data if self._matches(item, rest)]
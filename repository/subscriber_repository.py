@@ -2,13 +2,15 @@
 Subscriber Repository
 """
 from typing import List, Optional
-from repository.base_repository import BaseRepository
+from repository.backend import StorageRepository
 from models.subscriber import Subscriber
 
 
-class SubscriberRepository(BaseRepository[Subscriber]):
+class SubscriberRepository(StorageRepository[Subscriber]):
     """Repository for working with subscribers."""
 
+    _indexed_fields = ('email',)
+
     def __init__(self, data_dir: str = None):
         super().__init__('subscribers.json', data_dir)
 
@@ -20,11 +22,8 @@ class SubscriberRepository(BaseRepository[Subscriber]):
 
     def find_by_email(self, email: str) -> Optional[Subscriber]:
         """Finds subscriber by email."""
-        all_subscribers = self.get_all()
-        for sub in all_subscribers:
-            if sub.email.lower() == email.lower():
-                return sub
-        return None
+        result = self.find_by(email=email)
+        return result[0] if result else None
 
     def get_active(self) -> List[Subscriber]:
         """Returns active subscribers."""
@@ -41,19 +40,21 @@ class SubscriberRepository(BaseRepository[Subscriber]):
 
     def activate(self, subscriber_id: str) -> Optional[Subscriber]:
         """Activates subscriber."""
-        subscriber = self.get_by_id(subscriber_id)
-        if subscriber:
-            subscriber.is_active = True
-            return self.update(subscriber)
-        return None
+        with self._locked():
+            subscriber = self.get_by_id(subscriber_id)
+            if subscriber:
+                subscriber.is_active = True
+                return self.update(subscriber)
+            return None
 
     def deactivate(self, subscriber_id: str) -> Optional[Subscriber]:
         """Deactivates subscriber."""
-        subscriber = self.get_by_id(subscriber_id)
-        if subscriber:
-            subscriber.is_active = False
-            return self.update(subscriber)
-        return None
+        with self._locked():
+            subscriber = self.get_by_id(subscriber_id)
+            if subscriber:
+                subscriber.is_active = False
+                return self.update(subscriber)
+            return None
 
     def email_exists(self, email: str) -> bool:
         """Checks if email exists."""
@@ -61,9 +62,10 @@ class SubscriberRepository(BaseRepository[Subscriber]):
 
     def update_categories(self, subscriber_id: str, categories: List[str]) -> Optional[Subscriber]:
         """Updates subscription categories."""
-        subscriber = self.get_by_id(subscriber_id)
-        if subscriber:
-            subscriber.categories = categories
-            return self.update(subscriber)
-        return None
+        with self._locked():
+            subscriber = self.get_by_id(subscriber_id)
+            if subscriber:
+                subscriber.categories = categories
+                return self.update(subscriber)
+            return None
 
@@ -4,38 +4,42 @@ Teacher Repository
 import json
 import os
 from typing import List, Optional
-from repository.base_repository import BaseRepository
+from repository.base_repository import BaseRepository, atomic_write_json, file_lock
+from repository.backend import StorageRepository
 from models.teacher import Teacher
 
 
-class TeacherRepository(BaseRepository[Teacher]):
+class TeacherRepository(StorageRepository[Teacher]):
     """Repository for working with teachers."""
 
     def __init__(self, data_dir: str = None):
         super().__init__('teachers.json', data_dir)
+        self._ratings_file = os.path.join(self._data_dir, 'ratings.json')
+        self._ratings_signature = None
         self._ratings = self._load_ratings()
 
     def _load_ratings(self) -> dict:
         """Loads ratings from ratings.json"""
-        ratings_file = os.path.join(self._data_dir, 'ratings.json')
+        self._ratings_signature = BaseRepository._stat_signature(self._ratings_file)
         try:
-            with open(ratings_file, 'r', encoding='utf-8') as f:
+            with open(self._ratings_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
 
-    def _save_ratings(self) -> None:
-        """Saves ratings to ratings.json"""
-        ratings_file = os.path.join(self._data_dir, 'ratings.json')
-        with open(ratings_file, 'w', encoding='utf-8') as f:
-            json.dump(self._ratings, f, ensure_ascii=False, indent=2)
+    def _get_ratings(self) -> dict:
+        """Returns ratings, reloading them if another process has changed the file."""
+        if BaseRepository._stat_signature(self._ratings_file) != self._ratings_signature:
+            self._ratings = self._load_ratings()
+        return self._ratings
 
     def _to_entity(self, data: dict) -> Teacher:
         """Converts dictionary to Teacher with rating."""
         teacher = Teacher.from_dict(data)
         teacher_id = str(teacher.id)
-        if teacher_id in self._ratings:
-            rating_data = self._ratings[teacher_id]
+        ratings = self._get_ratings()
+        if teacher_id in ratings:
+            rating_data = ratings[teacher_id]
             teacher.rating = rating_data.get('rating', 0.0)
             teacher.reviews_count = rating_data.get('reviews_count', 0)
         return teacher
@@ -44,14 +48,6 @@ class TeacherRepository(BaseRepository[Teacher]):
         """Converts Teacher to dictionary."""
         return entity.to_dict()
 
-    def get_by_id(self, entity_id: str) -> Optional[Teacher]:
-        """Returns record by ID (supports int and str)."""
-        data = self._load_data()
-        for item in data:
-            if str(item.get('id')) == str(entity_id):
-                return self._to_entity(item)
-        return None
-
     def find_by_name(self, name: str) -> List[Teacher]:
         """Searches teachers by name (English or Kazakh)."""
         all_teachers = self.get_all()
@@ -79,13 +75,22 @@ class TeacherRepository(BaseRepository[Teacher]):
         return sorted_teachers[:limit]
 
     def update_rating(self, teacher_id: str, new_rating: float, reviews_count: int) -> Optional[Teacher]:
-        """Updates teacher rating in ratings.json"""
+        """
+        Updates teacher rating in ratings.json.
+
+        The file is re-read under a lock and only this teacher's entry is
+        changed, so concurrent updates from other processes are not lost.
+        """
         teacher_id = str(teacher_id)
-        self._ratings[teacher_id] = {
-            'rating': round(new_rating, 2),
-            'reviews_count': reviews_count
-        }
-        self._save_ratings()
+        with file_lock(self._ratings_file + '.lock'):
+            ratings = self._load_ratings()
+            ratings[teacher_id] = {
+                'rating': round(new_rating, 2),
+                'reviews_count': reviews_count
+            }
+            atomic_write_json(self._ratings_file, ratings)
+            self._ratings_signature = BaseRepository._stat_signature(self._ratings_file)
+            self._ratings = ratings
         return self.get_by_id(teacher_id)
 
     def get_levels(self) -> List[str]:
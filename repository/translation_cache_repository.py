@@ -0,0 +1,128 @@
+"""
+Translation Cache Repository
+
+Persistent memo of machine translations, keyed on (sha256(text), source, target).
+Stored in a table of the shared SQLite database (data/sdu.sqlite3) and
+evicted in least-recently-used order once max_entries is exceeded.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from repository.sqlite_repository import SQLITE_FILE
+
+TABLE = 'translation_cache'
+
+
+class TranslationCacheRepository:
+    """Repository of cached translations with LRU eviction."""
+
+    def __init__(self, data_dir: str = None, max_entries: int = 10000):
+        """
+        Initialize repository.
+
+        Args:
+            data_dir: Data directory (database file is created there)
+            max_entries: Number of translations kept, least recently used are evicted
+        """
+        if data_dir is None:
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+
+        os.makedirs(data_dir, exist_ok=True)
+        self._db_path = os.path.join(data_dir, SQLITE_FILE)
+        self._max_entries = max_entries
+        self._local = threading.local()
+        self._hits = 0
+        self._misses = 0
+
+        conn = self._connection()
+        conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {TABLE} ('
+            f'text_hash TEXT NOT NULL, source TEXT NOT NULL, target TEXT NOT NULL, '
+            f'translated TEXT NOT NULL, last_used REAL NOT NULL, '
+            f'PRIMARY KEY (text_hash, source, target))'
+        )
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{TABLE}_last_used ON {TABLE} (last_used)')
+        self._count = conn.execute(f'SELECT COUNT(*) FROM {TABLE}').fetchone()[0]
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns connection of the current thread."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Returns content hash used as cache key."""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get(self, text: str, source: str, target: str) -> Optional[str]:
+        """
+        Returns cached translation and marks it as recently used.
+
+        Returns:
+            Translated text or None if not cached
+        """
+        key = (self.text_hash(text), source, target)
+        conn = self._connection()
+        row = conn.execute(
+            f'SELECT translated FROM {TABLE} WHERE text_hash = ? AND source = ? AND target = ?', key
+        ).fetchone()
+        if row is None:
+            self._misses += 1
+            return None
+
+        conn.execute(
+            f'UPDATE {TABLE} SET last_used = ? WHERE text_hash = ? AND source = ? AND target = ?',
+            (time.time(),) + key
+        )
+        self._hits += 1
+        return row[0]
+
+    def put(self, text: str, source: str, target: str, translated: str) -> None:
+        """Stores translation, evicting least recently used entries when full."""
+        conn = self._connection()
+        cursor = conn.execute(
+            f'INSERT OR REPLACE INTO {TABLE} (text_hash, source, target, translated, last_used) '
+            f'VALUES (?, ?, ?, ?, ?)',
+            (self.text_hash(text), source, target, translated, time.time())
+        )
+        if cursor.rowcount:
+            self._count += 1
+        if self._count > self._max_entries:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Deletes least recently used entries down to 90% of max_entries."""
+        conn = self._connection()
+        # Other processes may have added or evicted entries
+        self._count = conn.execute(f'SELECT COUNT(*) FROM {TABLE}').fetchone()[0]
+        excess = self._count - int(self._max_entries * 0.9)
+        if excess <= 0:
+            return
+        conn.execute(
+            f'DELETE FROM {TABLE} WHERE rowid IN '
+            f'(SELECT rowid FROM {TABLE} ORDER BY last_used LIMIT ?)', (excess,)
+        )
+        self._count -= excess
+        print(f"[TranslationCache] Evicted {excess} entries")
+
+    def clear(self) -> None:
+        """Deletes all cached translations."""
+        self._connection().execute(f'DELETE FROM {TABLE}')
+        self._count = 0
+
+    def count(self) -> int:
+        """Returns number of cached translations."""
+        return self._connection().execute(f'SELECT COUNT(*) FROM {TABLE}').fetchone()[0]
+
+    def get_stats(self) -> dict:
+        """Returns hit/miss counters of this process."""
+        return {'hits': self._hits, 'misses': self._misses, 'entries': self._count}
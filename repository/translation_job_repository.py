@@ -0,0 +1,90 @@
+"""
+Translation Job Repository
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from repository.backend import StorageRepository
+from models.translation_job import TranslationJob
+
+
+class TranslationJobRepository(StorageRepository[TranslationJob]):
+    """Repository for background translation jobs."""
+
+    _indexed_fields = ('status', 'entity_id')
+    _journaled = True
+
+    def __init__(self, data_dir: str = None):
+        super().__init__('translation_jobs.json', data_dir)
+
+    def _to_entity(self, data: dict) -> TranslationJob:
+        return TranslationJob.from_dict(data)
+
+    def _to_dict(self, entity: TranslationJob) -> dict:
+        return entity.to_dict()
+
+    def find_by_status(self, status: str) -> List[TranslationJob]:
+        """Finds jobs by status (oldest first)."""
+        return sorted(self.find_by(status=status), key=lambda j: j.created_at)
+
+    def get_latest_by_entity(self, entity_type: str) -> Dict[str, TranslationJob]:
+        """Returns the most recent job of every entity: {entity_id: job}."""
+        latest = {}
+        for job in self.find_by(entity_type=entity_type):
+            current = latest.get(job.entity_id)
+            if current is None or job.created_at >= current.created_at:
+                latest[job.entity_id] = job
+        return latest
+
+    def purge(self, older_than: float) -> int:
+        """
+        Deletes finished (done, failed) jobs that were last updated more than
+        `older_than` seconds ago or are superseded by a newer job of their entity.
+
+        Returns:
+            Number of deleted jobs
+        """
+        cutoff = (datetime.now() - timedelta(seconds=older_than)).isoformat()
+        finished = (TranslationJob.DONE, TranslationJob.FAILED)
+        with self._locked():
+            data = self._load_data()
+            latest = {}
+            for item in data:
+                key = (item.get('entity_type'), item.get('entity_id'))
+                if key not in latest or item.get('created_at', '') >= latest[key].get('created_at', ''):
+                    latest[key] = item
+            kept = [
+                item for item in data
+                if item.get('status') not in finished
+                or (item.get('updated_at', '') >= cutoff
+                    and latest[(item.get('entity_type'), item.get('entity_id'))] is item)
+            ]
+            if len(kept) < len(data):
+                self._save_data(kept)
+        return len(data) - len(kept)
+
+    def claim(self, job_id: str) -> Optional[TranslationJob]:
+        """
+        Marks pending job as running (one worker per job, across processes).
+
+        Returns:
+            Claimed job or None if it is not pending anymore
+        """
+        with self._locked():
+            job = self.get_by_id(job_id)
+            if not job or job.status != TranslationJob.PENDING:
+                return None
+            job.status = TranslationJob.RUNNING
+            job.attempts += 1
+            job.updated_at = datetime.now().isoformat()
+            return self.update(job)
+
+    def set_status(self, job_id: str, status: str, error: str = '') -> Optional[TranslationJob]:
+        """Updates job status."""
+        with self._locked():
+            job = self.get_by_id(job_id)
+            if not job:
+                return None
+            job.status = status
+            job.error = error
+            job.updated_at = datetime.now().isoformat()
+            return self.update(job)
@@ -0,0 +1,124 @@
+"""
+Page Render Benchmark
+
+Renders schedule, room and other pages with the Flask test client and
+reports time per request and translation lookups per request, with the
+cached i18n catalogs and with the catalog re-parsed (and flattened) on
+every lookup, as translations were read before the cache. Pages rendered
+both ways are compared byte for byte.
+
+Usage (from the project root):
+    python scripts/bench_pages.py [--requests 50] [--lang ru] [--url /rooms/ ...]
+
+Exits with code 1 if a page fails or differs between the two modes.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Make project packages importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_URLS = [
+    '/',
+    '/teachers/',
+    '/teachers/335',
+    '/rooms/',
+    '/rooms/?day=2&time=10:30',
+    '/rooms/schedule/1',
+    '/rooms/api/free?day=2&from=10:30&to=13:20',
+    '/news/',
+    '/shop/',
+]
+
+
+def measure(client, url: str, requests: int) -> tuple:
+    """
+    Returns (ms per request, catalog lookups per request, last response).
+    """
+    import utils.i18n as i18n
+
+    for _ in range(3):
+        client.get(url)
+
+    get_catalog = i18n._get_catalog
+    lookups = [0]
+
+    def counted(lang):
+        lookups[0] += 1
+        return get_catalog(lang)
+
+    i18n._get_catalog = counted
+    try:
+        started = time.perf_counter()
+        for _ in range(requests):
+            response = client.get(url)
+        elapsed = time.perf_counter() - started
+    finally:
+        i18n._get_catalog = get_catalog
+    return elapsed / requests * 1000, lookups[0] // requests, response
+
+
+@contextlib.contextmanager
+def uncached_catalogs():
+    """Drops parsed catalogs before every lookup, so each one reads the JSON file."""
+    import utils.i18n as i18n
+
+    get_catalog = i18n._get_catalog
+
+    def reparse(lang):
+        i18n._catalogs.clear()
+        return get_catalog(lang)
+
+    i18n._get_catalog = reparse
+    try:
+        yield
+    finally:
+        i18n._get_catalog = get_catalog
+        i18n._catalogs.clear()
+
+
+def run(urls: list, requests: int, lang: str) -> bool:
+    """
+    Benchmarks every URL in both modes.
+
+    Returns:
+        True if all pages rendered with status 200 and identical bodies
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app import create_app
+        app = create_app('default')
+    app.config['TESTING'] = True
+    client = app.test_client()
+    client.get(f'/lang/set/{lang}')
+
+    ok = True
+    print(f"[Bench] {requests} requests per page after warm-up, language {lang}")
+    for url in urls:
+        cached_ms, lookups, cached = measure(client, url, requests)
+        with uncached_catalogs():
+            uncached_ms, _, uncached = measure(client, url, requests)
+        same = cached.status_code == 200 and cached.data == uncached.data
+        ok = ok and same
+        print(f"[Bench] {url:45s} {uncached_ms:6.2f} ms -> {cached_ms:5.2f} ms "
+              f"({lookups} lookups){'' if same else '  MISMATCH'}")
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Time per request with cached and re-parsed translations')
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--lang', choices=('ru', 'en', 'kz'), default='ru')
+    parser.add_argument('--url', action='append', help='Page to render (repeatable)')
+    args = parser.parse_args()
+
+    ok = run(args.url or DEFAULT_URLS, args.requests, args.lang)
+    print('[Bench] OK' if ok else '[Bench] FAILED: a page failed or differs between modes')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Free Room Benchmark
+
+Times CabinetRepository.get_free_cabinets (precomputed occupancy bitsets)
+against the linear scan it replaced: walk every lesson of every cabinet,
+compare start times, then filter and sort the cabinet list. Every
+(day, slot, building) query is also checked to return the same rooms in
+the same order.
+
+Usage (from the project root):
+    python scripts/bench_rooms.py [--repeat 20] [--building NAME ...]
+
+Exits with code 1 if the two implementations disagree.
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+# Make project packages importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def scan_free_cabinets(cabinets: list, schedules: dict, week_id: int, start_time: str,
+                       building: str = None) -> list:
+    """Linear scan used before the bitsets (schedules as in cabinet_schedules.json)."""
+    occupied = set()
+    for cabinet_id, lessons in schedules.items():
+        for lesson in lessons:
+            if lesson.get('week_id') == week_id and lesson.get('start_time') == start_time:
+                occupied.add(cabinet_id)
+                break
+
+    if building:
+        cabinets = [c for c in cabinets if building.lower() in c.parent_building_en.lower()]
+    free_cabinets = [c for c in cabinets if str(c.id) not in occupied]
+    return sorted(free_cabinets, key=lambda c: (c.parent_building_en, c.name))
+
+
+def timed(func, queries: list, repeat: int) -> float:
+    """Returns average time of one query in microseconds."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            func(*query)
+    return (time.perf_counter() - started) / (repeat * len(queries)) * 1e6
+
+
+def run(repeat: int, buildings: list) -> bool:
+    """
+    Compares both implementations over all days, slots and buildings.
+
+    Returns:
+        True if results match
+    """
+    from models.room import TIME_SLOTS
+    from repository.room_repository import CabinetRepository
+
+    repo = CabinetRepository()
+    started = time.perf_counter()
+    repo.get_free_cabinets(1, TIME_SLOTS[0][0])
+    build_ms = (time.perf_counter() - started) * 1000
+
+    # Per-cabinet lesson dicts, the shape the old scan read from disk
+    cabinets = repo.get_all()
+    schedules = {cabinet_id: [lesson.to_dict() for lesson in lessons]
+                 for cabinet_id, lessons in repo._load_schedules().items()}
+    queries = [(week_id, start, building)
+               for week_id in range(1, 7) for start, end in TIME_SLOTS for building in buildings]
+
+    mismatches = 0
+    for week_id, start, building in queries:
+        expected = [c.id for c in scan_free_cabinets(cabinets, schedules, week_id, start, building)]
+        actual = [c.id for c in repo.get_free_cabinets(week_id, start, building)]
+        mismatches += expected != actual
+
+    scan_us = timed(lambda *q: scan_free_cabinets(cabinets, schedules, *q), queries, repeat)
+    bitset_us = timed(repo.get_free_cabinets, queries, repeat)
+
+    print(f"[Bench] {len(cabinets)} cabinets, {sum(map(len, schedules.values()))} cabinet lessons, "
+          f"first query (load + bitsets) {build_ms:.1f} ms")
+    print(f"[Bench] {len(queries)} queries: scan {scan_us:.1f} us/query, "
+          f"bitset {bitset_us:.1f} us/query ({scan_us / bitset_us:.0f}x)")
+    print(f"[Bench] {mismatches} mismatching results")
+    return mismatches == 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Free room lookup: occupancy bitsets vs linear scan')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--building', action='append',
+                        help='Building filter to include (repeatable, default: none and every building)')
+    args = parser.parse_args()
+
+    from repository.room_repository import CabinetRepository
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        buildings = args.building or [None] + CabinetRepository().get_buildings()
+    ok = run(args.repeat, buildings)
+    print('[Bench] OK' if ok else '[Bench] FAILED: results differ from the scan')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
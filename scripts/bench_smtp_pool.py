@@ -0,0 +1,160 @@
+"""
+SMTP Pool Benchmark
+
+Sends emails from several threads through SmtpConnectionPool to a local
+in-process SMTP stand-in server and reports throughput:
+- one session per message (max 1 message per connection: connect, EHLO,
+  AUTH, send, QUIT every time, as before the pool)
+- pooled sessions (SMTP_MAX_MESSAGES_PER_CONNECTION messages per login)
+
+The stand-in delays every reply by --rtt seconds to model the network
+and can drop a session after --server-max messages to exercise
+reconnects. It does not offer STARTTLS (no certificate here), so the
+TLS handshakes a real server adds per session are not counted.
+
+Usage (from the project root):
+    python scripts/bench_smtp_pool.py [--messages 200] [--workers 4] [--rtt 0.005] [--server-max 0]
+
+Exits with code 1 if the server did not receive every message.
+"""
+import argparse
+import os
+import socketserver
+import sys
+import threading
+import time
+from email.message import EmailMessage
+
+# Make project packages importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class SmtpStandIn(socketserver.ThreadingTCPServer):
+    """Minimal SMTP server that accepts AUTH PLAIN and counts delivered messages."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, rtt: float = 0.0, max_messages: int = 0):
+        super().__init__(('127.0.0.1', 0), _SmtpHandler)
+        self.rtt = rtt
+        self.max_messages = max_messages
+        self.delivered = 0
+        self.sessions = 0
+        self.lock = threading.Lock()
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+
+    def reply(self, text: str) -> None:
+        if self.server.rtt:
+            time.sleep(self.server.rtt)
+        self.wfile.write(text.encode('ascii') + b'\r\n')
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        with self.server.lock:
+            self.server.sessions += 1
+        messages = 0
+        self.reply('220 localhost ESMTP stand-in')
+        for raw in self.rfile:
+            command = raw.decode('ascii', 'replace').strip().upper()
+            if command.startswith('EHLO'):
+                self.reply('250-localhost\r\n250-AUTH PLAIN\r\n250 OK')
+            elif command.startswith('AUTH'):
+                self.reply('235 Authentication successful')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                for line in self.rfile:
+                    if line == b'.\r\n':
+                        break
+                messages += 1
+                with self.server.lock:
+                    self.server.delivered += 1
+                self.reply('250 OK queued')
+                if messages == self.server.max_messages:
+                    # Server-side limit: drop the session without a reply
+                    return
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                # HELO, MAIL, RCPT, RSET, NOOP
+                self.reply('250 OK')
+
+
+def build_message(i: int) -> EmailMessage:
+    msg = EmailMessage()
+    msg['Subject'] = f'News {i}'
+    msg['From'] = 'SDU SuperApp <bench@example.com>'
+    msg['To'] = f'user{i}@example.com'
+    msg.set_content('Plain text body')
+    msg.add_alternative('<html><body>' + '<p>News body</p>' * 50 + '</body></html>', subtype='html')
+    return msg
+
+
+def run(messages: int, workers: int, rtt: float, server_max: int, max_per_connection: int) -> tuple:
+    """
+    Sends `messages` emails from `workers` threads through one pool.
+
+    Returns:
+        Tuple (messages per second, pool stats, messages received by the server)
+    """
+    from services.smtp_pool import SmtpConnectionPool
+
+    server = SmtpStandIn(rtt, server_max)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    pool = SmtpConnectionPool('127.0.0.1', server.server_address[1], 'bench', 'secret',
+                              size=workers, max_messages=max_per_connection, starttls=False)
+    batch = [build_message(i) for i in range(messages)]
+    errors = []
+
+    def worker(offset: int) -> None:
+        for msg in batch[offset::workers]:
+            try:
+                pool.send_message(msg)
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(w,)) for w in range(workers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    pool.close()
+    server.shutdown()
+    server.server_close()
+    if errors:
+        print(f"[Bench] {len(errors)} send errors, first: {errors[0]!r}")
+    return messages / elapsed, pool.get_stats(), server.delivered
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='SMTP throughput: per-message sessions vs pooled sessions')
+    parser.add_argument('--messages', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--rtt', type=float, default=0.005, help='Delay before every server reply, seconds')
+    parser.add_argument('--server-max', type=int, default=0,
+                        help='Server drops a session after this many messages (0: never)')
+    args = parser.parse_args()
+
+    from config import Config
+
+    ok = True
+    print(f"[Bench] {args.messages} messages, {args.workers} threads, rtt {args.rtt * 1000:g} ms")
+    for label, max_per_connection in (('per-message session', 1),
+                                      ('pooled sessions', Config.SMTP_MAX_MESSAGES_PER_CONNECTION)):
+        rate, stats, delivered = run(args.messages, args.workers, args.rtt, args.server_max,
+                                     max_per_connection)
+        ok = ok and delivered == args.messages
+        print(f"[Bench] {label:20s} {rate:7.1f} msg/s, {stats['connections']} connections, "
+              f"{stats['reconnects']} reconnects, {delivered}/{args.messages} received")
+    print('[Bench] OK' if ok else '[Bench] FAILED: messages were lost')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Subscriber Startup Benchmark
+
+Writes N synthetic subscribers to a temporary data directory and times
+what NewsService does at startup: load active subscribers and register
+an EmailSubscriber for every news event. Also times registering them one
+by one with subscribe_to_all, and with the list-based attach that scanned
+every observer for duplicates (for at most --list-limit subscribers, it
+is quadratic). Output of the observers goes to /dev/null.
+
+Usage (from the project root):
+    python scripts/bench_subscribers.py [--subscribers 50000] [--list-limit 5000]
+
+Exits with code 1 if not every subscriber ends up registered.
+"""
+import argparse
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Make project packages importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+EVENTS = ('news_created', 'news_updated', 'news_deleted')
+
+
+class ListSubject:
+    """Observer registry as it was before: one list per event type."""
+
+    def __init__(self):
+        self._observers = {}
+
+    def attach(self, event_type: str, observer) -> None:
+        if event_type not in self._observers:
+            self._observers[event_type] = []
+        for obs in self._observers[event_type]:
+            if obs.subscriber_id == observer.subscriber_id:
+                return
+        self._observers[event_type].append(observer)
+        print(f"[Observer] {observer.subscriber_id} subscribed to '{event_type}'")
+
+
+def write_subscribers(data_dir: str, count: int) -> None:
+    """Writes `count` active subscribers to subscribers.json."""
+    from models.subscriber import Subscriber
+    from repository.base_repository import atomic_write_json
+
+    subscribers = [Subscriber(id=f'bench-{i}', email=f'bench{i}@example.com', name=f'User {i}',
+                              subscribed_at='2026-01-01T00:00:00', language='en').to_dict()
+                   for i in range(count)]
+    atomic_write_json(os.path.join(data_dir, 'subscribers.json'), subscribers)
+
+
+def new_publisher():
+    """Returns a fresh NewsPublisher (it is a singleton)."""
+    from observer.news_publisher import NewsPublisher
+
+    NewsPublisher._instance = None
+    return NewsPublisher()
+
+
+def registered(publisher) -> int:
+    """Returns number of observers subscribed to every news event."""
+    return min(len(publisher._observers.get(event_type, ())) for event_type in EVENTS)
+
+
+def run(count: int, list_limit: int) -> bool:
+    """
+    Times startup registration of `count` subscribers.
+
+    Returns:
+        True if all subscribers were registered
+    """
+    from repository.subscriber_repository import SubscriberRepository
+    from services.news_service import NewsService
+
+    data_dir = tempfile.mkdtemp(prefix='sdu-bench-')
+    try:
+        write_subscribers(data_dir, count)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            # What NewsService._init_subscribers does
+            started = time.perf_counter()
+            subscribers = SubscriberRepository(data_dir).get_active()
+            observers = [NewsService._create_observer(s) for s in subscribers]
+            loaded = time.perf_counter() - started
+            publisher = new_publisher()
+            publisher.subscribe_many_to_all(observers)
+            startup = time.perf_counter() - started
+            ok = registered(publisher) == count
+
+            publisher = new_publisher()
+            started = time.perf_counter()
+            for observer in observers:
+                publisher.subscribe_to_all(observer)
+            one_by_one = time.perf_counter() - started
+            ok = ok and registered(publisher) == count
+
+            limit = min(count, list_limit)
+            subject = ListSubject()
+            started = time.perf_counter()
+            for observer in observers[:limit]:
+                for event_type in EVENTS:
+                    subject.attach(event_type, observer)
+            list_attach = time.perf_counter() - started
+            new_publisher()
+
+        print(f"[Bench] {count} subscribers")
+        print(f"[Bench] startup (load {loaded:.2f}s + subscribe_many_to_all): {startup:.2f}s")
+        print(f"[Bench] subscribe_to_all one by one: {one_by_one:.2f}s")
+        if limit:
+            print(f"[Bench] list-based attach, {limit} subscribers: {list_attach:.2f}s")
+        return ok
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Startup registration of many subscribers')
+    parser.add_argument('--subscribers', type=int, default=50000)
+    parser.add_argument('--list-limit', type=int, default=5000,
+                        help='Subscribers registered with the old list-based attach (0: skip)')
+    args = parser.parse_args()
+
+    # Subscribers are written as a JSON file; notify synchronously, no worker threads
+    os.environ['STORAGE_BACKEND'] = 'json'
+    os.environ['NOTIFY_WORKERS'] = '0'
+
+    ok = run(args.subscribers, args.list_limit)
+    print('[Bench] OK' if ok else '[Bench] FAILED: subscribers are missing')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
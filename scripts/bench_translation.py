@@ -0,0 +1,108 @@
+"""
+Translation Concurrency Benchmark
+
+Translates news with the offline fake translator (TRANSLATOR_BACKEND=fake),
+which sleeps FAKE_TRANSLATOR_LATENCY seconds per call like a network
+round-trip, and compares:
+- sequential: one translate_text call per field and target language, in
+  series (how translate_news used to work)
+- concurrent: TranslationService.translate_news, which dispatches all
+  calls of one news item at once
+The translation cache lives in a temporary directory and is cleared
+before every run, so no call is served from it.
+
+Usage (from the project root):
+    python scripts/bench_translation.py [--latency 0.2] [--repeat 3]
+
+Exits with code 1 if both ways give different translations or the
+concurrent one is not faster.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Make project packages importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+NEWS = {
+    'title': 'Открытая лекция по машинному обучению',
+    'content': 'В пятницу в главном корпусе пройдёт открытая лекция.',
+    'category': 'Лекция',
+    'author': 'Admin',
+}
+
+
+def translate_sequentially(service, news: dict) -> dict:
+    """Translates every field to every target language one call at a time."""
+    translations = {}
+    for target_lang in ('en', 'kz'):
+        translations[target_lang] = {
+            'title': service.translate_text(news['title'], 'ru', target_lang),
+            'content': service.translate_text(news['content'], 'ru', target_lang),
+            'category': service.translate_text(news['category'], 'ru', target_lang),
+            'author': news['author']
+        }
+    return translations
+
+
+def run(repeat: int) -> bool:
+    """
+    Times both ways `repeat` times each.
+
+    Returns:
+        True if translations match and the concurrent way is faster
+    """
+    # Imported after the environment is configured in main()
+    from config import Config
+    from repository.translation_cache_repository import TranslationCacheRepository
+    from services.translation_service import TranslationService
+
+    data_dir = tempfile.mkdtemp(prefix='sdu-bench-')
+    try:
+        cache = TranslationCacheRepository(data_dir)
+        service = TranslationService(cache)
+
+        timings = {'sequential': [], 'concurrent': []}
+        results = {}
+        for _ in range(repeat):
+            for mode in timings:
+                cache.clear()
+                started = time.perf_counter()
+                if mode == 'sequential':
+                    results[mode] = translate_sequentially(service, NEWS)
+                else:
+                    results[mode] = service.translate_news(**NEWS)
+                timings[mode].append(time.perf_counter() - started)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    sequential = min(timings['sequential'])
+    concurrent = min(timings['concurrent'])
+    same = results['sequential'] == results['concurrent']
+    print(f"[Bench] fake translator, {Config.FAKE_TRANSLATOR_LATENCY * 1000:g} ms per call, "
+          f"{Config.TRANSLATION_WORKERS} workers, best of {repeat}")
+    print(f"[Bench] translate_news: sequential {sequential * 1000:.0f} ms, "
+          f"concurrent {concurrent * 1000:.0f} ms ({sequential / concurrent:.1f}x)")
+    print(f"[Bench] translations {'match' if same else 'DIFFER'}")
+    return same and concurrent < sequential
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Sequential vs concurrent news translation')
+    parser.add_argument('--latency', type=float, default=0.2, help='Seconds per fake translator call')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ['TRANSLATOR_BACKEND'] = 'fake'
+    os.environ['FAKE_TRANSLATOR_LATENCY'] = str(args.latency)
+
+    ok = run(args.repeat)
+    print('[Bench] OK' if ok else '[Bench] FAILED')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
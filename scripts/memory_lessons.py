@@ -0,0 +1,111 @@
+"""
+Lesson Store Memory Test
+
+Measures with tracemalloc how many bytes one lesson takes:
+- before: lesson dicts sharing teacher/cabinet dicts, grouped by teacher
+  and by cabinet (how lessons.json used to be kept in memory)
+- after: the LessonStore of slotted, interned records
+and what a room schedule query allocates when it builds records with
+from_dict on every call versus returning the shared ones.
+
+Usage (from the project root):
+    python scripts/memory_lessons.py [--data-dir data]
+
+Exits with code 1 if records do not take less memory than dicts.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+# Make project packages importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def load_dicts(path: str) -> tuple:
+    """
+    Loads lessons.json as plain dicts (the representation used before records).
+
+    Returns:
+        Tuple (lessons, by_teacher, by_cabinet, teachers, cabinets)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    columns = data['columns']
+    teachers = data.get('teachers', {})
+    cabinets = data.get('cabinets', {})
+
+    lessons = []
+    for row in data.get('lessons', []):
+        lesson = dict(zip(columns, row))
+        teacher_id = lesson.pop('teacher_id', None)
+        cabinet_id = lesson.pop('cabinet_id', None)
+        lesson['teacher'] = teachers.get(str(teacher_id)) if teacher_id is not None else None
+        lesson['cabinet'] = cabinets.get(str(cabinet_id)) if cabinet_id is not None else None
+        lessons.append(lesson)
+
+    by_teacher = {key: [lessons[i] for i in rows] for key, rows in data.get('by_teacher', {}).items()}
+    by_cabinet = {key: [lessons[i] for i in rows] for key, rows in data.get('by_cabinet', {}).items()}
+    return lessons, by_teacher, by_cabinet, teachers, cabinets
+
+
+def traced(build) -> tuple:
+    """
+    Calls build() and returns (result, bytes still allocated by it).
+
+    Temporary allocations freed before build() returns are not counted.
+    """
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    return result, tracemalloc.get_traced_memory()[0] - before
+
+
+def run(data_dir: str) -> bool:
+    """
+    Prints memory per lesson for dicts and records.
+
+    Returns:
+        True if records take less memory
+    """
+    from models.room import CabinetLesson
+    from repository.lesson_store import LESSONS_FILE, LessonStore
+
+    tracemalloc.start()
+    dicts, dict_bytes = traced(lambda: load_dicts(os.path.join(data_dir, LESSONS_FILE)))
+    store, store_bytes = traced(lambda: LessonStore(data_dir))
+    count = store.count()
+
+    # One query per cabinet, results kept alive so their allocations stay traced
+    by_cabinet = dicts[2]
+    built, built_bytes = traced(lambda: [[CabinetLesson.from_dict(item) for item in lessons]
+                                         for lessons in by_cabinet.values()])
+    # What CabinetRepository.get_cabinet_schedule returns: a copy of the shared list
+    shared, shared_bytes = traced(lambda: [list(store.by_cabinet.get(key, [])) for key in by_cabinet])
+    returned = sum(map(len, shared))
+    tracemalloc.stop()
+
+    print(f"[Memory] {count} lessons from {os.path.join(data_dir, LESSONS_FILE)}")
+    print(f"[Memory] dicts:   {dict_bytes / 1e6:.2f} MB ({dict_bytes / count:.0f} B/lesson)")
+    print(f"[Memory] records: {store_bytes / 1e6:.2f} MB ({store_bytes / count:.0f} B/lesson)")
+    print(f"[Memory] room schedules, per returned lesson: from_dict {built_bytes / returned:.0f} B, "
+          f"shared records {shared_bytes / returned:.0f} B")
+    return store_bytes < dict_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Memory per lesson: dicts vs slotted records')
+    parser.add_argument('--data-dir', default=os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data'))
+    args = parser.parse_args()
+
+    ok = run(args.data_dir)
+    print('[Memory] OK' if ok else '[Memory] FAILED: records are not smaller than dicts')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
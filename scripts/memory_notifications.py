@@ -0,0 +1,94 @@
+"""
+Notification Memory Test
+
+Publishes many news events to EmailSubscriber and NotificationSubscriber
+observers and samples the process RSS, checking that it stays flat once
+the notification histories are full (they are bounded ring buffers).
+
+Usage (from the project root):
+    python scripts/memory_notifications.py [--events 100000] [--subscribers 10] [--max-growth 5]
+
+Exits with code 1 if RSS grows by more than --max-growth MB between the
+first and the last sample.
+"""
+import argparse
+import contextlib
+import gc
+import os
+import sys
+import time
+
+# Make project packages importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def rss_mb() -> float:
+    """Returns current resident set size in MB (Linux)."""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def run(events: int, subscribers: int, samples: int = 5) -> list:
+    """
+    Publishes `events` news to `subscribers` observers (half email, half internal).
+
+    Returns:
+        [(events published, RSS in MB)] sampled `samples` times
+    """
+    # Imported after the environment is configured in main()
+    from models.news import News
+    from observer.email_subscriber import EmailSubscriber
+    from observer.news_publisher import NewsPublisher
+    from observer.notification_subscriber import NotificationSubscriber
+
+    publisher = NewsPublisher()
+    for i in range(subscribers):
+        if i % 2 == 0:
+            observer = EmailSubscriber(f'mem-e{i}', f'mem{i}@example.com', f'Subscriber {i}', 'en')
+        else:
+            observer = NotificationSubscriber(f'mem-n{i}', f'User {i}')
+        publisher.subscribe_to_all(observer)
+
+    result = []
+    step = max(1, events // samples)
+    for i in range(events):
+        news = News(id=f'mem-{i}', title=f'News {i}', content='Body ' * 40, category='events',
+                    author='Admin', created_at='2026-01-01T00:00:00')
+        publisher.publish_news(news)
+        if (i + 1) % step == 0:
+            gc.collect()
+            result.append((i + 1, rss_mb()))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Checks that notification history memory stays flat')
+    parser.add_argument('--events', type=int, default=100000)
+    parser.add_argument('--subscribers', type=int, default=10)
+    parser.add_argument('--max-growth', type=float, default=5.0, help='Allowed RSS growth, MB')
+    args = parser.parse_args()
+
+    # Notify and send synchronously, so every event is processed before sampling
+    os.environ['EMAIL_ASYNC'] = '0'
+    os.environ['NOTIFY_WORKERS'] = '0'
+
+    started = time.time()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        samples = run(args.events, args.subscribers)
+    elapsed = time.time() - started
+
+    for events, rss in samples:
+        print(f"[Memory] {events:>8} events: RSS {rss:.1f} MB")
+    growth = samples[-1][1] - samples[0][1]
+    ok = growth <= args.max_growth
+    print(f"[Memory] {args.events} events x {args.subscribers} subscribers in {elapsed:.1f}s, "
+          f"growth {growth:.1f} MB (allowed {args.max_growth:g})")
+    print('[Memory] OK' if ok else '[Memory] FAILED: RSS keeps growing')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Repository Stress Test
+
+Runs parallel writers in separate processes (like several gunicorn
+workers) against one data directory and checks that no write is lost:
+- create() on a journaled repository (reviews) and on one that rewrites
+  the whole file (subscribers)
+- TeacherRepository.update_rating() for distinct teachers (ratings.json)
+
+Usage (from the project root):
+    python scripts/stress_repository.py [--processes 8] [--records 200] [--backend json|sqlite]
+
+Exits with code 1 if records are missing.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Make project packages importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _worker(data_dir: str, worker: int, records: int, start) -> None:
+    """Creates `records` reviews and subscribers and rates `records` teachers."""
+    # Imported in the worker, after STORAGE_BACKEND is set
+    from models.review import Review
+    from models.subscriber import Subscriber
+    from repository.review_repository import ReviewRepository
+    from repository.subscriber_repository import SubscriberRepository
+    from repository.teacher_repository import TeacherRepository
+
+    reviews = ReviewRepository(data_dir)
+    subscribers = SubscriberRepository(data_dir)
+    teachers = TeacherRepository(data_dir)
+    start.wait()
+
+    for i in range(records):
+        key = f'{worker}-{i}'
+        reviews.create(Review(id=key, teacher_id='1', author_name=f'Worker {worker}', rating=5,
+                              comment='stress', created_at='2026-01-01T00:00:00'))
+        subscribers.create(Subscriber(id=key, email=f'{key}@stress.local', name=key,
+                                      subscribed_at='2026-01-01T00:00:00'))
+        teachers.update_rating(key, 4.5, i + 1)
+
+
+def _read_json(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def run(processes: int, records: int) -> bool:
+    """
+    Runs writers in a temporary data directory.
+
+    Returns:
+        True if every record was stored
+    """
+    data_dir = tempfile.mkdtemp(prefix='sdu-stress-')
+    try:
+        start = multiprocessing.Event()
+        workers = [multiprocessing.Process(target=_worker, args=(data_dir, w, records, start))
+                   for w in range(processes)]
+        for process in workers:
+            process.start()
+        started = time.time()
+        start.set()
+        for process in workers:
+            process.join()
+        elapsed = time.time() - started
+
+        from repository.review_repository import ReviewRepository
+        from repository.subscriber_repository import SubscriberRepository
+
+        expected = {f'{w}-{i}' for w in range(processes) for i in range(records)}
+        found = {
+            'reviews': {r.id for r in ReviewRepository(data_dir).get_all()},
+            'subscribers': {s.id for s in SubscriberRepository(data_dir).get_all()},
+            'ratings': set(_read_json(os.path.join(data_dir, 'ratings.json')))
+        }
+
+        ok = all(process.exitcode == 0 for process in workers)
+        print(f"[Stress] {processes} processes x {records} records in {elapsed:.1f}s")
+        for name, ids in found.items():
+            missing = len(expected - ids)
+            ok = ok and missing == 0
+            print(f"[Stress] {name}: {len(ids)}/{len(expected)} stored, {missing} lost")
+        return ok
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Parallel repository writers, checks for lost records')
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--records', type=int, default=200)
+    parser.add_argument('--backend', choices=('json', 'sqlite'), default='json')
+    args = parser.parse_args()
+
+    os.environ['STORAGE_BACKEND'] = args.backend
+    ok = run(args.processes, args.records)
+    print('[Stress] OK' if ok else '[Stress] FAILED: records were lost')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+"""
+News Digest Scheduler
+
+Subscribers with hourly or daily digest get one email per window with all
+news published (or updated) in it, instead of one email per news.
+Pending news are stored per subscriber (DigestRepository); a background
+thread sends digests of finished windows through EmailService in batches.
+"""
+import atexit
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from config import Config
+from repository.digest_repository import DigestRepository
+from repository.news_repository import NewsRepository
+from repository.subscriber_repository import SubscriberRepository
+
+IMMEDIATE = 'immediate'
+HOURLY = 'hourly'
+DAILY = 'daily'
+FREQUENCIES = (IMMEDIATE, HOURLY, DAILY)
+
+
+class DigestScheduler:
+    """
+    Accumulates news per digest subscriber and sends them once per window.
+
+    Hourly windows end at the top of every hour, daily ones at `daily_hour`
+    (local time). A digest is queued with an idempotency key of its window,
+    so a digest interrupted by a restart is not sent twice.
+    """
+
+    def __init__(self, digest_repository: DigestRepository = None,
+                 subscriber_repository: SubscriberRepository = None,
+                 news_repository: NewsRepository = None, email_service=None,
+                 check_interval: float = 60.0, daily_hour: int = 9, page_size: int = 500):
+        """
+        Args:
+            digest_repository: Pending digest items
+            subscriber_repository: Subscriber storage
+            news_repository: News storage
+            email_service: Sends digests (default: get_email_service())
+            check_interval: Seconds between checks for finished windows
+            daily_hour: Hour (local time) when daily digests are sent
+            page_size: Subscribers loaded and queued at once
+        """
+        self._repo = digest_repository or DigestRepository()
+        self._subscriber_repo = subscriber_repository or SubscriberRepository()
+        self._news_repo = news_repository or NewsRepository()
+        self._email_service = email_service
+        self._check_interval = check_interval
+        self._daily_hour = daily_hour
+        self._page_size = page_size
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        atexit.register(self.stop)
+
+    # ==========================================
+    # Public API
+    # ==========================================
+
+    def add(self, subscriber_id: str, news_id: str, frequency: str) -> None:
+        """
+        Adds news to subscriber's next digest.
+
+        Args:
+            subscriber_id: Subscriber ID
+            news_id: Published or updated news
+            frequency: Subscriber's digest frequency (hourly, daily)
+        """
+        self._repo.add(subscriber_id, news_id, frequency)
+        self.start()
+
+    def set_frequency(self, subscriber_id: str, frequency: str) -> None:
+        """
+        Applies subscriber's new frequency to pending news
+        (with 'immediate' they are sent as a digest on the next check).
+        """
+        self._repo.set_frequency(subscriber_id, frequency)
+
+    def remove_subscriber(self, subscriber_id: str) -> None:
+        """Drops pending news of an unsubscribed subscriber."""
+        self._repo.remove_subscriber(subscriber_id)
+
+    def get_pending_count(self) -> int:
+        """Returns number of news waiting for digests."""
+        return self._repo.count()
+
+    def window_end(self, frequency: str, now: datetime = None) -> float:
+        """
+        Returns end of the last finished window (Unix time).
+
+        Items added before it are due.
+        """
+        now = now or datetime.now()
+        if frequency == HOURLY:
+            end = now.replace(minute=0, second=0, microsecond=0)
+        elif frequency == DAILY:
+            end = now.replace(hour=self._daily_hour, minute=0, second=0, microsecond=0)
+            if end > now:
+                end -= timedelta(days=1)
+        else:
+            # Subscriber switched back to immediate emails
+            end = now
+        return end.timestamp()
+
+    def run_due(self, now: datetime = None) -> int:
+        """
+        Sends digests of finished windows.
+
+        Args:
+            now: Current time (for tests and manual runs)
+
+        Returns:
+            Number of queued digests
+        """
+        sent = 0
+        for frequency in FREQUENCIES:
+            sent += self._send_window(frequency, self.window_end(frequency, now))
+        if sent:
+            print(f"[Digest] {sent} digests sent")
+        return sent
+
+    def start(self) -> None:
+        """Starts background thread sending due digests."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='news-digest', daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        """Stops background thread (pending news stay stored)."""
+        self._stop_event.set()
+
+    # ==========================================
+    # Sending
+    # ==========================================
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.run_due()
+            except Exception as e:
+                print(f"[Digest] Error: {e}")
+            if self._stop_event.wait(self._check_interval):
+                return
+
+    def _get_email_service(self):
+        if self._email_service is None:
+            # Import here to avoid circular imports
+            from services.email_service import get_email_service
+            self._email_service = get_email_service()
+        return self._email_service
+
+    def _send_window(self, frequency: str, window_end: float) -> int:
+        """Sends digests of one frequency, a page of subscribers at a time."""
+        email_service = self._get_email_service()
+        window = int(window_end)
+        sent = 0
+        last_id = ''
+        while True:
+            subscriber_ids = self._repo.get_due_subscribers(frequency, window_end, last_id, self._page_size)
+            if not subscriber_ids:
+                return sent
+            last_id = subscriber_ids[-1]
+
+            with email_service.batch():
+                for subscriber_id in subscriber_ids:
+                    subscriber = self._subscriber_repo.get_by_id(subscriber_id)
+                    if subscriber is None or not subscriber.is_active:
+                        continue
+                    news_list = [news for news in map(self._news_repo.get_by_id,
+                                                      self._repo.get_items(subscriber_id, window_end))
+                                 if news is not None and news.is_published]
+                    if not news_list:
+                        continue
+                    email_service.send_news_digest(
+                        subscriber.email, subscriber.name, news_list,
+                        language=subscriber.language, subscriber_id=subscriber_id,
+                        key=f"digest:{subscriber_id}:{frequency}:{window}"
+                    )
+                    sent += 1
+            # Remove items once their digests are queued
+            self._repo.remove_items(subscriber_ids, window_end)
+
+
+_digest_scheduler: Optional[DigestScheduler] = None
+
+
+def get_digest_scheduler() -> DigestScheduler:
+    global _digest_scheduler
+    if _digest_scheduler is None:
+        _digest_scheduler = DigestScheduler(
+            check_interval=Config.DIGEST_CHECK_INTERVAL,
+            daily_hour=Config.DIGEST_DAILY_HOUR
+        )
+    return _digest_scheduler
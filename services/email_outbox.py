@@ -0,0 +1,281 @@
+"""
+Email Outbox
+
+Outgoing emails are stored in a durable queue (EmailOutboxRepository) and
+delivered by a pool of worker threads, so a request (checkout,
+subscription, news fan-out) does not wait for SMTP, and queued emails
+survive a restart. Failed deliveries are retried with exponential backoff;
+queued messages are drained at process shutdown, and whatever is left is
+resumed by the next start().
+"""
+import atexit
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional
+
+from models.email_message import EmailMessage
+from repository.email_outbox_repository import EmailOutboxRepository
+
+
+class EmailDeliveryError(Exception):
+    """
+    Email could not be delivered.
+
+    Permanent errors (invalid credentials, rejected recipient) are not retried.
+    """
+
+    def __init__(self, message: str, permanent: bool = False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+class EmailOutbox:
+    """
+    Durable queue of outgoing emails processed by worker threads.
+
+    Workers claim `batch_size` messages at a time, so memory use does not
+    depend on the number of queued messages. Delivery is at-least-once:
+    a message whose worker died is delivered again after its lease expires.
+    """
+
+    def __init__(self, deliver: Callable[[EmailMessage], None],
+                 repository: EmailOutboxRepository = None, workers: int = 4,
+                 max_attempts: int = 3, retry_delay: float = 2.0, batch_size: int = 10,
+                 lease: float = 60.0, poll_interval: float = 1.0,
+                 retention: float = 30 * 24 * 3600):
+        """
+        Args:
+            deliver: Sends one message, raises on failure (EmailDeliveryError
+                     with permanent=True stops retries)
+            repository: Message storage (default: table in data/sdu.sqlite3)
+            workers: Number of worker threads
+            max_attempts: Delivery attempts before a message is marked as failed
+            retry_delay: Delay before the first retry, doubled on every next one
+            batch_size: Messages claimed by a worker at once
+            lease: Seconds after which an unfinished message is delivered again
+            poll_interval: Seconds between checks for due retries
+            retention: Seconds sent and failed messages (and their keys) are kept
+        """
+        self._deliver = deliver
+        self._repo = repository or EmailOutboxRepository()
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._batch_size = batch_size
+        self._lease = lease
+        self._poll_interval = poll_interval
+        self._retention = retention
+        # Marks rows queued or claimed here, drain() waits only for those
+        self._owner = f'{os.getpid()}-{uuid.uuid4().hex[:8]}'
+
+        self._wakeup = threading.Event()
+        self._local = threading.local()
+        self._draining = False
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+        atexit.register(self.drain)
+
+    # ==========================================
+    # Public API
+    # ==========================================
+
+    @staticmethod
+    def create_message(to_email: str, subject: str = '', body: str = '', html: bool = False,
+                       kind: str = 'email', payload: dict = None, key: str = '') -> EmailMessage:
+        """Creates a message to be queued with enqueue_many()."""
+        return EmailMessage(id=str(uuid.uuid4()), to_email=to_email, subject=subject,
+                            body=body, html=html, kind=kind, payload=payload or {},
+                            key=key, available_at=time.time())
+
+    def enqueue(self, to_email: str, subject: str = '', body: str = '', html: bool = False,
+                kind: str = 'email', payload: dict = None, key: str = '') -> Optional[EmailMessage]:
+        """
+        Queues email for delivery.
+
+        Args:
+            kind: 'email' for a rendered message, other kinds are rendered
+                  by `deliver` from payload
+            payload: Data to render the message from
+            key: Idempotency key (the message is queued once per key)
+
+        Returns:
+            Queued message, None if the key was already used (inside batch()
+            duplicates are skipped when the batch is written)
+        """
+        message = self.create_message(to_email, subject, body, html, kind, payload, key)
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None:
+            buffer.append(message)
+            if len(buffer) >= self._local.size:
+                self._flush()
+            return message
+
+        if not self._repo.add(message, self._owner):
+            return None
+        self.start()
+        self._wakeup.set()
+        return message
+
+    def enqueue_many(self, messages: Iterable[EmailMessage]) -> int:
+        """
+        Queues messages in one transaction.
+
+        Returns:
+            Number of queued messages (duplicate keys are skipped)
+        """
+        count = self._repo.add_many(messages, self._owner)
+        if count:
+            self.start()
+            self._wakeup.set()
+        return count
+
+    @contextmanager
+    def batch(self, size: int = 500):
+        """
+        Buffers enqueue() calls of the current thread and writes them in
+        transactions of `size` messages (used for news fan-out).
+        """
+        if getattr(self._local, 'buffer', None) is not None:
+            yield
+            return
+        self._local.buffer = []
+        self._local.size = size
+        try:
+            yield
+        finally:
+            self._flush()
+            self._local.buffer = None
+
+    def _flush(self) -> None:
+        buffer, self._local.buffer = self._local.buffer, []
+        if buffer:
+            self.enqueue_many(buffer)
+
+    def get_status(self, message_id: str) -> Optional[EmailMessage]:
+        """Returns message by ID."""
+        return self._repo.get_by_id(message_id)
+
+    def get_stats(self) -> dict:
+        """Returns number of messages by status and of undelivered ones."""
+        stats = {status: 0 for status in (EmailMessage.QUEUED, EmailMessage.SENDING,
+                                          EmailMessage.SENT, EmailMessage.FAILED)}
+        stats.update(self._repo.count_by_status())
+        stats['pending'] = stats[EmailMessage.QUEUED] + stats[EmailMessage.SENDING]
+        return stats
+
+    def start(self) -> None:
+        """Starts workers, which also resume messages queued before a restart."""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            purged = self._repo.purge(self._retention)
+            if purged:
+                print(f"[EmailOutbox] Purged {purged} old messages")
+            for i in range(self._workers):
+                thread = threading.Thread(target=self._run, args=(self._stop_event,),
+                                          name=f'email-outbox-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def drain(self, timeout: float = 30.0) -> int:
+        """
+        Delivers queued messages (retries are sent right away) and stops workers.
+
+        Waits only for messages this process queued or claimed; messages of
+        other processes sharing the outbox are left to their workers.
+        Messages enqueued afterwards start the workers again; messages left
+        after the timeout stay queued for the next start.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Number of messages left undelivered
+        """
+        with self._lock:
+            if not self._threads:
+                return 0
+            self._draining = True
+        self._wakeup.set()
+
+        deadline = time.monotonic() + timeout
+        left = self._repo.count_pending(self._owner)
+        while left and time.monotonic() < deadline:
+            time.sleep(0.05)
+            left = self._repo.count_pending(self._owner)
+
+        with self._lock:
+            threads, self._threads = self._threads, []
+            self._stop_event.set()
+            self._stop_event = threading.Event()
+            self._draining = False
+        self._wakeup.set()
+
+        for thread in threads:
+            thread.join(self._poll_interval + 1.0)
+        if left:
+            print(f"[EmailOutbox] Shutdown with {left} undelivered messages, resumed on next start")
+        return left
+
+    # ==========================================
+    # Workers
+    # ==========================================
+
+    def _run(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            self._wakeup.clear()
+            try:
+                messages = self._repo.claim(self._batch_size, self._lease, ignore_backoff=self._draining,
+                                            owner=self._owner, own_only=self._draining)
+            except Exception as e:
+                print(f"[EmailOutbox] Claim error: {e}")
+                messages = []
+
+            if not messages:
+                self._wakeup.wait(self._poll_interval)
+                continue
+
+            sent = []
+            for message in messages:
+                try:
+                    if self._send(message):
+                        sent.append(message)
+                except Exception as e:
+                    print(f"[EmailOutbox] Worker error: {e}")
+            try:
+                if sent:
+                    self._repo.mark_sent(sent)
+            except Exception as e:
+                # Messages stay leased and are delivered again (at-least-once)
+                print(f"[EmailOutbox] Status update error: {e}")
+
+    def _send(self, message: EmailMessage) -> bool:
+        """
+        Delivers one message, scheduling a retry on failure.
+
+        Returns:
+            True if delivered (the caller marks it as sent)
+        """
+        try:
+            self._deliver(message)
+        except Exception as e:
+            if getattr(e, 'permanent', False) or message.attempts >= self._max_attempts:
+                self._repo.mark_failed(message, str(e))
+                print(f"[EmailOutbox] Delivery to {message.to_email} failed after "
+                      f"{message.attempts} attempts: {e}")
+                return False
+
+            delay = 0.0 if self._draining else self._retry_delay * 2 ** (message.attempts - 1)
+            self._repo.mark_retry(message, str(e), delay)
+            print(f"[EmailOutbox] Delivery to {message.to_email} failed ({e}), retry in {delay:g}s")
+            return False
+
+        message.sent_at = datetime.now().isoformat()
+        return True
@@ -1,25 +1,70 @@
 """
 Email Sending Service via Gmail SMTP
 """
+import atexit
+import hashlib
+from contextlib import contextmanager
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
+from typing import Optional
+from config import Config
+from models.email_message import EmailMessage
+from repository.news_repository import NewsRepository
+from services.email_outbox import EmailOutbox, EmailDeliveryError
+from services.smtp_pool import SmtpConnectionPool
+from services.email_templates import EmailTemplate, TemplateCache, slot
 from utils.i18n import get_translation, DEFAULT_LANGUAGE
 
 
 class EmailService:
+    """
+    Sends emails via SMTP.
+
+    With Config.EMAIL_ASYNC (default) messages are queued in a durable
+    EmailOutbox and delivered by its worker pool, send() returns once the
+    message is queued. News notifications are queued as (news, subscriber)
+    jobs and rendered on delivery.
+    Messages are sent over pooled SMTP sessions (SmtpConnectionPool).
+    """
+
     def __init__(self,
                  smtp_email: str = None,
                  smtp_password: str = None,
                  smtp_server: str = "smtp.gmail.com",
-                 smtp_port: int = 587):
+                 smtp_port: int = 587,
+                 outbox: EmailOutbox = None,
+                 pool: SmtpConnectionPool = None):
         self._email = smtp_email or os.environ.get('SMTP_EMAIL', '')
         self._password = smtp_password or os.environ.get('SMTP_PASSWORD', '')
         self._server = smtp_server
         self._port = smtp_port
         self._enabled = bool(self._email and self._password)
 
+        # Logged-in sessions reused across messages (one per outbox worker)
+        self._pool = pool or SmtpConnectionPool(
+            self._server, self._port, self._email, self._password,
+            size=Config.SMTP_POOL_SIZE or Config.EMAIL_WORKERS,
+            max_messages=Config.SMTP_MAX_MESSAGES_PER_CONNECTION,
+            idle_timeout=Config.SMTP_IDLE_TIMEOUT
+        )
+        atexit.register(self._pool.close)
+
+        # Rendered emails per (kind, language, content), filled per recipient
+        self._templates = TemplateCache()
+        self._news_repo = NewsRepository()
+
+        self._outbox = outbox
+        if self._outbox is None and Config.EMAIL_ASYNC:
+            self._outbox = EmailOutbox(
+                self._deliver,
+                workers=Config.EMAIL_WORKERS,
+                max_attempts=Config.EMAIL_MAX_ATTEMPTS,
+                retry_delay=Config.EMAIL_RETRY_DELAY,
+                retention=Config.EMAIL_OUTBOX_RETENTION_DAYS * 24 * 3600
+            )
+
         if not self._enabled:
             print("[EmailService] WARNING: Email not configured. Notifications will be console-only.")
 
@@ -28,7 +73,27 @@ class EmailService:
         """Checks if email is configured."""
         return self._enabled
 
+    @property
+    def outbox(self) -> Optional[EmailOutbox]:
+        """Outbox of queued messages (None if emails are sent synchronously)."""
+        return self._outbox
+
+    @contextmanager
+    def batch(self):
+        """Writes emails queued in the block in batches (no-op without the outbox)."""
+        if self._outbox is None:
+            yield
+            return
+        with self._outbox.batch():
+            yield
+
     def send(self, to_email: str, subject: str, body: str, html: bool = False) -> bool:
+        """
+        Sends email, or queues it when the outbox is used.
+
+        Returns:
+            True if the email was sent (queued)
+        """
         print(f"[Email] Sending to {to_email}")
         print(f"  Subject: {subject}")
 
@@ -36,38 +101,55 @@ class EmailService:
             print("  [SIMULATION] Email not configured, message not sent")
             return False
 
+        if self._outbox is not None:
+            message = self._outbox.enqueue(to_email, subject, body, html)
+            print(f"  [QUEUED] Message {message.id}")
+            return True
+
+        message = EmailMessage(id='', to_email=to_email, subject=subject, body=body, html=html)
+        try:
+            self._deliver(message)
+        except EmailDeliveryError as e:
+            print(f"  [ERROR] {e}")
+            return False
+        return True
+
+    def _deliver(self, message: EmailMessage) -> None:
+        """
+        Delivers message over SMTP.
+
+        Raises:
+            EmailDeliveryError: If the message was not sent
+        """
+        if message.kind != 'email':
+            self._render_queued(message)
+
         try:
             msg = MIMEMultipart('alternative')
             msg['From'] = self._email
-            msg['To'] = to_email
-            msg['Subject'] = subject
+            msg['To'] = message.to_email
+            msg['Subject'] = message.subject
 
-            content_type = 'html' if html else 'plain'
-            msg.attach(MIMEText(body, content_type, 'utf-8'))
+            content_type = 'html' if message.html else 'plain'
+            msg.attach(MIMEText(message.body, content_type, 'utf-8'))
 
-            with smtplib.SMTP(self._server, self._port) as server:
-                server.starttls()
-                server.login(self._email, self._password)
-                server.send_message(msg)
+            self._pool.send_message(msg)
 
-            print(f"  [SUCCESS] Email sent to {to_email}")
-            return True
+            print(f"  [SUCCESS] Email sent to {message.to_email}")
 
         except smtplib.SMTPAuthenticationError:
-            print("  [ERROR] Invalid Gmail email or password")
-            return False
+            raise EmailDeliveryError("Invalid Gmail email or password", permanent=True)
+        except smtplib.SMTPRecipientsRefused as e:
+            raise EmailDeliveryError(f"Recipient refused: {e}", permanent=True)
         except smtplib.SMTPException as e:
-            print(f"  [ERROR] SMTP error: {e}")
-            return False
+            raise EmailDeliveryError(f"SMTP error: {e}")
         except Exception as e:
-            print(f"  [ERROR] Unknown error: {e}")
-            return False
+            raise EmailDeliveryError(f"Unknown error: {e}")
 
     def send_order_confirmation(self, order) -> bool:
         lang = getattr(order, 'language', DEFAULT_LANGUAGE)
-        t = lambda key: get_translation(f'shop.email.{key}', lang)
-        
-        subject = f"🛒 {t('order_accepted')} #{order.id[:8]} - SDU SuperApp"
+        template = self._templates.get(('order_accepted', lang),
+                                       lambda: self._order_confirmation_template(lang))
 
         items_html = ""
         for item in order.items:
@@ -80,11 +162,13 @@ class EmailService:
             </tr>
             """
 
-        try:
-            dt = datetime.fromisoformat(order.created_at)
-            formatted_date = dt.strftime("%d.%m.%Y %H:%M")
-        except:
-            formatted_date = order.created_at[:16].replace('T', ' ')
+        subject, html_body = template.render(items=items_html, **self._order_values(order))
+        return self.send(order.customer_email, subject, html_body, html=True)
+
+    def _order_confirmation_template(self, lang: str) -> EmailTemplate:
+        t = lambda key: get_translation(f'shop.email.{key}', lang)
+
+        subject = f"🛒 {t('order_accepted')} #{slot('order_id')} - SDU SuperApp"
 
         html_body = f"""
 <!DOCTYPE html>
@@ -101,17 +185,17 @@ class EmailService:
                 ✅ {t('order_accepted')}
             </h1>
             <p style="color: rgba(255,255,255,0.9); margin: 10px 0 0 0; font-size: 14px;">
-                {t('order_number')} #{order.id[:8]}
+                {t('order_number')} #{slot('order_id')}
             </p>
             <p style="color: rgba(255,255,255,0.8); margin: 5px 0 0 0; font-size: 12px;">
-                📅 {formatted_date}
+                📅 {slot('date')}
             </p>
         </div>
         
         <!-- Content -->
         <div style="padding: 30px;">
             <p style="color: #333; font-size: 16px; margin: 0 0 20px 0;">
-                {t('hello')}, <strong>{order.customer_name}</strong>! 👋
+                {t('hello')}, <strong>{slot('customer_name')}</strong>! 👋
             </p>
             
             <p style="color: #666; font-size: 15px; margin: 0 0 25px 0;">
@@ -133,13 +217,13 @@ class EmailService:
                         </tr>
                     </thead>
                     <tbody>
-                        {items_html}
+                        {slot('items')}
                     </tbody>
                 </table>
                 
                 <div style="margin-top: 15px; padding-top: 15px; border-top: 2px solid #11998e;">
                     <p style="margin: 0; font-size: 18px; font-weight: bold; color: #333; text-align: right;">
-                        {t('total')} {order.total_amount:.0f} ₸
+                        {t('total')} {slot('total')} ₸
                     </p>
                 </div>
             </div>
@@ -168,14 +252,35 @@ class EmailService:
 </body>
 </html>
 """
-        return self.send(order.customer_email, subject, html_body, html=True)
+        return EmailTemplate(subject, html_body)
+
+    @staticmethod
+    def _order_values(order) -> dict:
+        """Returns order-specific values of order email templates."""
+        try:
+            dt = datetime.fromisoformat(order.created_at)
+            formatted_date = dt.strftime("%d.%m.%Y %H:%M")
+        except:
+            formatted_date = order.created_at[:16].replace('T', ' ')
+
+        return {
+            'order_id': order.id[:8],
+            'customer_name': order.customer_name,
+            'total': f"{order.total_amount:.0f}",
+            'date': formatted_date
+        }
 
     def send_order_confirmed(self, order) -> bool:
         """Notification about order confirmation."""
         lang = getattr(order, 'language', DEFAULT_LANGUAGE)
+        template = self._templates.get(('order_confirmed', lang), lambda: self._order_confirmed_template(lang))
+        subject, html_body = template.render(**self._order_values(order))
+        return self.send(order.customer_email, subject, html_body, html=True)
+
+    def _order_confirmed_template(self, lang: str) -> EmailTemplate:
         t = lambda key: get_translation(f'shop.email.{key}', lang)
-        
-        subject = f"✅ {t('order_confirmed')} #{order.id[:8]} - SDU SuperApp"
+
+        subject = f"✅ {t('order_confirmed')} #{slot('order_id')} - SDU SuperApp"
 
         html_body = f"""
 <!DOCTYPE html>
@@ -197,15 +302,15 @@ class EmailService:
         <!-- Content -->
         <div style="padding: 30px; text-align: center;">
             <p style="color: #333; font-size: 16px; margin: 0 0 20px 0;">
-                {t('hello')}, <strong>{order.customer_name}</strong>! 👋
+                {t('hello')}, <strong>{slot('customer_name')}</strong>! 👋
             </p>
             
             <div style="background: #d4edda; border-radius: 12px; padding: 25px; margin: 20px 0;">
                 <p style="color: #155724; font-size: 18px; margin: 0 0 10px 0; font-weight: bold;">
-                    {t('order_confirmed_message')} #{order.id[:8]}
+                    {t('order_confirmed_message')} #{slot('order_id')}
                 </p>
                 <p style="color: #155724; font-size: 24px; margin: 0; font-weight: bold;">
-                    💰 {order.total_amount:.0f} ₸
+                    💰 {slot('total')} ₸
                 </p>
             </div>
             
@@ -227,14 +332,19 @@ class EmailService:
 </body>
 </html>
 """
-        return self.send(order.customer_email, subject, html_body, html=True)
+        return EmailTemplate(subject, html_body)
 
     def send_order_cancelled(self, order) -> bool:
         """Notification about order cancellation."""
         lang = getattr(order, 'language', DEFAULT_LANGUAGE)
+        template = self._templates.get(('order_cancelled', lang), lambda: self._order_cancelled_template(lang))
+        subject, html_body = template.render(**self._order_values(order))
+        return self.send(order.customer_email, subject, html_body, html=True)
+
+    def _order_cancelled_template(self, lang: str) -> EmailTemplate:
         t = lambda key: get_translation(f'shop.email.{key}', lang)
-        
-        subject = f"❌ {t('order_cancelled')} #{order.id[:8]} - SDU SuperApp"
+
+        subject = f"❌ {t('order_cancelled')} #{slot('order_id')} - SDU SuperApp"
 
         html_body = f"""
 <!DOCTYPE html>
@@ -256,12 +366,12 @@ class EmailService:
         <!-- Content -->
         <div style="padding: 30px; text-align: center;">
             <p style="color: #333; font-size: 16px; margin: 0 0 20px 0;">
-                {t('hello')}, <strong>{order.customer_name}</strong>!
+                {t('hello')}, <strong>{slot('customer_name')}</strong>!
             </p>
             
             <div style="background: #f8d7da; border-radius: 12px; padding: 25px; margin: 20px 0;">
                 <p style="color: #721c24; font-size: 16px; margin: 0;">
-                    {t('order_cancelled_reason')} <strong>#{order.id[:8]}</strong>
+                    {t('order_cancelled_reason')} <strong>#{slot('order_id')}</strong>
                 </p>
             </div>
             
@@ -287,20 +397,104 @@ class EmailService:
 </body>
 </html>
 """
-        return self.send(order.customer_email, subject, html_body, html=True)
+        return EmailTemplate(subject, html_body)
+
+    def _queue_news(self, kind: str, news, subscriber_id: str, subscriber_email: str,
+                    subscriber_name: str, base_url: str, language: str) -> bool:
+        """
+        Queues news notification, rendered from the stored news on delivery.
+
+        Idempotency key is (kind, news, subscriber); an update notification
+        is keyed on the updated content as well, so each distinct edit is sent once.
+
+        Returns:
+            True if queued, False if this notification was already queued
+        """
+        key = f"{kind}:{news.id}:{subscriber_id}"
+        if kind == 'news_updated':
+            version = hashlib.sha1(
+                '\x00'.join((news.title, news.content, news.category, news.author)).encode('utf-8')
+            ).hexdigest()[:12]
+            key = f"{kind}:{news.id}:{version}:{subscriber_id}"
+
+        payload = {
+            'news_id': news.id,
+            'subscriber_id': subscriber_id,
+            'name': subscriber_name,
+            'language': language,
+            'base_url': base_url
+        }
+        message = self._outbox.enqueue(subscriber_email, html=True, kind=kind, payload=payload, key=key)
+        if message is None:
+            print(f"[Email] {kind} for {subscriber_email} already queued, skipped")
+            return False
+        return True
+
+    def _render_queued(self, message: EmailMessage) -> None:
+        """Renders subject and body of a queued news notification."""
+        payload = message.payload
+        if message.kind == 'news_digest':
+            news_list = [news for news in map(self._news_repo.get_by_id, payload['news_ids']) if news is not None]
+            if not news_list:
+                raise EmailDeliveryError("News of the digest not found", permanent=True)
+            message.subject, message.body = self._render_digest(
+                news_list, payload['name'], payload['base_url'], payload['language'])
+            message.html = True
+            return
+
+        news = self._news_repo.get_by_id(payload['news_id'])
+        if news is None:
+            raise EmailDeliveryError(f"News {payload['news_id']} not found", permanent=True)
+
+        build = self._news_created_template if message.kind == 'news_created' else self._news_updated_template
+        template = self._news_template(message.kind, news, payload['base_url'], payload['language'], build)
+        message.subject, message.body = template.render(subscriber_name=payload['name'])
+        message.html = True
 
-    def send_news_notification(self, subscriber_email: str, subscriber_name: str, news, base_url: str = "http://127.0.0.1:5001", language: str = DEFAULT_LANGUAGE) -> bool:
+    def _news_template(self, kind: str, news, base_url: str, lang: str, build) -> EmailTemplate:
+        """
+        Returns news email template, rendered once per news content and language.
+
+        Args:
+            kind: Email kind (news_created, news_updated)
+            news: News object
+            base_url: Site base URL
+            lang: Recipient language
+            build: Renders the template: build(news, lang, base_url)
+        """
+        key = (
+            kind, lang, base_url, news.id, news.title, news.author,
+            getattr(news, 'image', None), getattr(news, 'created_at', None),
+            news.get_title(lang) if hasattr(news, 'get_title') else news.title,
+            news.get_content(lang) if hasattr(news, 'get_content') else news.content,
+            news.get_category(lang) if hasattr(news, 'get_category') else news.category
+        )
+        return self._templates.get(key, lambda: build(news, lang, base_url))
+
+    def send_news_notification(self, subscriber_email: str, subscriber_name: str, news, base_url: str = "http://127.0.0.1:5001", language: str = DEFAULT_LANGUAGE, subscriber_id: str = None) -> bool:
         """
         Sends notification about new news.
 
+        With the outbox and subscriber_id, the notification is queued once
+        per (news, subscriber) and rendered on delivery.
+
         Args:
             subscriber_email: Subscriber email
             subscriber_name: Subscriber name
             news: News object
             base_url: Site base URL
             language: Subscriber language (ru, en, kz)
+            subscriber_id: Subscriber ID (idempotency key of the notification)
         """
-        lang = language
+        if subscriber_id and self._enabled and self._outbox is not None:
+            return self._queue_news('news_created', news, subscriber_id, subscriber_email,
+                                    subscriber_name, base_url, language)
+
+        template = self._news_template('news_created', news, base_url, language, self._news_created_template)
+        subject, html_body = template.render(subscriber_name=subscriber_name)
+        return self.send(subscriber_email, subject, html_body, html=True)
+
+    def _news_created_template(self, news, lang: str, base_url: str) -> EmailTemplate:
         t = lambda key: get_translation(f'shop.email.{key}', lang)
         
         # Get translated news title
@@ -355,7 +549,7 @@ class EmailService:
         <!-- Content -->
         <div style="padding: 35px 30px;">
             <p style="color: #333; font-size: 16px; margin: 0 0 25px 0;">
-                {t('hello')}, <span style="color: #667eea; font-weight: 600;">{subscriber_name}</span>! 👋
+                {t('hello')}, <span style="color: #667eea; font-weight: 600;">{slot('subscriber_name')}</span>! 👋
             </p>
             
             <!-- News Card -->
@@ -421,10 +615,18 @@ class EmailService:
 </body>
 </html>
 """
+        return EmailTemplate(subject, html_body)
+
+    def send_news_update_notification(self, subscriber_email: str, subscriber_name: str, news, base_url: str = "http://127.0.0.1:5001", language: str = DEFAULT_LANGUAGE, subscriber_id: str = None) -> bool:
+        if subscriber_id and self._enabled and self._outbox is not None:
+            return self._queue_news('news_updated', news, subscriber_id, subscriber_email,
+                                    subscriber_name, base_url, language)
+
+        template = self._news_template('news_updated', news, base_url, language, self._news_updated_template)
+        subject, html_body = template.render(subscriber_name=subscriber_name)
         return self.send(subscriber_email, subject, html_body, html=True)
 
-    def send_news_update_notification(self, subscriber_email: str, subscriber_name: str, news, base_url: str = "http://127.0.0.1:5001", language: str = DEFAULT_LANGUAGE) -> bool:
-        lang = language
+    def _news_updated_template(self, news, lang: str, base_url: str) -> EmailTemplate:
         t = lambda key: get_translation(f'shop.email.{key}', lang)
 
         news_title = news.get_title(lang) if hasattr(news, 'get_title') else news.title
@@ -476,7 +678,7 @@ class EmailService:
         <!-- Content -->
         <div style="padding: 35px 30px;">
             <p style="color: #333; font-size: 16px; margin: 0 0 25px 0;">
-                {t('hello')}, <span style="color: #667eea; font-weight: 600;">{subscriber_name}</span>! 👋
+                {t('hello')}, <span style="color: #667eea; font-weight: 600;">{slot('subscriber_name')}</span>! 👋
             </p>
             
             <p style="color: #666; font-size: 15px; margin: 0 0 20px 0;">
@@ -546,19 +748,174 @@ class EmailService:
 </body>
 </html>
 """
+        return EmailTemplate(subject, html_body)
+
+    def send_news_digest(self, subscriber_email: str, subscriber_name: str, news_list: list, base_url: str = "http://127.0.0.1:5001", language: str = DEFAULT_LANGUAGE, subscriber_id: str = None, key: str = '') -> bool:
+        """
+        Sends one email with several news (hourly/daily digest).
+
+        With the outbox and subscriber_id, the digest is queued with
+        idempotency key `key` and rendered on delivery.
+
+        Args:
+            subscriber_email: Subscriber email
+            subscriber_name: Subscriber name
+            news_list: News of the digest, oldest first
+            base_url: Site base URL
+            language: Subscriber language
+            subscriber_id: Subscriber ID
+            key: Idempotency key of the digest window
+        """
+        if subscriber_id and self._enabled and self._outbox is not None:
+            payload = {
+                'news_ids': [news.id for news in news_list],
+                'subscriber_id': subscriber_id,
+                'name': subscriber_name,
+                'language': language,
+                'base_url': base_url
+            }
+            message = self._outbox.enqueue(subscriber_email, html=True, kind='news_digest',
+                                           payload=payload, key=key)
+            if message is None:
+                print(f"[Email] Digest for {subscriber_email} already queued, skipped")
+                return False
+            return True
+
+        subject, html_body = self._render_digest(news_list, subscriber_name, base_url, language)
         return self.send(subscriber_email, subject, html_body, html=True)
 
+    def _render_digest(self, news_list: list, subscriber_name: str, base_url: str, lang: str) -> tuple:
+        """
+        Renders digest: the frame once per language, each news once per content.
+
+        Returns:
+            (subject, body)
+        """
+        items = ''.join(
+            self._news_template('news_digest_item', news, base_url, lang, self._digest_item_template).render()[1]
+            for news in news_list
+        )
+        template = self._templates.get(('news_digest', lang, base_url),
+                                       lambda: self._digest_template(lang, base_url))
+        return template.render(subscriber_name=subscriber_name, count=len(news_list), items=items)
+
+    def _digest_item_template(self, news, lang: str, base_url: str) -> EmailTemplate:
+        t = lambda key: get_translation(f'shop.email.{key}', lang)
+
+        news_title = news.get_title(lang) if hasattr(news, 'get_title') else news.title
+        news_content = news.get_content(lang) if hasattr(news, 'get_content') else news.content
+        news_category = news.get_category(lang) if hasattr(news, 'get_category') else news.category
+
+        news_url = f"{base_url}/news/{news.id}"
+        pub_date = news.created_at[:10] if hasattr(news, 'created_at') else t('today')
+
+        html_item = f"""
+            <!-- News Card -->
+            <div style="background: #f8f9fa; border-radius: 16px; margin-bottom: 20px; border: 1px solid #eee; padding: 22px;">
+                <div style="margin-bottom: 12px;">
+                    <span style="background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 5px 12px; border-radius: 20px; font-size: 11px; font-weight: 600; text-transform: uppercase; letter-spacing: 1px;">
+                        {news_category}
+                    </span>
+                    <span style="color: #888; font-size: 12px; margin-left: 15px;">
+                        📅 {t('date')} {pub_date}
+                    </span>
+                </div>
+                <h2 style="color: #333; font-size: 19px; margin: 0 0 10px 0; line-height: 1.4; font-weight: 700;">
+                    {news_title}
+                </h2>
+                <p style="color: #555; font-size: 14px; line-height: 1.6; margin: 0 0 12px 0;">
+                    {news_content[:200]}{'...' if len(news_content) > 200 else ''}
+                </p>
+                <a href="{news_url}" style="color: #667eea; font-size: 13px; font-weight: 600; text-decoration: none;">
+                    📖 {t('read_full')} →
+                </a>
+            </div>
+"""
+        return EmailTemplate('', html_item)
+
+    def _digest_template(self, lang: str, base_url: str) -> EmailTemplate:
+        t = lambda key: get_translation(f'shop.email.{key}', lang)
+
+        subject = f"📰 {t('digest_title')} ({slot('count')}) - SDU SuperApp"
+
+        html_body = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+<body style="margin: 0; padding: 0; font-family: 'Segoe UI', Arial, sans-serif; background-color: #f5f5f5;">
+    <div style="max-width: 600px; margin: 0 auto; background-color: #ffffff;">
+        
+        <!-- Header with Logo -->
+        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 40px 30px; text-align: center;">
+            <div style="font-size: 40px; margin-bottom: 15px;">🎓</div>
+            <h1 style="color: #ffffff; margin: 0; font-size: 28px; font-weight: 700; letter-spacing: 1px;">
+                SDU SuperApp
+            </h1>
+            <p style="color: rgba(255,255,255,0.9); margin: 10px 0 0 0; font-size: 13px; text-transform: uppercase; letter-spacing: 2px;">
+                {t('news_title')}
+            </p>
+        </div>
+        
+        <!-- Digest Banner -->
+        <div style="background: linear-gradient(90deg, #e94560, #ff6b6b); padding: 12px; text-align: center;">
+            <span style="color: white; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 1px;">
+                🗞️ {t('digest_title')} · {t('digest_count')} {slot('count')}
+            </span>
+        </div>
+        
+        <!-- Content -->
+        <div style="padding: 35px 30px;">
+            <p style="color: #333; font-size: 16px; margin: 0 0 15px 0;">
+                {t('hello')}, <span style="color: #667eea; font-weight: 600;">{slot('subscriber_name')}</span>! 👋
+            </p>
+            
+            <p style="color: #666; font-size: 15px; margin: 0 0 25px 0;">
+                {t('digest_intro')}
+            </p>
+            {slot('items')}
+            <!-- Link -->
+            <p style="color: #888; font-size: 12px; text-align: center; margin: 25px 0 0 0; word-break: break-all;">
+                {t('link')} <a href="{base_url}/news/" style="color: #667eea; text-decoration: none;">{base_url}/news/</a>
+            </p>
+        </div>
+        
+        <!-- Footer -->
+        <div style="background: #f8f9fa; padding: 25px 30px; text-align: center; border-top: 1px solid #eee;">
+            <p style="color: #888; font-size: 11px; margin: 0 0 8px 0;">
+                {t('unsubscribe_footer')}
+            </p>
+            <p style="color: #aaa; font-size: 10px; margin: 0;">
+                {t('copyright')}
+            </p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+        return EmailTemplate(subject, html_body)
 
     def send_subscription_welcome(self, subscriber_email: str, subscriber_name: str, subscriber_id: str, base_url: str = "http://127.0.0.1:5001", language: str = DEFAULT_LANGUAGE) -> bool:
         from datetime import datetime
-        
-        lang = language
+
+        template = self._templates.get(('welcome', language, base_url),
+                                       lambda: self._welcome_template(language, base_url))
+        subject, html_body = template.render(
+            subscriber_name=subscriber_name,
+            subscriber_email=subscriber_email,
+            subscriber_id=subscriber_id,
+            date=datetime.now().strftime("%d.%m.%Y %H:%M")
+        )
+        return self.send(subscriber_email, subject, html_body, html=True)
+
+    def _welcome_template(self, lang: str, base_url: str) -> EmailTemplate:
         t = lambda key: get_translation(f'shop.email.{key}', lang)
         
         subject = f"🎉 {t('subscription_welcome_title')} - SDU SuperApp"
         
-        unsubscribe_url = f"{base_url}/news/unsubscribe/{subscriber_id}"
-        current_date = datetime.now().strftime("%d.%m.%Y %H:%M")
+        unsubscribe_url = f"{base_url}/news/unsubscribe/{slot('subscriber_id')}"
         
         html_body = f"""
 <!DOCTYPE html>
@@ -588,7 +945,7 @@ class EmailService:
         <!-- Content -->
         <div style="padding: 40px 30px;">
             <p style="color: #333; font-size: 18px; margin: 0 0 25px 0;">
-                {t('hello')}, <span style="color: #11998e; font-weight: 700;">{subscriber_name}</span>! 👋
+                {t('hello')}, <span style="color: #11998e; font-weight: 700;">{slot('subscriber_name')}</span>! 👋
             </p>
             
             <p style="color: #555; font-size: 16px; line-height: 1.8; margin: 0 0 30px 0;">
@@ -598,10 +955,10 @@ class EmailService:
             <!-- Info Card -->
             <div style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); border-radius: 16px; padding: 25px; margin-bottom: 30px; border-left: 4px solid #11998e;">
                 <p style="color: #333; font-size: 14px; margin: 0 0 10px 0;">
-                    📧 <strong>Email:</strong> {subscriber_email}
+                    📧 <strong>Email:</strong> {slot('subscriber_email')}
                 </p>
                 <p style="color: #333; font-size: 14px; margin: 0;">
-                    📅 <strong>{t('subscription_date')}</strong> {current_date}
+                    📅 <strong>{t('subscription_date')}</strong> {slot('date')}
                 </p>
             </div>
             
@@ -654,7 +1011,7 @@ class EmailService:
 </body>
 </html>
 """
-        return self.send(subscriber_email, subject, html_body, html=True)
+        return EmailTemplate(subject, html_body)
 
 _email_service = None
 
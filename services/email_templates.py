@@ -0,0 +1,97 @@
+"""
+Pre-rendered Email Templates
+
+An email is rendered once per (kind, language, content) with named slots
+left for per-recipient values (name, email, unsubscribe link, order
+fragments). Sending to a recipient only joins the cached parts with the
+slot values, so a news fan-out does no HTML formatting or label lookups
+per subscriber.
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, List
+
+# Slot marker inserted while rendering; NUL never occurs in rendered text
+_SLOT = '\x00{}\x00'
+_SLOT_PATTERN = re.compile('\x00(\\w+)\x00')
+
+
+def slot(name: str) -> str:
+    """Returns marker of a per-recipient value, used while rendering a template."""
+    return _SLOT.format(name)
+
+
+class EmailTemplate:
+    """Rendered subject and body with slots for per-recipient values."""
+
+    __slots__ = ('_subject', '_body')
+
+    def __init__(self, subject: str, body: str):
+        # Even items are literal text, odd items are slot names
+        self._subject: List[str] = _SLOT_PATTERN.split(subject)
+        self._body: List[str] = _SLOT_PATTERN.split(body)
+
+    @staticmethod
+    def _fill(parts: List[str], values: dict) -> str:
+        if len(parts) == 1:
+            return parts[0]
+        if len(parts) == 3:
+            return parts[0] + str(values.get(parts[1], '')) + parts[2]
+        filled = parts.copy()
+        for i in range(1, len(filled), 2):
+            filled[i] = str(values.get(filled[i], ''))
+        return ''.join(filled)
+
+    def render(self, **values) -> tuple:
+        """
+        Fills slots.
+
+        Returns:
+            (subject, body)
+        """
+        return self._fill(self._subject, values), self._fill(self._body, values)
+
+
+class TemplateCache:
+    """Thread-safe LRU cache of rendered templates."""
+
+    def __init__(self, max_entries: int = 128):
+        self._max_entries = max_entries
+        self._templates: "OrderedDict[Hashable, EmailTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], EmailTemplate]) -> EmailTemplate:
+        """
+        Returns cached template, building it on first use.
+
+        Args:
+            key: Everything the rendered template depends on
+            build: Renders the template
+        """
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self._hits += 1
+                return template
+            self._misses += 1
+
+        template = build()
+        with self._lock:
+            self._templates[key] = template
+            if len(self._templates) > self._max_entries:
+                self._templates.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        """Drops all templates."""
+        with self._lock:
+            self._templates.clear()
+
+    def get_stats(self) -> dict:
+        """Returns hit/miss counters."""
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses, 'entries': len(self._templates)}
@@ -8,24 +8,30 @@ from repository.subscriber_repository import SubscriberRepository
 from factory.news_factory import NewsFactory
 from observer.news_publisher import NewsPublisher
 from observer.email_subscriber import EmailSubscriber
-from services.translation_service import TranslationService
+from services.translation_jobs import TranslationJobRunner, get_translation_job_runner
+from services.view_counter import ViewCounter, get_view_counter
+from services.digest_scheduler import DigestScheduler, get_digest_scheduler
 
 
 class NewsService:
     """
     Service for working with news.
     Integrates Observer Pattern for notifications.
-    Automatically translates news when creating.
+    Translates news in the background after creating and updating.
     """
 
     def __init__(self, news_repository: NewsRepository = None,
                  subscriber_repository: SubscriberRepository = None,
-                 translation_service: TranslationService = None):
+                 translation_jobs: TranslationJobRunner = None,
+                 view_counter: ViewCounter = None,
+                 digest_scheduler: DigestScheduler = None):
         self._news_repo = news_repository or NewsRepository()
         self._subscriber_repo = subscriber_repository or SubscriberRepository()
         self._factory = NewsFactory()
         self._publisher = NewsPublisher()
-        self._translation_service = translation_service or TranslationService()
+        self._translation_jobs = translation_jobs or get_translation_job_runner()
+        self._view_counter = view_counter or get_view_counter()
+        self._digest_scheduler = digest_scheduler or get_digest_scheduler()
 
         # Initialize subscribers from database
         self._init_subscribers()
@@ -33,32 +39,46 @@ class NewsService:
     def _init_subscribers(self):
         """Loads subscribers and registers them in publisher."""
         subscribers = self._subscriber_repo.get_active()
-        for sub in subscribers:
-            email_observer = EmailSubscriber(sub.id, sub.email, sub.name, sub.language)
-            self._publisher.subscribe_to_all(email_observer)
+        self._publisher.subscribe_many_to_all(self._create_observer(sub) for sub in subscribers)
+
+    @staticmethod
+    def _create_observer(subscriber) -> EmailSubscriber:
+        """Creates email observer with subscriber's language, categories and digest mode."""
+        return EmailSubscriber(subscriber.id, subscriber.email, subscriber.name, subscriber.language,
+                               subscriber.categories, subscriber.digest)
+
+    def _with_pending_views(self, news_list: List[News]) -> List[News]:
+        """Adds views not yet flushed by the view counter."""
+        pending = self._view_counter.get_pending()
+        if pending:
+            for news in news_list:
+                news.views_count += pending.get(news.id, 0)
+        return news_list
 
     def get_all_news(self, limit: int = None) -> List[News]:
         """Returns all published news."""
-        return self._news_repo.get_published(limit)
+        return self._with_pending_views(self._news_repo.get_published(limit))
 
     def get_news_by_id(self, news_id: str) -> Optional[News]:
-        """Returns news by ID and increments view counter."""
+        """Returns news by ID and increments view counter (write-behind)."""
         news = self._news_repo.get_by_id(news_id)
         if news and news.is_published:
-            self._news_repo.increment_views(news_id)
+            self._view_counter.increment(news_id)
+        if news:
+            self._with_pending_views([news])
         return news
 
     def get_news_by_category(self, category: str) -> List[News]:
         """Returns news by category."""
-        return self._news_repo.find_by_category(category)
+        return self._with_pending_views(self._news_repo.find_by_category(category))
 
     def search_news(self, query: str) -> List[News]:
         """Searches news."""
-        return self._news_repo.search(query)
+        return self._with_pending_views(self._news_repo.search(query))
 
     def get_popular_news(self, limit: int = 5) -> List[News]:
         """Returns popular news."""
-        return self._news_repo.get_popular(limit)
+        return self._news_repo.get_popular(limit, self._view_counter.get_pending())
 
     def get_categories(self) -> List[str]:
         """Returns news categories."""
@@ -67,31 +87,13 @@ class NewsService:
     def create_news(self, title: str, content: str, category: str,
                     author: str, image: str = None, publish: bool = True) -> News:
         """
-        Creates news, automatically translates to other languages and notifies subscribers.
-        """
-        # Automatically translate news to English and Kazakh
-        translations = {}
-        if self._translation_service.is_available():
-            try:
-                translations = self._translation_service.translate_news(
-                    title=title,
-                    content=content,
-                    category=category,
-                    author=author,
-                    source_lang='ru'
-                )
-                import logging
-                logging.getLogger(__name__).info(f"News translated successfully. Translations: {list(translations.keys())}")
-            except Exception as e:
-                # If translation failed, continue without translations
-                import logging
-                logging.getLogger(__name__).error(f"Translation failed: {str(e)}", exc_info=True)
-                print(f"⚠️  News translation error: {str(e)}")
-        else:
-            import logging
-            logging.getLogger(__name__).warning("Translation service is not available. Install deep-translator: pip install deep-translator")
-            print("⚠️  Translation service unavailable. Install library: pip install deep-translator")
+        Creates news and notifies subscribers.
 
+        The news is stored in the source language right away. Translation to
+        other languages runs as a background job, which notifies subscribers
+        once translations are stored. Without a translator subscribers are
+        notified immediately.
+        """
         data = {
             'title': title,
             'content': content,
@@ -99,11 +101,21 @@ class NewsService:
             'author': author,
             'image': image,
             'is_published': publish,
-            'translations': translations if translations else None
+            'translations': None
         }
         news = self._factory.create(data)
         created_news = self._news_repo.create(news)
 
+        if self._translation_jobs.is_available():
+            self._translation_jobs.enqueue_news(
+                created_news.id, notify=TranslationJobRunner.NOTIFY_PUBLISH if publish else ''
+            )
+            return created_news
+
+        import logging
+        logging.getLogger(__name__).warning("Translation service is not available. Install deep-translator: pip install deep-translator")
+        print("⚠️  Translation service unavailable. Install library: pip install deep-translator")
+
         # Notify subscribers if published
         if publish:
             self._publisher.publish_news(created_news)
@@ -111,36 +123,21 @@ class NewsService:
         return created_news
 
     def update_news(self, news_id: str, data: dict) -> Optional[News]:
-        """Updates news and automatically translates changes."""
-        news = self._news_repo.get_by_id(news_id)
-        if not news:
-            return None
-
+        """Updates news and queues translation of changed fields."""
         # If title, content, category or author are updated, translate again
         needs_translation = any(key in data for key in ['title', 'content', 'category', 'author'])
 
-        for key, value in data.items():
-            if hasattr(news, key):
-                setattr(news, key, value)
-
-        # If translatable fields changed, update translations
-        if needs_translation and self._translation_service.is_available():
-            try:
-                translations = self._translation_service.translate_news(
-                    title=news.title,
-                    content=news.content,
-                    category=news.category,
-                    author=news.author,
-                    source_lang='ru'
-                )
-                news.translations = translations if translations else news.translations
-            except Exception as e:
-                import logging
-                logging.getLogger(__name__).warning(f"Translation update failed: {str(e)}")
-
-        updated_news = self._news_repo.update(news)
-
-        if updated_news and updated_news.is_published:
+        updated_news = self._news_repo.update_fields(news_id, data)
+        if not updated_news:
+            return None
+
+        if needs_translation and self._translation_jobs.is_available():
+            # Subscribers are notified when the new translations are stored
+            self._translation_jobs.enqueue_news(
+                updated_news.id,
+                notify=TranslationJobRunner.NOTIFY_UPDATE if updated_news.is_published else ''
+            )
+        elif updated_news.is_published:
             self._publisher.update_news(updated_news)
 
         return updated_news
@@ -162,7 +159,8 @@ class NewsService:
 
     # === Subscription Management ===
 
-    def subscribe(self, email: str, name: str, categories: List[str] = None, language: str = 'ru') -> bool:
+    def subscribe(self, email: str, name: str, categories: List[str] = None, language: str = 'ru',
+                  digest: str = 'immediate') -> bool:
         """Subscribes to news."""
         from models.subscriber import Subscriber
         import uuid
@@ -177,11 +175,12 @@ class NewsService:
                 existing_subscriber.is_active = True
                 existing_subscriber.name = name
                 existing_subscriber.language = language
+                existing_subscriber.digest = digest
                 existing_subscriber.subscribed_at = datetime.now().isoformat()
                 self._subscriber_repo.update(existing_subscriber)
                 
                 # Register back in publisher
-                email_observer = EmailSubscriber(existing_subscriber.id, email, name, language)
+                email_observer = self._create_observer(existing_subscriber)
                 self._publisher.subscribe_to_all(email_observer)
                 
                 # Send welcome email
@@ -202,13 +201,14 @@ class NewsService:
             subscribed_at=datetime.now().isoformat(),
             is_active=True,
             categories=categories or ['all'],
-            language=language
+            language=language,
+            digest=digest
         )
 
         self._subscriber_repo.create(subscriber)
 
         # Register in publisher
-        email_observer = EmailSubscriber(subscriber.id, email, name, language)
+        email_observer = self._create_observer(subscriber)
         self._publisher.subscribe_to_all(email_observer)
 
         # Send welcome email
@@ -223,6 +223,8 @@ class NewsService:
         subscriber = self._subscriber_repo.find_by_email(email)
         if subscriber:
             self._subscriber_repo.deactivate(subscriber.id)
+            self._publisher.remove_observer_by_id(subscriber.id)
+            self._digest_scheduler.remove_subscriber(subscriber.id)
             return True
         return False
 
@@ -240,22 +242,20 @@ class NewsService:
         Returns:
             True if updated successfully
         """
+        # Remove old observer (also of a deleted subscriber)
+        self._publisher.remove_observer_by_id(subscriber_id)
+
         subscriber = self._subscriber_repo.get_by_id(subscriber_id)
+        if not subscriber or not subscriber.is_active:
+            self._digest_scheduler.remove_subscriber(subscriber_id)
         if not subscriber:
             return False
         
-        # Remove old observer
-        self._publisher.remove_observer_by_id(subscriber_id)
-        
         # If subscriber is active, create new observer with updated data
         if subscriber.is_active:
-            email_observer = EmailSubscriber(
-                subscriber.id, 
-                subscriber.email, 
-                subscriber.name, 
-                subscriber.language
-            )
+            email_observer = self._create_observer(subscriber)
             self._publisher.subscribe_to_all(email_observer)
+            self._digest_scheduler.set_frequency(subscriber.id, subscriber.digest)
             print(f"[NewsService] Observer for subscriber {subscriber_id} updated (language: {subscriber.language})")
         
         return True
@@ -4,7 +4,8 @@ Adapted for working with real SDU data
 """
 from typing import List, Optional, Tuple
 from datetime import datetime
-from models.room import Cabinet, CabinetLesson, TIME_SLOTS, DAYS_OF_WEEK
+from models.room import (Cabinet, CabinetLesson, TIME_SLOTS, DAYS_OF_WEEK,
+                         parse_time, find_next_slot, find_slot_starting_from, slots_overlapping)
 from repository.room_repository import CabinetRepository
 
 
@@ -50,16 +51,18 @@ class CabinetService:
         """Returns days of week."""
         return DAYS_OF_WEEK
 
-    def _find_time_slot(self, time: str) -> Optional[Tuple[str, str]]:
-        """Finds time slot for the specified time."""
-        for start, end in TIME_SLOTS:
-            if start <= time < end or time == start:
-                return (start, end)
-        # If time is after all slots, return None
-        if time > TIME_SLOTS[-1][1]:
+    def _find_time_slot(self, time: str) -> Optional[int]:
+        """
+        Finds time slot index for the specified time.
+
+        A time inside a slot maps to that slot, a time before the first slot
+        or during a break maps to the next slot. Returns None after the last
+        slot or for an invalid time.
+        """
+        minutes = parse_time(time)
+        if minutes is None:
             return None
-        # If time is before all slots, return first
-        return TIME_SLOTS[0]
+        return find_next_slot(minutes)
 
     def get_free_cabinets(self, week_id: int, time: str,
                           building: str = None) -> List[Cabinet]:
@@ -79,23 +82,47 @@ class CabinetService:
         if slot is None:
             return []
 
-        start_time = slot[0]
+        # Single bitset lookup, result is already sorted by building and name
+        return self._repo.get_free_cabinets(week_id, TIME_SLOTS[slot][0], building)
 
-        # Get all cabinets
-        all_cabinets = self._repo.get_all()
+    def get_free_cabinets_for_range(self, week_id: int, start_time: str, end_time: str,
+                                    building: str = None) -> List[Tuple[Cabinet, Optional[str]]]:
+        """
+        Finds cabinets free during the whole time range.
 
-        # Filter by building
-        if building:
-            all_cabinets = [c for c in all_cabinets
-                          if building.lower() in c.parent_building_en.lower()]
+        Args:
+            week_id: Day of week (1-6, where 1 = Monday)
+            start_time: Range start (format HH:MM or H:MM)
+            end_time: Range end (format HH:MM or H:MM)
+            building: Building filter (optional)
 
-        # Get occupied cabinets
-        occupied = self._repo.get_occupied_cabinets(week_id, start_time)
+        Returns:
+            List of (cabinet, free_until), where free_until is the start time of
+            the next lesson in the cabinet that day, or None if it stays free
+        """
+        start, end = parse_time(start_time), parse_time(end_time)
+        if start is None or end is None:
+            return []
+
+        slots = list(slots_overlapping(start, end))
+        # A range inside a break or outside the schedule overlaps no lesson
+        next_slot = None if slots else find_slot_starting_from(end)
+        result = self._repo.get_free_cabinets_in_slots(week_id, slots, building, next_slot)
+        return [(cabinet, TIME_SLOTS[slot][0] if slot is not None else None)
+                for cabinet, slot in result]
 
-        # Return available ones
-        free_cabinets = [c for c in all_cabinets if str(c.id) not in occupied]
+    def get_free_until(self, cabinet_id: int, week_id: int, time: str) -> Optional[str]:
+        """
+        Returns start time of the next lesson in the cabinet from the given time.
 
-        return sorted(free_cabinets, key=lambda c: (c.parent_building_en, c.name))
+        If the cabinet is occupied at that time, the current slot start is returned.
+        None means there are no more lessons that day.
+        """
+        slot = self._find_time_slot(time)
+        if slot is None:
+            return None
+        next_slot = self._repo.get_next_occupied_slot(cabinet_id, week_id, slot)
+        return TIME_SLOTS[next_slot][0] if next_slot is not None else None
 
     def get_current_free_cabinets(self, building: str = None) -> List[Cabinet]:
         """Finds cabinets available now."""
@@ -117,7 +144,7 @@ class CabinetService:
         """
         now = datetime.now()
         week_id = now.weekday() + 1
-        current_time = now.strftime('%H:%M')
+        current_minutes = now.hour * 60 + now.minute
 
         # If weekend, return Monday
         if week_id == 7:
@@ -125,11 +152,8 @@ class CabinetService:
             next_time = TIME_SLOTS[0][0]
         else:
             # Find next slot
-            next_time = None
-            for start, end in TIME_SLOTS:
-                if current_time < start:
-                    next_time = start
-                    break
+            next_slot = find_slot_starting_from(current_minutes, strict=True)
+            next_time = TIME_SLOTS[next_slot][0] if next_slot is not None else None
 
             if next_time is None:
                 # Move to next day
@@ -145,8 +169,7 @@ class CabinetService:
         if slot is None:
             return True
 
-        occupied = self._repo.get_occupied_cabinets(week_id, slot[0])
-        return str(cabinet_id) not in occupied
+        return not self._repo.is_occupied(cabinet_id, week_id, TIME_SLOTS[slot][0])
 
 
 # Alias for backward compatibility
@@ -3,6 +3,7 @@ Schedule Service
 """
 from typing import List, Optional, Dict
 from models.schedule import Schedule
+from models.room import parse_time
 from repository.schedule_repository import ScheduleRepository
 
 
@@ -47,7 +48,7 @@ class ScheduleService:
 
         # Sort by time
         for day in result:
-            result[day].sort(key=lambda s: s.start_time)
+            result[day].sort(key=lambda s: parse_time(s.start_time) or 0)
 
         return result
 
@@ -62,7 +63,7 @@ class ScheduleService:
                 result[day_name].append(schedule)
 
         for day in result:
-            result[day].sort(key=lambda s: s.start_time)
+            result[day].sort(key=lambda s: parse_time(s.start_time) or 0)
 
         return result
 
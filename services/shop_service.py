@@ -10,18 +10,18 @@ from repository.product_repository import ProductRepository
 from repository.order_repository import OrderRepository
 from factory.product_factory import ProductFactory
 from services.email_service import get_email_service
-from services.translation_service import TranslationService
+from services.translation_jobs import TranslationJobRunner, get_translation_job_runner
 
 class ShopService:
-    """Service for working with the shop. Automatically translates products when creating."""
+    """Service for working with the shop. Translates products in the background."""
 
     def __init__(self, product_repository: ProductRepository = None,
                  order_repository: OrderRepository = None,
-                 translation_service: TranslationService = None):
+                 translation_jobs: TranslationJobRunner = None):
         self._product_repo = product_repository or ProductRepository()
         self._order_repo = order_repository or OrderRepository()
         self._factory = ProductFactory()
-        self._translation_service = translation_service or TranslationService()
+        self._translation_jobs = translation_jobs or get_translation_job_runner()
 
     # === Products ===
 
@@ -46,37 +46,20 @@ class ShopService:
         return self._product_repo.get_categories()
 
     def create_product(self, data: dict) -> Product:
-        """Creates a new product and automatically translates to other languages."""
-        # Automatically translate product to English and Kazakh
-        translations = {}
-        if self._translation_service.is_available():
-            try:
-                translations = self._translation_service.translate_product(
-                    name=data.get('name', ''),
-                    description=data.get('description', ''),
-                    category=data.get('category', ''),
-                    source_lang='ru'
-                )
-                import logging
-                logging.getLogger(__name__).info(f"Product translated successfully. Translations: {list(translations.keys())}")
-            except Exception as e:
-                import logging
-                logging.getLogger(__name__).error(f"Translation failed: {str(e)}", exc_info=True)
-                print(f"⚠️  Product translation error: {str(e)}")
+        """Creates a new product and queues its translation to other languages."""
+        product = self._product_repo.create(self._factory.create(data))
+
+        if self._translation_jobs.is_available():
+            self._translation_jobs.enqueue_product(product.id)
         else:
             import logging
             logging.getLogger(__name__).warning("Translation service is not available. Install deep-translator: pip install deep-translator")
             print("⚠️  Translation service unavailable. Install library: pip install deep-translator")
-        
-        # Add translations to data
-        if translations:
-            data['translations'] = translations
-        
-        product = self._factory.create(data)
-        return self._product_repo.create(product)
+
+        return product
 
     def update_product(self, product_id: str, data: dict) -> Optional[Product]:
-        """Updates product and automatically translates changes."""
+        """Updates product and queues translation of changed fields."""
         product = self._product_repo.get_by_id(product_id)
         if not product:
             return None
@@ -88,21 +71,12 @@ class ShopService:
             if hasattr(product, key):
                 setattr(product, key, value)
 
-        # If translatable fields changed, update translations
-        if needs_translation and self._translation_service.is_available():
-            try:
-                translations = self._translation_service.translate_product(
-                    name=product.name,
-                    description=product.description,
-                    category=product.category,
-                    source_lang='ru'
-                )
-                product.translations = translations if translations else product.translations
-            except Exception as e:
-                import logging
-                logging.getLogger(__name__).warning(f"Translation update failed: {str(e)}")
+        updated_product = self._product_repo.update(product)
+
+        if updated_product and needs_translation and self._translation_jobs.is_available():
+            self._translation_jobs.enqueue_product(updated_product.id)
 
-        return self._product_repo.update(product)
+        return updated_product
 
     def delete_product(self, product_id: str) -> bool:
         """Deletes a product."""
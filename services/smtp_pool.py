@@ -0,0 +1,168 @@
+"""
+SMTP Connection Pool
+
+Keeps logged-in SMTP sessions open between messages, so a news fan-out
+does one TLS handshake and login per connection instead of one per email.
+A session is closed after max_messages messages or idle_timeout seconds
+of inactivity; a session dropped by the server is reopened transparently.
+A message refused by the server (e.g. bad recipient) does not close it.
+"""
+import smtplib
+import ssl
+import threading
+import time
+from email.message import Message
+from typing import List, Optional
+
+
+class _Session:
+    """Open SMTP connection with usage counters."""
+
+    __slots__ = ('smtp', 'messages', 'last_used')
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.messages = 0
+        self.last_used = time.monotonic()
+
+
+class SmtpConnectionPool:
+    """Pool of reusable, authenticated SMTP sessions."""
+
+    def __init__(self, host: str, port: int, username: str = '', password: str = '',
+                 size: int = 4, max_messages: int = 100, idle_timeout: float = 60.0,
+                 starttls: bool = True, ssl_context: ssl.SSLContext = None,
+                 timeout: float = 30.0):
+        """
+        Args:
+            host: SMTP server
+            port: SMTP port
+            username: Login (no login if empty)
+            password: Password
+            size: Maximum number of open sessions
+            max_messages: Messages sent over one session before it is closed
+            idle_timeout: Seconds an unused session is kept open
+            starttls: Upgrade connection with STARTTLS
+            ssl_context: TLS context for STARTTLS (default: system defaults)
+            timeout: Socket timeout in seconds
+        """
+        self._host = host
+        self._port = port
+        self._username = username
+        self._password = password
+        self._max_messages = max_messages
+        self._idle_timeout = idle_timeout
+        self._starttls = starttls
+        self._ssl_context = ssl_context
+        self._timeout = timeout
+
+        self._idle: List[_Session] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._stats = {'connections': 0, 'reconnects': 0, 'messages': 0}
+
+    def send_message(self, msg: Message) -> None:
+        """
+        Sends message over a pooled session.
+
+        Raises:
+            smtplib.SMTPException, OSError: If the message was not sent
+        """
+        with self._slots:
+            session = self._acquire()
+            while True:
+                try:
+                    session.smtp.send_message(msg)
+                    break
+                except Exception as e:
+                    if isinstance(e, smtplib.SMTPException) and not self._is_disconnect(e):
+                        # Refused recipient/sender or data error: smtplib has reset
+                        # the transaction and the session stays usable
+                        self._release(session)
+                        raise
+                    self._close(session)
+                    # A reused session may have been closed by the server, retry once on a new one
+                    if not (session.messages and self._is_disconnect(e)):
+                        raise
+                    with self._lock:
+                        self._stats['reconnects'] += 1
+                    session = self._connect()
+
+            session.messages += 1
+            with self._lock:
+                self._stats['messages'] += 1
+            self._release(session)
+
+    def close(self) -> None:
+        """Closes idle sessions."""
+        with self._lock:
+            sessions, self._idle = self._idle, []
+        for session in sessions:
+            self._close(session)
+
+    def get_stats(self) -> dict:
+        """Returns numbers of opened connections, reconnects and sent messages."""
+        with self._lock:
+            return dict(self._stats, idle=len(self._idle))
+
+    # ==========================================
+    # Sessions
+    # ==========================================
+
+    def _acquire(self) -> _Session:
+        """Returns the most recently used live session or opens a new one."""
+        expired = []
+        session: Optional[_Session] = None
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if now - candidate.last_used < self._idle_timeout:
+                    session = candidate
+                    break
+                expired.append(candidate)
+            # Remaining idle sessions are older than the one taken
+            while self._idle and now - self._idle[0].last_used >= self._idle_timeout:
+                expired.append(self._idle.pop(0))
+
+        for candidate in expired:
+            self._close(candidate)
+        return session or self._connect()
+
+    def _release(self, session: _Session) -> None:
+        """Returns session to the pool, closing it once max_messages is reached."""
+        if session.messages >= self._max_messages:
+            self._close(session)
+            return
+        session.last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(session)
+
+    def _connect(self) -> _Session:
+        smtp = smtplib.SMTP(self._host, self._port, timeout=self._timeout)
+        try:
+            if self._starttls:
+                smtp.starttls(context=self._ssl_context)
+            if self._username:
+                smtp.login(self._username, self._password)
+        except Exception:
+            smtp.close()
+            raise
+        with self._lock:
+            self._stats['connections'] += 1
+        return _Session(smtp)
+
+    @staticmethod
+    def _close(session: _Session) -> None:
+        try:
+            session.smtp.quit()
+        except Exception:
+            session.smtp.close()
+
+    @staticmethod
+    def _is_disconnect(error: Exception) -> bool:
+        """Checks if error means the server closed the connection."""
+        if isinstance(error, (smtplib.SMTPServerDisconnected, ConnectionError)):
+            return True
+        # 421: service not available, closing transmission channel
+        return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code == 421
@@ -0,0 +1,285 @@
+"""
+Background Translation Jobs
+
+News and products are stored in the source language right away, their
+translations are produced afterwards by background workers. A news job can
+carry a publisher event that is sent once translations are stored, so
+subscribers receive emails in their language.
+
+Jobs are persisted in TranslationJobRepository: failed attempts are retried
+with exponential backoff and pending jobs are resumed on startup.
+"""
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from config import Config
+from models.translation_job import TranslationJob
+from repository.translation_job_repository import TranslationJobRepository
+from repository.news_repository import NewsRepository
+from repository.product_repository import ProductRepository
+from observer.news_publisher import NewsPublisher
+from services.translation_service import TranslationService
+
+
+class TranslationJobRunner:
+    """
+    Queue of translation jobs processed by worker threads.
+
+    The translator is taken from the TranslationService, so the runner works
+    with the offline fake translator (TRANSLATOR_BACKEND=fake) as well.
+    """
+
+    NEWS = 'news'
+    PRODUCT = 'product'
+
+    NOTIFY_PUBLISH = 'publish'
+    NOTIFY_UPDATE = 'update'
+
+    # Seconds between purges of finished jobs while workers run
+    PURGE_INTERVAL = 3600
+
+    def __init__(self, job_repository: TranslationJobRepository = None,
+                 translation_service: TranslationService = None,
+                 news_repository: NewsRepository = None,
+                 product_repository: ProductRepository = None,
+                 publisher: NewsPublisher = None,
+                 workers: int = 2, max_attempts: int = 3,
+                 retry_delay: float = 5.0, stale_after: float = 300.0,
+                 retention: float = 7 * 24 * 3600):
+        """
+        Args:
+            workers: Number of worker threads
+            max_attempts: Attempts before a job is marked as failed
+            retry_delay: Delay before the first retry, doubled on every next one
+            stale_after: Seconds after which a running job of a dead process is resumed
+            retention: Seconds finished jobs are kept (superseded ones are purged sooner)
+        """
+        self._job_repo = job_repository or TranslationJobRepository()
+        self._translation_service = translation_service or TranslationService()
+        self._news_repo = news_repository or NewsRepository()
+        self._product_repo = product_repository or ProductRepository()
+        self._publisher = publisher or NewsPublisher()
+        self._workers = workers
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._stale_after = stale_after
+        self._retention = retention
+        self._last_purge = 0.0
+
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    # ==========================================
+    # Public API
+    # ==========================================
+
+    def is_available(self) -> bool:
+        """Checks if translations can be produced."""
+        return self._translation_service.is_available()
+
+    def enqueue_news(self, news_id: str, notify: str = '') -> TranslationJob:
+        """
+        Queues translation of news.
+
+        Args:
+            news_id: News ID
+            notify: Publisher event after translation ('publish', 'update' or '')
+        """
+        return self._enqueue(self.NEWS, news_id, notify)
+
+    def enqueue_product(self, product_id: str) -> TranslationJob:
+        """Queues translation of product."""
+        return self._enqueue(self.PRODUCT, product_id, '')
+
+    def retry(self, job_id: str) -> Optional[TranslationJob]:
+        """Requeues a failed job with a fresh attempt budget."""
+        self.start()
+        with self._job_repo._locked():
+            job = self._job_repo.get_by_id(job_id)
+            if not job or job.status != TranslationJob.FAILED:
+                return None
+            job.status = TranslationJob.PENDING
+            job.attempts = 0
+            job.error = ''
+            job.updated_at = datetime.now().isoformat()
+            self._job_repo.update(job)
+
+        self._queue.put(job.id)
+        return job
+
+    def get_status(self, entity_type: str) -> Dict[str, TranslationJob]:
+        """Returns latest job of every entity of the type: {entity_id: job}."""
+        return self._job_repo.get_latest_by_entity(entity_type)
+
+    def start(self) -> None:
+        """Starts workers and resumes unfinished jobs (once)."""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self._workers):
+                thread = threading.Thread(target=self._run, name=f'translation-job-{i}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        self.purge()
+        self.resume()
+
+    def purge(self) -> int:
+        """
+        Deletes old and superseded finished jobs, so the job list stays bounded.
+
+        Returns:
+            Number of deleted jobs
+        """
+        self._last_purge = time.monotonic()
+        purged = self._job_repo.purge(self._retention)
+        if purged:
+            print(f"[TranslationJobs] Purged {purged} finished jobs")
+        return purged
+
+    def resume(self) -> int:
+        """
+        Queues pending jobs and running jobs left by a stopped process.
+
+        Returns:
+            Number of queued jobs
+        """
+        stale_before = (datetime.now() - timedelta(seconds=self._stale_after)).isoformat()
+        for job in self._job_repo.find_by_status(TranslationJob.RUNNING):
+            if job.updated_at < stale_before:
+                self._job_repo.set_status(job.id, TranslationJob.PENDING, job.error)
+
+        jobs = self._job_repo.find_by_status(TranslationJob.PENDING)
+        for job in jobs:
+            self._queue.put(job.id)
+        if jobs:
+            print(f"[TranslationJobs] Resumed {len(jobs)} pending jobs")
+        return len(jobs)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stops workers after their current job."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def join(self, timeout: float = None) -> bool:
+        """
+        Waits until the queue is empty (jobs waiting for a retry are not counted).
+
+        Returns:
+            True if all queued jobs were processed
+        """
+        done = threading.Event()
+        threading.Thread(target=lambda: (self._queue.join(), done.set()), daemon=True).start()
+        return done.wait(timeout)
+
+    # ==========================================
+    # Processing
+    # ==========================================
+
+    def _enqueue(self, entity_type: str, entity_id: str, notify: str) -> TranslationJob:
+        job = TranslationJob(id=str(uuid.uuid4()), entity_type=entity_type,
+                             entity_id=entity_id, notify=notify)
+        self.start()
+        self._job_repo.create(job)
+        self._queue.put(job.id)
+        return job
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                job_id = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                self._process(job_id)
+            except Exception as e:
+                print(f"[TranslationJobs] Job {job_id} crashed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _process(self, job_id: str) -> None:
+        job = self._job_repo.claim(job_id)
+        if not job:
+            return
+
+        try:
+            if job.entity_type == self.NEWS:
+                self._translate_news(job)
+            elif job.entity_type == self.PRODUCT:
+                self._translate_product(job)
+            self._job_repo.set_status(job.id, TranslationJob.DONE)
+            if time.monotonic() - self._last_purge > self.PURGE_INTERVAL:
+                self.purge()
+        except Exception as e:
+            if job.attempts < self._max_attempts:
+                delay = self._retry_delay * 2 ** (job.attempts - 1)
+                self._job_repo.set_status(job.id, TranslationJob.PENDING, str(e))
+                timer = threading.Timer(delay, self._queue.put, args=(job.id,))
+                timer.daemon = True
+                timer.start()
+                print(f"[TranslationJobs] {job.entity_type} {job.entity_id}: attempt "
+                      f"{job.attempts} failed ({e}), retry in {delay:g}s")
+            else:
+                self._job_repo.set_status(job.id, TranslationJob.FAILED, str(e))
+                print(f"[TranslationJobs] {job.entity_type} {job.entity_id}: failed after "
+                      f"{job.attempts} attempts ({e})")
+                # Subscribers still get the news, in the source language
+                self._notify(job)
+
+    def _translate_news(self, job: TranslationJob) -> None:
+        news = self._news_repo.get_by_id(job.entity_id)
+        if not news:
+            return
+
+        source = {'title': news.title, 'content': news.content,
+                  'category': news.category, 'author': news.author}
+        translations = self._translation_service.translate_news(**source, source_lang='ru', strict=True)
+
+        updated = self._news_repo.set_translations(news.id, translations, source)
+        if updated is None:
+            # Edited meanwhile, the edit queued its own job
+            print(f"[TranslationJobs] news {news.id} changed during translation, result dropped")
+        self._notify(job, updated)
+
+    def _translate_product(self, job: TranslationJob) -> None:
+        product = self._product_repo.get_by_id(job.entity_id)
+        if not product:
+            return
+
+        source = {'name': product.name, 'description': product.description,
+                  'category': product.category}
+        translations = self._translation_service.translate_product(**source, source_lang='ru', strict=True)
+
+        if self._product_repo.set_translations(product.id, translations, source) is None:
+            print(f"[TranslationJobs] product {product.id} changed during translation, result dropped")
+
+    def _notify(self, job: TranslationJob, news=None) -> None:
+        """Sends the publisher event of a news job."""
+        if job.entity_type != self.NEWS or not job.notify:
+            return
+        news = news or self._news_repo.get_by_id(job.entity_id)
+        if not news or not news.is_published:
+            return
+
+        if job.notify == self.NOTIFY_PUBLISH:
+            self._publisher.publish_news(news)
+        elif job.notify == self.NOTIFY_UPDATE:
+            self._publisher.update_news(news)
+
+
+_runner = None
+
+
+def get_translation_job_runner() -> TranslationJobRunner:
+    global _runner
+    if _runner is None:
+        _runner = TranslationJobRunner(retention=Config.TRANSLATION_JOB_RETENTION_DAYS * 24 * 3600)
+    return _runner
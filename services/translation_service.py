@@ -1,24 +1,102 @@
 """
 News Automatic Translation Service
 """
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import partial
+from typing import Dict, Optional, Hashable
 import logging
+import threading
+import time
+
+from config import Config
+from repository.translation_cache_repository import TranslationCacheRepository
 
 logger = logging.getLogger(__name__)
 
+_translation_cache = None
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class TranslationError(Exception):
+    """Raised in strict mode when some translations failed or timed out."""
+
+
+class FakeTranslator:
+    """
+    Offline translator with the GoogleTranslator interface.
+
+    Returns "[target] text" after sleeping `latency` seconds, for development
+    without network access and for benchmarks.
+    """
+
+    def __init__(self, source: str = 'auto', target: str = 'en', latency: float = 0.0):
+        self.source = source
+        self.target = target
+        self.latency = latency
+
+    def translate(self, text: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        return f"[{self.target}] {text}"
+
+
+def get_translation_cache() -> TranslationCacheRepository:
+    """Returns translation cache shared by all TranslationService instances."""
+    global _translation_cache
+    if _translation_cache is None:
+        _translation_cache = TranslationCacheRepository(
+            max_entries=Config.TRANSLATION_CACHE_MAX_ENTRIES
+        )
+    return _translation_cache
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Returns thread pool shared by all TranslationService instances."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=Config.TRANSLATION_WORKERS,
+                                               thread_name_prefix='translate')
+    return _executor
+
 
 class TranslationService:
     """
     Service for automatic text translation.
     Uses deep-translator library for translation.
+
+    Translations are memoized in TranslationCacheRepository, so unchanged
+    fields are never sent to the translator again. Fields and target
+    languages of one news/product are translated concurrently; a call that
+    does not finish within the timeout falls back to the original text.
     """
 
-    def __init__(self):
-        self._translator = None
-        self._init_translator()
+    def __init__(self, cache: TranslationCacheRepository = None,
+                 translator=None, timeout: float = None):
+        """
+        Args:
+            cache: Translation cache (default: shared cache)
+            translator: Translator factory called as translator(source=..., target=...),
+                        returning an object with translate(text)
+                        (default: chosen by Config.TRANSLATOR_BACKEND)
+            timeout: Seconds to wait for one translate_news/translate_product
+                     call (default: Config.TRANSLATION_TIMEOUT)
+        """
+        self._translator = translator
+        self._cache = cache or get_translation_cache()
+        self._timeout = timeout if timeout is not None else Config.TRANSLATION_TIMEOUT
+        if self._translator is None:
+            self._init_translator()
 
     def _init_translator(self):
         """Initializes translator"""
+        if Config.TRANSLATOR_BACKEND == 'fake':
+            self._translator = partial(FakeTranslator, latency=Config.FAKE_TRANSLATOR_LATENCY)
+            print("✓ Translation service uses offline fake translator")
+            return
+
         try:
             from deep_translator import GoogleTranslator
             self._translator = GoogleTranslator
@@ -40,41 +118,87 @@ class TranslationService:
             target_lang: Target language (ru, en, kz)
             
         Returns:
-            Translated text or None if error occurs
+            Translated text, or the original text if an error occurs
         """
+        try:
+            return self._translate_text(text, source_lang, target_lang)
+        except Exception as e:
+            logger.error(f"Translation error: {str(e)}")
+            return text
+
+    def _translate_text(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Translates text, raising on errors instead of falling back."""
         if not text or not text.strip():
             return text
 
         if source_lang == target_lang:
             return text
 
+        cached = self._cache.get(text, source_lang, target_lang)
+        if cached is not None:
+            return cached
+
         if not self._translator:
-            logger.warning("Translator not available")
-            return text
+            raise TranslationError("Translator not available")
 
-        try:
-            # Language mapping for Google Translator
-            lang_map = {
-                'ru': 'ru',
-                'en': 'en',
-                'kz': 'kk'  # Kazakh language in Google Translate
-            }
+        # Language mapping for Google Translator
+        lang_map = {
+            'ru': 'ru',
+            'en': 'en',
+            'kz': 'kk'  # Kazakh language in Google Translate
+        }
 
-            source = lang_map.get(source_lang, source_lang)
-            target = lang_map.get(target_lang, target_lang)
+        source = lang_map.get(source_lang, source_lang)
+        target = lang_map.get(target_lang, target_lang)
 
-            translator = self._translator(source=source, target=target)
-            translated = translator.translate(text)
-            
-            logger.info(f"Translated text from {source_lang} to {target_lang}")
-            return translated
+        translator = self._translator(source=source, target=target)
+        translated = translator.translate(text)
+        if not translated:
+            raise TranslationError(f"Empty translation to {target_lang}")
 
-        except Exception as e:
-            logger.error(f"Translation error: {str(e)}")
-            return text
+        self._cache.put(text, source_lang, target_lang, translated)
+        logger.info(f"Translated text from {source_lang} to {target_lang}")
+        return translated
+
+    def _translate_many(self, jobs: Dict[Hashable, str], source_lang: str,
+                        targets: Dict[Hashable, str], strict: bool = False) -> Dict[Hashable, Optional[str]]:
+        """
+        Translates several texts concurrently.
+
+        Args:
+            jobs: {key: text}
+            source_lang: Source language
+            targets: {key: target language}
+            strict: Raise TranslationError if any call failed or timed out
+
+        Returns:
+            {key: translated text}, None for calls that failed or timed out.
+            A timed-out call keeps running and still fills the cache.
+        """
+        executor = _get_executor()
+        futures = {key: executor.submit(self._translate_text, text, source_lang, targets[key])
+                   for key, text in jobs.items()}
+
+        deadline = time.monotonic() + self._timeout
+        results = {}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                logger.warning(f"Translation to {targets[key]} timed out after {self._timeout}s")
+                results[key] = None
+            except Exception as e:
+                logger.error(f"Translation error: {str(e)}")
+                results[key] = None
+
+        if strict:
+            failed = [key for key, value in results.items() if value is None]
+            if failed:
+                raise TranslationError(f"{len(failed)} of {len(results)} translations failed")
+        return results
 
     def translate_news(self, title: str, content: str, category: str, author: str, 
-                      source_lang: str = 'ru') -> Dict[str, Dict[str, str]]:
+                      source_lang: str = 'ru', strict: bool = False) -> Dict[str, Dict[str, str]]:
         """
         Translates all news fields to other languages.
         
@@ -84,6 +208,8 @@ class TranslationService:
             category: News category
             author: News author
             source_lang: Source language (default ru)
+            strict: Raise TranslationError instead of keeping original text
+                    for failed fields
             
         Returns:
             Dictionary with translations: {lang: {title, content, category, author}}
@@ -113,16 +239,27 @@ class TranslationService:
             }
         }
 
+        # All fields of all target languages are translated concurrently
+        jobs, targets = {}, {}
+        for target_lang in target_languages:
+            fields = {'title': title, 'content': content}
+            if category not in category_translations.get(target_lang, {}):
+                fields['category'] = category
+            for field, text in fields.items():
+                jobs[(target_lang, field)] = text
+                targets[(target_lang, field)] = target_lang
+        results = self._translate_many(jobs, source_lang, targets, strict)
+
         for target_lang in target_languages:
             try:
-                translated_title = self.translate_text(title, source_lang, target_lang)
-                translated_content = self.translate_text(content, source_lang, target_lang)
+                translated_title = results[(target_lang, 'title')]
+                translated_content = results[(target_lang, 'content')]
                 
                 # Use dictionary for category if available, otherwise translate
                 if category in category_translations.get(target_lang, {}):
                     translated_category = category_translations[target_lang][category]
                 else:
-                    translated_category = self.translate_text(category, source_lang, target_lang)
+                    translated_category = results[(target_lang, 'category')]
                 
                 # Usually we don't translate author, but can be done if needed
                 translated_author = author  # Keep author unchanged
@@ -147,7 +284,7 @@ class TranslationService:
         return translations
 
     def translate_product(self, name: str, description: str, category: str,
-                         source_lang: str = 'ru') -> Dict[str, Dict[str, str]]:
+                         source_lang: str = 'ru', strict: bool = False) -> Dict[str, Dict[str, str]]:
         """
         Translates all product fields to other languages.
         
@@ -156,6 +293,8 @@ class TranslationService:
             description: Product description
             category: Product category
             source_lang: Source language (default ru)
+            strict: Raise TranslationError instead of keeping original text
+                    for failed fields
             
         Returns:
             Dictionary with translations: {lang: {name, description, category}}
@@ -185,16 +324,27 @@ class TranslationService:
             }
         }
 
+        # All fields of all target languages are translated concurrently
+        jobs, targets = {}, {}
+        for target_lang in target_languages:
+            fields = {'name': name, 'description': description}
+            if category not in category_translations.get(target_lang, {}):
+                fields['category'] = category
+            for field, text in fields.items():
+                jobs[(target_lang, field)] = text
+                targets[(target_lang, field)] = target_lang
+        results = self._translate_many(jobs, source_lang, targets, strict)
+
         for target_lang in target_languages:
             try:
-                translated_name = self.translate_text(name, source_lang, target_lang)
-                translated_description = self.translate_text(description, source_lang, target_lang)
+                translated_name = results[(target_lang, 'name')]
+                translated_description = results[(target_lang, 'description')]
                 
                 # Use dictionary for category if available, otherwise translate
                 if category in category_translations.get(target_lang, {}):
                     translated_category = category_translations[target_lang][category]
                 else:
-                    translated_category = self.translate_text(category, source_lang, target_lang)
+                    translated_category = results[(target_lang, 'category')]
 
                 translations[target_lang] = {
                     'name': translated_name or name,
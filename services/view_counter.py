@@ -0,0 +1,102 @@
+"""
+Write-behind News View Counter
+
+Views are counted in memory and written to storage in batches,
+so a news page view does not rewrite the news storage.
+"""
+import atexit
+import threading
+from typing import Dict
+
+from repository.news_repository import NewsRepository
+
+
+class ViewCounter:
+    """
+    Aggregates news view increments and flushes them periodically.
+
+    Pending deltas are flushed every flush_interval seconds and at
+    process shutdown. Flushing adds deltas to the stored counters under the
+    repository lock, so increments from several worker processes add up.
+    """
+
+    def __init__(self, news_repository: NewsRepository = None, flush_interval: float = 5.0):
+        self._repo = news_repository or NewsRepository()
+        self._flush_interval = flush_interval
+        self._pending: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        atexit.register(self.stop)
+
+    def increment(self, news_id: str, delta: int = 1) -> None:
+        """Registers views of news."""
+        with self._lock:
+            self._pending[news_id] = self._pending.get(news_id, 0) + delta
+        self._ensure_started()
+
+    def get_pending(self, news_id: str = None):
+        """
+        Returns views not yet written to storage.
+
+        Args:
+            news_id: News ID, or None for all pending counters
+
+        Returns:
+            Number of pending views for news_id, or dict {news_id: views}
+        """
+        with self._lock:
+            if news_id is not None:
+                return self._pending.get(news_id, 0)
+            return dict(self._pending)
+
+    def flush(self) -> int:
+        """
+        Writes pending views to storage.
+
+        Returns:
+            Number of flushed views
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        try:
+            self._repo.add_views(pending)
+        except Exception as e:
+            # Keep deltas for the next attempt
+            with self._lock:
+                for news_id, delta in pending.items():
+                    self._pending[news_id] = self._pending.get(news_id, 0) + delta
+            print(f"[ViewCounter] Flush error: {e}")
+            return 0
+        return sum(pending.values())
+
+    def _ensure_started(self) -> None:
+        """Starts background flush thread on first use."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._flush_interval):
+            self.flush()
+
+    def stop(self) -> None:
+        """Stops background thread and flushes remaining views."""
+        self._stop_event.set()
+        self.flush()
+
+
+_view_counter = None
+
+
+def get_view_counter() -> ViewCounter:
+    global _view_counter
+    if _view_counter is None:
+        _view_counter = ViewCounter()
+    return _view_counter
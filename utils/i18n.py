@@ -1,55 +1,97 @@
 """
 Internationalization System
 Supported languages: ru, en, kz
+
+Translation files are parsed once per language and flattened into
+{"section.key": "text"}. A file is re-read only when its mtime or size
+changes (checked at most every RELOAD_CHECK_INTERVAL seconds).
 """
 import json
 import os
+import time
 
 TRANSLATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'translations')
 
 SUPPORTED_LANGUAGES = ['ru', 'en', 'kz']
 DEFAULT_LANGUAGE = 'ru'
 
+RELOAD_CHECK_INTERVAL = 1.0
 
-def load_translations(lang):
+# lang -> {'signature', 'checked_at', 'nested', 'flat', 'templates'}
+_catalogs = {}
+
+
+def _file_signature(file_path):
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _flatten(value, prefix, flat):
+    for k, v in value.items():
+        if isinstance(v, dict):
+            _flatten(v, f'{prefix}{k}.', flat)
+        elif isinstance(v, (str, int, float)):
+            flat[f'{prefix}{k}'] = str(v)
+
+
+def _get_catalog(lang):
     if lang not in SUPPORTED_LANGUAGES:
         lang = DEFAULT_LANGUAGE
-    
+
+    catalog = _catalogs.get(lang)
+    now = time.monotonic()
+    if catalog is not None and now - catalog['checked_at'] < RELOAD_CHECK_INTERVAL:
+        return catalog
+
     file_path = os.path.join(TRANSLATIONS_DIR, f'{lang}.json')
-    
+    signature = _file_signature(file_path)
+    if catalog is not None and catalog['signature'] == signature:
+        catalog['checked_at'] = now
+        return catalog
+
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            nested = json.load(f)
     except FileNotFoundError:
-        return {}
+        nested = {}
+
+    flat = {}
+    _flatten(nested, '', flat)
+    catalog = {
+        'signature': signature,
+        'checked_at': now,
+        'nested': nested,
+        'flat': flat,
+        # Only values with braces need str.format, the rest are returned as is
+        'templates': {k for k, v in flat.items() if '{' in v or '}' in v},
+    }
+    _catalogs[lang] = catalog
+    return catalog
+
+
+def load_translations(lang):
+    """Returns parsed translations of the language (shared, do not modify)."""
+    return _get_catalog(lang)['nested']
 
 
 def get_translation(key, lang=DEFAULT_LANGUAGE, **kwargs):
     if not key:
         return ''
-    
-    translations = load_translations(lang)
-    
-    if not translations:
+
+    catalog = _get_catalog(lang)
+    value = catalog['flat'].get(key)
+    if value is None:
         return key
 
-    keys = key.split('.')
-    value = translations
-    
-    try:
-        for k in keys:
-            if not isinstance(value, dict):
-                return key
-            value = value[k]
-        
-        if kwargs and isinstance(value, str):
+    if kwargs and key in catalog['templates']:
+        try:
             return value.format(**kwargs)
-        if isinstance(value, (str, int, float)):
-            return str(value)
-        
-        return key
-    except (KeyError, TypeError, AttributeError):
-        return key
+        except (KeyError, TypeError, AttributeError):
+            return key
+    return value
 
 
 def get_language_name(lang_code):
@@ -62,14 +104,13 @@ def get_language_name(lang_code):
 
 
 def get_days_of_week(lang=DEFAULT_LANGUAGE):
-    translations = load_translations(lang)
-    schedule = translations.get('schedule', {})
-    
+    flat = _get_catalog(lang)['flat']
+
     return {
-        1: schedule.get('monday', 'Monday'),
-        2: schedule.get('tuesday', 'Tuesday'),
-        3: schedule.get('wednesday', 'Wednesday'),
-        4: schedule.get('thursday', 'Thursday'),
-        5: schedule.get('friday', 'Friday'),
-        6: schedule.get('saturday', 'Saturday')
+        1: flat.get('schedule.monday', 'Monday'),
+        2: flat.get('schedule.tuesday', 'Tuesday'),
+        3: flat.get('schedule.wednesday', 'Wednesday'),
+        4: flat.get('schedule.thursday', 'Thursday'),
+        5: flat.get('schedule.friday', 'Friday'),
+        6: flat.get('schedule.saturday', 'Saturday')
     }